@@ -33,6 +33,8 @@ DEFAULTS: dict[str, dict] = {
         },
         "bluetooth": {
             "max_concurrent_connections": 3,
+            "connection_timeout": 30.0,
+            "history_size": 256,
             "test_mode": False,
             "adapter": None,
         },
@@ -118,6 +120,8 @@ DEFAULTS: dict[str, dict] = {
             "health_check_interval": 60.0,
             "message_queue_size": 1000,
             "message_retry_limit": 3,
+            "max_in_flight": 256,
+            "flush_delay_ms": 0,
         },
         "api": {
             "enabled": True,
@@ -53,6 +53,8 @@ class BatteryHawkCore:
         # Initialize all required components
         self.connection_pool = BLEConnectionPool(config_manager)
         self.discovery_service = BLEDiscoveryService(config_manager)
+        # Connect through scanned device objects to skip a fresh scan per connect
+        self.connection_pool.device_lookup = self.discovery_service.get_ble_device
         self.device_factory = DeviceFactory(self.connection_pool)
         self.auto_config_service = AutoConfigurationService(
             config_manager,
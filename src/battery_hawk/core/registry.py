@@ -167,6 +167,28 @@ class DeviceRegistry:
             if device.get("status") == "configured"
         ]
 
+    def count_all(self) -> int:
+        """
+        Count all devices (both discovered and configured).
+
+        Returns:
+            Number of devices in the registry
+        """
+        return len(self.devices)
+
+    def count_configured(self) -> int:
+        """
+        Count configured devices without building a list of them.
+
+        Returns:
+            Number of configured devices
+        """
+        return sum(
+            1
+            for device in self.devices.values()
+            if device.get("status") == "configured"
+        )
+
     def get_devices_by_vehicle(self, vehicle_id: str) -> list[dict[str, Any]]:
         """
         Get all devices associated with a vehicle.
@@ -241,6 +241,9 @@ class DeviceStateManager:
 
         # Device states storage
         self._states: dict[str, DeviceState] = {}
+        # Vehicle ID -> MAC addresses of its associated devices, kept as an
+        # insertion-ordered set (dict keys) so lookups return a stable order
+        self._vehicle_index: dict[str, dict[str, None]] = {}
         self._lock = asyncio.Lock()
 
         # State change observers
@@ -290,6 +293,7 @@ class DeviceStateManager:
 
             old_state = self._states[mac_address]
             del self._states[mac_address]
+            self._unindex_vehicle(mac_address, old_state.vehicle_id)
             self.logger.debug("Unregistered device: %s", mac_address)
 
             # Notify observers of device removal
@@ -444,6 +448,11 @@ class DeviceStateManager:
                 return False
 
             old_state = self._states[mac_address]
+            # Re-associating with the same vehicle keeps the device's position
+            if old_state.vehicle_id != vehicle_id:
+                self._unindex_vehicle(mac_address, old_state.vehicle_id)
+                if vehicle_id is not None:
+                    self._vehicle_index.setdefault(vehicle_id, {})[mac_address] = None
             self._states[mac_address].set_vehicle_association(vehicle_id)
 
             # Notify observers of vehicle association change
@@ -455,6 +464,16 @@ class DeviceStateManager:
             )
             return True
 
+    def _unindex_vehicle(self, mac_address: str, vehicle_id: str | None) -> None:
+        """Remove a device from the vehicle index entry of its current vehicle."""
+        if vehicle_id is None:
+            return
+        macs = self._vehicle_index.get(vehicle_id)
+        if macs is not None:
+            macs.pop(mac_address, None)
+            if not macs:
+                del self._vehicle_index[vehicle_id]
+
     def get_device_state(self, mac_address: str) -> DeviceState | None:
         """
         Get device state by MAC address.
@@ -500,9 +519,7 @@ class DeviceStateManager:
         Returns:
             List of device states associated with the vehicle
         """
-        return [
-            state for state in self._states.values() if state.vehicle_id == vehicle_id
-        ]
+        return [self._states[mac] for mac in self._vehicle_index.get(vehicle_id, ())]
 
     def get_connected_devices(self) -> list[DeviceState]:
         """
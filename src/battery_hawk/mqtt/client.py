@@ -4,34 +4,125 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import functools
+import heapq
 import json
 import logging
+import math
 import ssl
 import time
 from collections import deque
 from dataclasses import dataclass
-from datetime import datetime, timezone
 from enum import Enum
 from typing import TYPE_CHECKING, Any
 
-from battery_hawk_driver.base.protocol import DeviceStatus
-
-if TYPE_CHECKING:
-    from collections.abc import Callable
-
 from aiomqtt import Client, MqttError
 
-from battery_hawk_driver.base.protocol import BatteryInfo
+from battery_hawk_driver.base.protocol import DeviceStatus
+
+from .topics import MQTTTopics, TopicMatcher
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
     from battery_hawk.config.config_manager import ConfigManager
     from battery_hawk.core.engine import BatteryHawkCore
     from battery_hawk.core.state import DeviceState
-from .topics import MQTTTopics
+    from battery_hawk_driver.base.protocol import BatteryInfo
 
 # Constants
 MAX_PORT_NUMBER = 65535
 
+# Top-level vehicle summary fields left out of the change signature:
+# last_updated changes on every build and devices are fingerprinted separately
+_SUMMARY_VOLATILE_FIELDS = frozenset({"last_updated", "devices"})
+
+# QoS for high-frequency telemetry (readings, summaries, periodic status) that
+# is superseded by the next update and does not need broker acknowledgement
+TELEMETRY_QOS = 0
+MAX_CACHED_TOPICS = 4096
+
+# Window (seconds) over which vehicle summary updates from bursts of device
+# events are coalesced into a single publish
+SUMMARY_DEBOUNCE_DELAY = 0.25
+
+# Exception types treated as a lost broker connection
+_CONN_ERR_TYPES = (MqttError, OSError, ConnectionError, asyncio.TimeoutError)
+
+# Reading fields copied from the nested snapshot into flattened status payloads
+_FLAT_READING_FIELDS = (
+    "voltage",
+    "current",
+    "temperature",
+    "state_of_charge",
+    "capacity",
+    "cycles",
+    "power",
+)
+
+# Reading attributes exposed by _ReadingView, in field order
+_READING_VIEW_FIELDS = (
+    "voltage",
+    "current",
+    "temperature",
+    "state_of_charge",
+    "capacity",
+    "cycles",
+    "timestamp",
+    "extra",
+)
+
+
+class _TimestampCache:
+    """Last formatted UTC timestamp, reused for the rest of its second."""
+
+    __slots__ = ("epoch", "iso")
+
+    def __init__(self) -> None:
+        self.epoch = -1
+        self.iso = ""
+
+
+_ts_cache = _TimestampCache()
+
+
+def _now_iso() -> str:
+    """
+    Return the current UTC time as a second-granularity ISO-8601 string.
+
+    The string is only reformatted when the wall-clock second changes, so
+    bursts of publishes share a single formatted timestamp.
+    """
+    sec = int(time.time())
+    if sec != _ts_cache.epoch:
+        _ts_cache.iso = time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime(sec))
+        _ts_cache.epoch = sec
+    return _ts_cache.iso
+
+
+@functools.lru_cache(maxsize=1024)
+def _device_reading_topic(device_id: str) -> str:
+    """Return the (prefix-relative) reading topic for a device."""
+    return f"device/{device_id}/reading"
+
+
+@functools.lru_cache(maxsize=1024)
+def _device_status_topic(device_id: str) -> str:
+    """Return the (prefix-relative) status topic for a device."""
+    return f"device/{device_id}/status"
+
+
+@functools.lru_cache(maxsize=1024)
+def _vehicle_summary_topic(vehicle_id: str) -> str:
+    """Return the (prefix-relative) summary topic for a vehicle."""
+    return f"vehicle/{vehicle_id}/summary"
+
+
+@functools.lru_cache(maxsize=1024)
+def _vehicle_device_associated_topic(vehicle_id: str) -> str:
+    """Return the (prefix-relative) device association topic for a vehicle."""
+    return f"vehicle/{vehicle_id}/device_associated"
+
 
 class ConnectionState(Enum):
     """MQTT connection states."""
@@ -43,15 +134,38 @@ class ConnectionState(Enum):
     FAILED = "failed"
 
 
-@dataclass
+@dataclass(slots=True)
+class _ReadingView:
+    """Uniform attribute access over a BatteryInfo or a plain reading dict."""
+
+    voltage: Any
+    current: Any
+    temperature: Any
+    state_of_charge: Any
+    capacity: Any
+    cycles: Any
+    timestamp: Any
+    extra: Any
+
+    @classmethod
+    def of(cls, reading: BatteryInfo | dict[str, Any]) -> _ReadingView:
+        """Build a view, reading missing fields as None."""
+        if isinstance(reading, dict):
+            return cls(*map(reading.get, _READING_VIEW_FIELDS))
+        return cls(*(getattr(reading, name, None) for name in _READING_VIEW_FIELDS))
+
+
+@dataclass(slots=True)
 class QueuedMessage:
     """Represents a queued MQTT message."""
 
     topic: str
-    payload: dict[str, Any] | str
+    payload: dict[str, Any] | str | bytes
     retain: bool
     timestamp: float
     retry_count: int = 0
+    encoded: bytes | None = None
+    qos: int | None = None
 
 
 @dataclass
@@ -67,6 +181,24 @@ class ReconnectionConfig:
     health_check_interval: float = 60.0
     message_queue_size: int = 1000
     message_retry_limit: int = 3
+    max_in_flight: int = 256
+    flush_delay_ms: float = 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class ConnectionConfig:
+    """Snapshot of the broker connection settings, rebuilt on config changes."""
+
+    broker: str = ""
+    port: int = 1883
+    keepalive: int = 60
+    username: str | None = None
+    password: str | None = None
+    tls: bool = False
+    ca_cert: str | None = None
+    cert_file: str | None = None
+    key_file: str | None = None
+    qos: int = 1
 
 
 class MQTTConnectionError(Exception):
@@ -79,6 +211,11 @@ class MQTTConnectionError(Exception):
         self.port = port
 
 
+# Errors the publish path is expected to raise; event handlers log these and
+# let anything else propagate to the dispatcher's own error handling
+_HANDLER_ERRORS = (MQTTConnectionError, MqttError, OSError, ValueError, AttributeError)
+
+
 class MQTTInterface:
     """
     MQTT interface for Battery Hawk.
@@ -98,18 +235,27 @@ class MQTTInterface:
         self.logger = logging.getLogger("battery_hawk.mqtt")
         self._client: Client | None = None
         self._connection_state = ConnectionState.DISCONNECTED
-        self._message_handlers: dict[str, Callable[[str, str], None]] = {}
+        self._message_handlers = TopicMatcher()
 
         # Get initial configuration
         self._mqtt_config = self._get_mqtt_config()
         self._reconnection_config = self._get_reconnection_config()
+        self._conn_cfg = self._get_connection_config()
 
         # Initialize topic helper with configured prefix
         topic_prefix = self._mqtt_config.get("topic_prefix", "battery_hawk")
         self.topics = MQTTTopics(prefix=topic_prefix)
 
+        # Prefixed topics already built by _get_topic, reset on config changes
+        self._full_topics: dict[str, str] = {}
+
+        # Hash of the last retained payload delivered per topic this session,
+        # so identical retained messages are not re-sent to the broker
+        self._last_retained: dict[str, int] = {}
+
         # Connection management
         self._reconnect_task: asyncio.Task | None = None
+        self._reconnect_lock = asyncio.Lock()
         self._health_check_task: asyncio.Task | None = None
         self._message_processor_task: asyncio.Task | None = None
         self._shutdown_event = asyncio.Event()
@@ -120,20 +266,33 @@ class MQTTInterface:
         )
         self._queue_lock = asyncio.Lock()
 
-        # Connection tracking
+        # Messages waiting out a retry backoff, ordered by (send time, sequence)
+        self._retry_heap: list[tuple[float, int, QueuedMessage]] = []
+        self._msg_seq = 0
+
+        # Single timer that wakes the message processor when the earliest
+        # retry on the heap becomes due
+        self._retry_wakeup = asyncio.Event()
+        self._retry_timer: asyncio.TimerHandle | None = None
+        self._next_flush_deadline = math.inf
+
+        # Cap on concurrent in-flight publishes to the broker
+        self._publish_sem = asyncio.Semaphore(self._reconnection_config.max_in_flight)
+
+        # Connection tracking. Internal timers use the monotonic clock (the same
+        # clock as the event loop's time()); only the attempt timestamp exposed
+        # through stats stays wall-clock.
         self._last_connection_attempt = 0.0
         self._consecutive_failures = 0
         self._connection_start_time = 0.0
 
-        # Statistics
-        self._stats = {
-            "total_connections": 0,
-            "total_disconnections": 0,
-            "total_reconnections": 0,
-            "messages_published": 0,
-            "messages_queued": 0,
-            "messages_failed": 0,
-        }
+        # Statistics (plain int counters; the stats dict is built on demand)
+        self._n_connections = 0
+        self._n_disconnections = 0
+        self._n_reconnections = 0
+        self._n_published = 0
+        self._n_queued = 0
+        self._n_failed = 0
 
         # Register for config changes
         self.config_manager.register_listener(self._on_config_change)
@@ -193,6 +352,25 @@ class MQTTInterface:
             health_check_interval=mqtt_config.get("health_check_interval", 60.0),
             message_queue_size=mqtt_config.get("message_queue_size", 1000),
             message_retry_limit=mqtt_config.get("message_retry_limit", 3),
+            max_in_flight=mqtt_config.get("max_in_flight", 256),
+            flush_delay_ms=mqtt_config.get("flush_delay_ms", 0.0),
+        )
+
+    def _get_connection_config(self) -> ConnectionConfig:
+        """Build the broker connection settings snapshot from the MQTT config."""
+        mqtt_config = self._mqtt_config
+
+        return ConnectionConfig(
+            broker=mqtt_config.get("broker", ""),
+            port=mqtt_config.get("port", 1883),
+            keepalive=mqtt_config.get("keepalive", 60),
+            username=mqtt_config.get("username"),
+            password=mqtt_config.get("password"),
+            tls=mqtt_config.get("tls", False),
+            ca_cert=mqtt_config.get("ca_cert"),
+            cert_file=mqtt_config.get("cert_file"),
+            key_file=mqtt_config.get("key_file"),
+            qos=mqtt_config.get("qos", 1),
         )
 
     def _on_config_change(self, section: str, _config: dict[str, Any]) -> None:
@@ -203,6 +381,9 @@ class MQTTInterface:
             try:
                 self._mqtt_config = self._get_mqtt_config()
                 self._reconnection_config = self._get_reconnection_config()
+                self._conn_cfg = self._get_connection_config()
+                self._full_topics.clear()
+                self._last_retained.clear()
 
                 # Check if MQTT-relevant config changed
                 mqtt_fields = [
@@ -232,6 +413,14 @@ class MQTTInterface:
                     )
                     self._message_queue = new_queue
 
+                if (
+                    old_reconnection_config.max_in_flight
+                    != self._reconnection_config.max_in_flight
+                ):
+                    self._publish_sem = asyncio.Semaphore(
+                        self._reconnection_config.max_in_flight,
+                    )
+
                 if (
                     config_changed
                     and self._connection_state == ConnectionState.CONNECTED
@@ -268,38 +457,34 @@ class MQTTInterface:
 
     def _prepare_client_kwargs(self) -> dict[str, Any]:
         """Prepare connection parameters for MQTT client."""
-        broker = self._mqtt_config["broker"]
-        port = self._mqtt_config["port"]
+        cfg = self._conn_cfg
 
         client_kwargs = {
-            "hostname": broker,
-            "port": port,
-            "keepalive": self._mqtt_config.get("keepalive", 60),
+            "hostname": cfg.broker,
+            "port": cfg.port,
+            "keepalive": cfg.keepalive,
+            # Match paho's QoS 1/2 inflight window to our publish concurrency,
+            # otherwise its small default caps throughput on slow links
+            "max_inflight_messages": self._reconnection_config.max_in_flight,
             # Note: aiomqtt doesn't accept timeout in constructor
             # Timeout is handled via asyncio.wait_for() in connection logic
         }
 
         # Add authentication if configured
-        username = self._mqtt_config.get("username")
-        password = self._mqtt_config.get("password")
-        if username:
-            client_kwargs["username"] = username
-            if password:
-                client_kwargs["password"] = password
+        if cfg.username:
+            client_kwargs["username"] = cfg.username
+            if cfg.password:
+                client_kwargs["password"] = cfg.password
 
         # Add TLS if configured
-        if self._mqtt_config.get("tls", False):
+        if cfg.tls:
             ssl_context = ssl.create_default_context()
 
             # Configure custom certificates if provided
-            ca_cert = self._mqtt_config.get("ca_cert")
-            cert_file = self._mqtt_config.get("cert_file")
-            key_file = self._mqtt_config.get("key_file")
-
-            if ca_cert:
-                ssl_context.load_verify_locations(ca_cert)
-            if cert_file and key_file:
-                ssl_context.load_cert_chain(cert_file, key_file)
+            if cfg.ca_cert:
+                ssl_context.load_verify_locations(cfg.ca_cert)
+            if cfg.cert_file and cfg.key_file:
+                ssl_context.load_cert_chain(cfg.cert_file, cfg.key_file)
 
             client_kwargs["tls_context"] = ssl_context
 
@@ -307,15 +492,15 @@ class MQTTInterface:
         # Note: This will log sensitive information (username/password). Ensure DEBUG level is used only in safe environments.
         self.logger.debug(
             "MQTT connection parameters: hostname=%s, port=%s, keepalive=%s, username=%s, password=%s, tls=%s, ca_cert=%s, cert_file=%s, key_file=%s",
-            broker,
-            port,
-            self._mqtt_config.get("keepalive", 60),
-            username,
-            password,
-            self._mqtt_config.get("tls", False),
-            self._mqtt_config.get("ca_cert"),
-            self._mqtt_config.get("cert_file"),
-            self._mqtt_config.get("key_file"),
+            cfg.broker,
+            cfg.port,
+            cfg.keepalive,
+            cfg.username,
+            cfg.password,
+            cfg.tls,
+            cfg.ca_cert,
+            cfg.cert_file,
+            cfg.key_file,
         )
 
         return client_kwargs
@@ -332,10 +517,12 @@ class MQTTInterface:
                 timeout=self._reconnection_config.connection_timeout,
             )
 
-            # Connection successful
+            # Connection successful; a new session starts with no retained
+            # payloads assumed to be on the broker
+            self._last_retained.clear()
             self._connection_state = ConnectionState.CONNECTED
             self._consecutive_failures = 0
-            self._stats["total_connections"] += 1
+            self._n_connections += 1
 
             broker = self._mqtt_config["broker"]
             port = self._mqtt_config["port"]
@@ -398,7 +585,7 @@ class MQTTInterface:
     async def _connect_with_retry(self) -> None:
         """Connect to MQTT broker with retry logic."""
         self._connection_state = ConnectionState.CONNECTING
-        self._connection_start_time = time.time()
+        self._connection_start_time = time.monotonic()
 
         broker = self._mqtt_config["broker"]
         port = self._mqtt_config["port"]
@@ -464,7 +651,7 @@ class MQTTInterface:
         delay = min(delay, max_delay)
 
         # Add jitter to avoid thundering herd
-        jitter = delay * jitter_factor * (0.5 - time.time() % 1)
+        jitter = delay * jitter_factor * (0.5 - time.monotonic() % 1)
         delay += jitter
 
         return max(delay, 0.1)  # Minimum 100ms delay
@@ -508,14 +695,15 @@ class MQTTInterface:
         """Process queued messages when connection is available."""
         while not self._shutdown_event.is_set():
             try:
-                if (
-                    self._connection_state == ConnectionState.CONNECTED
-                    and self._message_queue
+                if self._connection_state == ConnectionState.CONNECTED and (
+                    self._message_queue or self._retry_heap
                 ):
                     await self._process_message_queue()
 
-                # Check every 5 seconds
-                await asyncio.sleep(5.0)
+                # Wait for the next retry to fall due, polling every 5 seconds
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(self._retry_wakeup.wait(), timeout=5.0)
+                self._retry_wakeup.clear()
 
             except asyncio.CancelledError:  # noqa: PERF203
                 break
@@ -532,13 +720,14 @@ class MQTTInterface:
 
         # Signal shutdown to background tasks
         self._shutdown_event.set()
+        self._cancel_retry_timer()
 
         # Update connection state
         old_state = self._connection_state
         self._connection_state = ConnectionState.DISCONNECTED
 
         if old_state == ConnectionState.CONNECTED:
-            self._stats["total_disconnections"] += 1
+            self._n_disconnections += 1
 
         # Cancel and wait for background tasks
         tasks_to_cancel = [
@@ -568,27 +757,27 @@ class MQTTInterface:
         self.logger.info("Disconnected from MQTT broker")
 
     async def _initiate_reconnection(self) -> None:
-        """Initiate reconnection process."""
-        if self._connection_state == ConnectionState.RECONNECTING:
-            self.logger.debug("Reconnection already in progress")
-            return
+        """
+        Initiate reconnection process.
 
-        if self._shutdown_event.is_set():
-            self.logger.debug("Shutdown in progress, skipping reconnection")
-            return
+        Concurrent callers (publish failures, health checks, config changes) are
+        serialized on a lock so that only a single reconnection loop runs at a time.
+        """
+        async with self._reconnect_lock:
+            if self._reconnect_task and not self._reconnect_task.done():
+                self.logger.debug("Reconnection already in progress")
+                return
 
-        self.logger.info("Initiating MQTT reconnection")
-        self._connection_state = ConnectionState.RECONNECTING
-        self._stats["total_reconnections"] += 1
+            if self._shutdown_event.is_set():
+                self.logger.debug("Shutdown in progress, skipping reconnection")
+                return
 
-        # Cancel existing reconnect task if any
-        if self._reconnect_task and not self._reconnect_task.done():
-            self._reconnect_task.cancel()
-            with contextlib.suppress(asyncio.CancelledError):
-                await self._reconnect_task
+            self.logger.info("Initiating MQTT reconnection")
+            self._connection_state = ConnectionState.RECONNECTING
+            self._n_reconnections += 1
 
-        # Start new reconnection task
-        self._reconnect_task = asyncio.create_task(self._reconnect_loop())
+            # Start new reconnection task
+            self._reconnect_task = asyncio.create_task(self._reconnect_loop())
 
     async def _reconnect_loop(self) -> None:
         """Reconnection loop with exponential backoff."""
@@ -675,50 +864,97 @@ class MQTTInterface:
     def stats(self) -> dict[str, Any]:
         """Get connection and message statistics."""
         return {
-            **self._stats,
+            "total_connections": self._n_connections,
+            "total_disconnections": self._n_disconnections,
+            "total_reconnections": self._n_reconnections,
+            "messages_published": self._n_published,
+            "messages_queued": self._n_queued,
+            "messages_failed": self._n_failed,
             "connection_state": self._connection_state.value,
             "consecutive_failures": self._consecutive_failures,
-            "queue_size": len(self._message_queue),
+            "queue_size": len(self._message_queue) + len(self._retry_heap),
             "last_connection_attempt": self._last_connection_attempt,
         }
 
     def _get_topic(self, topic: str) -> str:
         """Get full topic with prefix."""
-        prefix = self._mqtt_config.get("topic_prefix", "batteryhawk")
-        return f"{prefix}/{topic}"
+        full_topic = self._full_topics.get(topic)
+        if full_topic is None:
+            if len(self._full_topics) >= MAX_CACHED_TOPICS:
+                self._full_topics.clear()
+            prefix = self._mqtt_config.get("topic_prefix", "batteryhawk")
+            full_topic = self._full_topics[topic] = f"{prefix}/{topic}"
+        return full_topic
 
     async def publish(
         self,
         topic: str,
-        payload: dict[str, Any] | str,
+        payload: dict[str, Any] | str | bytes,
         *,
         retain: bool = False,
+        qos: int | None = None,
     ) -> None:
         """
         Publish message to MQTT topic.
 
         Args:
             topic: Topic to publish to (without prefix).
-            payload: Message payload (dict will be JSON-encoded).
+            payload: Message payload (dict will be JSON-encoded, bytes sent as-is).
             retain: Whether to retain the message.
+            qos: QoS level for this message (defaults to the configured QoS).
 
         Raises:
             MQTTConnectionError: If not connected to broker.
             ValueError: If payload cannot be serialized.
         """
-        # Create queued message
-        queued_msg = QueuedMessage(
-            topic=topic,
-            payload=payload,
-            retain=retain,
-            timestamp=time.time(),
+        await self._send_or_queue(
+            QueuedMessage(
+                topic=topic,
+                payload=payload,
+                retain=retain,
+                timestamp=time.time(),
+                qos=qos,
+            ),
+        )
+
+    async def publish_bytes(
+        self,
+        topic: str,
+        payload: bytes,
+        *,
+        retain: bool = False,
+        qos: int | None = None,
+    ) -> None:
+        """
+        Publish an already-serialized payload to an MQTT topic.
+
+        The bytes are used as the wire payload directly, for callers that
+        encode a payload once and publish it more than once.
+
+        Args:
+            topic: Topic to publish to (without prefix).
+            payload: Encoded message payload.
+            retain: Whether to retain the message.
+            qos: QoS level for this message (defaults to the configured QoS).
+        """
+        await self._send_or_queue(
+            QueuedMessage(
+                topic=topic,
+                payload=payload,
+                retain=retain,
+                timestamp=time.time(),
+                encoded=payload,
+                qos=qos,
+            ),
         )
 
+    async def _send_or_queue(self, queued_msg: QueuedMessage) -> None:
+        """Publish a message now if connected, otherwise queue it."""
         # Try immediate publish if connected
         if self._connection_state == ConnectionState.CONNECTED and self._client:
             try:
                 await self._publish_message(queued_msg)
-                self._stats["messages_published"] += 1
+                self._n_published += 1
             except MQTTConnectionError as e:
                 self.logger.warning("Immediate publish failed: %s", e)
                 # Fall through to queuing
@@ -729,31 +965,99 @@ class MQTTInterface:
         # Queue message for later delivery
         await self._queue_message(queued_msg)
 
+    async def publish_many(
+        self,
+        messages: Iterable[tuple[str, dict[str, Any] | str | bytes, bool]],
+        *,
+        qos: int | None = None,
+    ) -> None:
+        """
+        Publish several messages as one concurrent batch.
+
+        All messages are handed to the broker together (bounded by
+        ``max_in_flight``), so related updates share one event-loop turn
+        instead of awaiting a round trip each. Messages that fail with a
+        connection error, or arrive while disconnected, are queued.
+
+        Args:
+            messages: ``(topic, payload, retain)`` tuples, topics without prefix.
+            qos: QoS level for the batch (defaults to the configured QoS).
+
+        Raises:
+            ValueError: If a payload cannot be serialized (the rest are still sent).
+        """
+        timestamp = time.time()
+        batch = [
+            QueuedMessage(
+                topic=topic,
+                payload=payload,
+                retain=retain,
+                timestamp=timestamp,
+                qos=qos,
+            )
+            for topic, payload, retain in messages
+        ]
+        if not batch:
+            return
+
+        if self._connection_state != ConnectionState.CONNECTED or not self._client:
+            for msg in batch:
+                await self._queue_message(msg)
+            return
+
+        results = await asyncio.gather(
+            *(self._publish_message(msg) for msg in batch),
+            return_exceptions=True,
+        )
+
+        error: BaseException | None = None
+        for msg, result in zip(batch, results, strict=True):
+            if result is None:
+                self._n_published += 1
+            elif isinstance(result, MQTTConnectionError):
+                self.logger.warning("Batched publish failed: %s", result)
+                await self._queue_message(msg)
+            elif error is None:
+                error = result
+
+        if error is not None:
+            raise error
+
     async def _publish_message(self, msg: QueuedMessage) -> None:
         """Publish a single message to MQTT broker."""
         if not self._client:
             raise MQTTConnectionError("No MQTT client available")
 
         full_topic = self._get_topic(msg.topic)
-        qos = self._mqtt_config.get("qos", 1)
+        qos = msg.qos if msg.qos is not None else self._mqtt_config.get("qos", 1)
 
-        # Serialize payload if it's a dict
-        if isinstance(msg.payload, dict):
-            try:
-                message = json.dumps(msg.payload, default=str)
-            except (TypeError, ValueError) as e:
-                raise ValueError(f"Failed to serialize payload: {e}") from e
-        else:
-            message = str(msg.payload)
+        # Serialize once; retries of the same message reuse the encoded bytes
+        if msg.encoded is None:
+            msg.encoded = self._encode_payload(msg.payload)
+        message = msg.encoded
+
+        # The broker already holds this exact retained payload; skip the resend
+        digest = hash(message) if msg.retain else None
+        if digest is not None and self._last_retained.get(msg.topic) == digest:
+            return
 
         try:
-            await self._client.publish(full_topic, message, qos=qos, retain=msg.retain)
-            self.logger.debug(
-                "Published message to topic '%s' (QoS %d, retain=%s)",
-                full_topic,
-                qos,
-                msg.retain,
-            )
+            async with self._publish_sem:
+                await self._client.publish(
+                    full_topic,
+                    message,
+                    qos=qos,
+                    retain=msg.retain,
+                )
+            if digest is not None:
+                self._last_retained[msg.topic] = digest
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    "Published message to topic '%s' (QoS %d, retain=%s)",
+                    full_topic,
+                    qos,
+                    msg.retain,
+                )
         except (MqttError, OSError) as e:
             self.logger.warning("Failed to publish to topic '%s': %s", full_topic, e)
             # Check if this is a connection error
@@ -765,20 +1069,38 @@ class MQTTInterface:
                 task.add_done_callback(lambda _: None)
             raise MQTTConnectionError(f"Failed to publish message: {e}") from e
 
+    @staticmethod
+    def _encode_payload(payload: dict[str, Any] | str | bytes) -> bytes:
+        """Encode a message payload to bytes (dicts are JSON-encoded, bytes pass through)."""
+        if isinstance(payload, bytes):
+            return payload
+        if isinstance(payload, dict):
+            try:
+                return json.dumps(payload, default=str).encode("utf-8")
+            except (TypeError, ValueError) as e:
+                raise ValueError(f"Failed to serialize payload: {e}") from e
+        return str(payload).encode("utf-8")
+
     async def _queue_message(self, msg: QueuedMessage) -> None:
         """Queue message for later delivery."""
         async with self._queue_lock:
-            # Check if queue is full
-            if len(self._message_queue) >= self._reconnection_config.message_queue_size:
+            # Check if queue is full (messages waiting on a retry count too)
+            if (
+                len(self._message_queue) + len(self._retry_heap)
+                >= self._reconnection_config.message_queue_size
+            ):
                 # Remove oldest message to make room
-                removed = self._message_queue.popleft()
+                if self._message_queue:
+                    removed = self._message_queue.popleft()
+                else:
+                    _, _, removed = heapq.heappop(self._retry_heap)
                 self.logger.warning(
                     "Message queue full, dropping oldest message to topic '%s'",
                     removed.topic,
                 )
 
             self._message_queue.append(msg)
-            self._stats["messages_queued"] += 1
+            self._n_queued += 1
 
             self.logger.debug(
                 "Queued message to topic '%s' (queue size: %d)",
@@ -786,55 +1108,158 @@ class MQTTInterface:
                 len(self._message_queue),
             )
 
+    def _schedule_retry(self, msg: QueuedMessage) -> None:
+        """Schedule a failed message for another attempt after a backoff delay."""
+        send_at = time.monotonic() + self._calculate_retry_delay(msg.retry_count - 1)
+        heapq.heappush(self._retry_heap, (send_at, self._msg_seq, msg))
+        self._msg_seq += 1
+        self._arm_retry_timer()
+
+    def _arm_retry_timer(self) -> None:
+        """Arm the wake-up timer for the earliest pending retry, if needed."""
+        if not self._retry_heap:
+            return
+
+        deadline = self._retry_heap[0][0]
+        if self._retry_timer is not None:
+            if self._next_flush_deadline <= deadline:
+                return
+            self._retry_timer.cancel()
+
+        self._next_flush_deadline = deadline
+        self._retry_timer = asyncio.get_running_loop().call_later(
+            max(0.0, deadline - time.monotonic()),
+            self._on_retry_due,
+        )
+
+    def _on_retry_due(self) -> None:
+        """Timer callback: wake the message processor for due retries."""
+        self._retry_timer = None
+        self._next_flush_deadline = math.inf
+        self._retry_wakeup.set()
+
+    def _cancel_retry_timer(self) -> None:
+        """Cancel any pending retry wake-up."""
+        if self._retry_timer is not None:
+            self._retry_timer.cancel()
+            self._retry_timer = None
+        self._next_flush_deadline = math.inf
+
+    def _release_due_retries(self) -> None:
+        """Move retries whose backoff has elapsed to the front of the queue."""
+        heap = self._retry_heap
+        if not heap:
+            return
+
+        now = time.monotonic()
+        due: list[QueuedMessage] = []
+        while heap and heap[0][0] <= now:
+            _, _, msg = heapq.heappop(heap)
+            due.append(msg)
+        if due:
+            self._message_queue.extendleft(reversed(due))
+        self._arm_retry_timer()
+
     async def _process_message_queue(self) -> None:
-        """Process queued messages when connection is available."""
+        """
+        Process queued messages when connection is available.
+
+        Messages are drained in batches of up to ``max_in_flight`` and published
+        concurrently, so QoS 1/2 acknowledgements are pipelined instead of paid
+        for one round trip at a time. Messages that fail with a connection error
+        wait out a backoff delay on the retry heap, then re-enter the front of
+        the queue in their original order.
+
+        When ``flush_delay_ms`` is set, the drain lingers that long after the
+        queue empties so messages still arriving in a burst join one more batch
+        instead of trickling out individually.
+        """
         if self._connection_state != ConnectionState.CONNECTED or not self._client:
             return
 
         processed_count = 0
         failed_count = 0
+        retry_limit = self._reconnection_config.message_retry_limit
+
+        flush_delay = self._reconnection_config.flush_delay_ms / 1000
+        while True:
+            stalled = False
+            async with self._queue_lock:
+                self._release_due_retries()
+                while (
+                    self._message_queue
+                    and self._connection_state == ConnectionState.CONNECTED
+                ):
+                    batch_size = min(
+                        self._reconnection_config.max_in_flight,
+                        len(self._message_queue),
+                    )
+                    batch = [self._message_queue.popleft() for _ in range(batch_size)]
+                    results = await asyncio.gather(
+                        *(self._publish_message(msg) for msg in batch),
+                        return_exceptions=True,
+                    )
 
-        async with self._queue_lock:
-            # Process messages in order
-            while (
-                self._message_queue
-                and self._connection_state == ConnectionState.CONNECTED
+                    batch_published = 0
+                    batch_failed = 0
+                    requeue: list[QueuedMessage] = []
+                    for msg, result in zip(batch, results, strict=True):
+                        if result is None:
+                            batch_published += 1
+                        elif isinstance(result, MQTTConnectionError):
+                            # Connection error - requeue message unless out of retries
+                            msg.retry_count += 1
+                            if msg.retry_count <= retry_limit:
+                                requeue.append(msg)
+                                self.logger.debug(
+                                    "Scheduled retry for message to topic '%s' (retry %d/%d)",
+                                    msg.topic,
+                                    msg.retry_count,
+                                    retry_limit,
+                                )
+                            else:
+                                self.logger.error(
+                                    "Dropping message to topic '%s' after %d retries",
+                                    msg.topic,
+                                    msg.retry_count,
+                                    exc_info=result,
+                                )
+                                batch_failed += 1
+                        elif isinstance(result, ValueError):
+                            # Serialization error - drop message
+                            self.logger.error(
+                                "Dropping message to topic '%s' due to serialization error",
+                                msg.topic,
+                                exc_info=result,
+                            )
+                            batch_failed += 1
+                        else:
+                            raise result
+
+                    processed_count += batch_published
+                    failed_count += batch_failed
+                    self._n_published += batch_published
+                    self._n_failed += batch_failed
+
+                    if requeue:
+                        # Hold failed messages back for a backoff delay and stop
+                        # until the connection recovers
+                        for msg in requeue:
+                            self._schedule_retry(msg)
+                        stalled = True
+                        break
+
+            if (
+                stalled
+                or flush_delay <= 0
+                or self._connection_state != ConnectionState.CONNECTED
             ):
-                msg = self._message_queue.popleft()
-
-                try:
-                    await self._publish_message(msg)
-                    processed_count += 1
-                    self._stats["messages_published"] += 1
-
-                except MQTTConnectionError:
-                    # Connection error - requeue message and stop processing
-                    msg.retry_count += 1
-                    if msg.retry_count <= self._reconnection_config.message_retry_limit:
-                        self._message_queue.appendleft(msg)  # Put back at front
-                        self.logger.debug(
-                            "Requeued message to topic '%s' (retry %d/%d)",
-                            msg.topic,
-                            msg.retry_count,
-                            self._reconnection_config.message_retry_limit,
-                        )
-                    else:
-                        self.logger.exception(
-                            "Dropping message to topic '%s' after %d retries",
-                            msg.topic,
-                            msg.retry_count,
-                        )
-                        self._stats["messages_failed"] += 1
-                    break
-
-                except ValueError:
-                    # Serialization error - drop message
-                    self.logger.exception(
-                        "Dropping message to topic '%s' due to serialization error",
-                        msg.topic,
-                    )
-                    failed_count += 1
-                    self._stats["messages_failed"] += 1
+                break
+            # Linger outside the lock so a burst still being queued coalesces
+            # into the next batch
+            await asyncio.sleep(flush_delay)
+            if not self._message_queue:
+                break
 
         if processed_count > 0:
             self.logger.info(
@@ -862,7 +1287,7 @@ class MQTTInterface:
 
         try:
             await self._client.subscribe(full_topic, qos=qos)
-            self._message_handlers[full_topic] = handler
+            self._message_handlers.add(full_topic, handler)
 
             self.logger.info("Subscribed to topic '%s' (QoS %d)", full_topic, qos)
 
@@ -891,7 +1316,7 @@ class MQTTInterface:
 
         try:
             await self._client.unsubscribe(full_topic)
-            self._message_handlers.pop(full_topic, None)
+            self._message_handlers.remove(full_topic)
 
             self.logger.info("Unsubscribed from topic '%s'", full_topic)
 
@@ -904,24 +1329,26 @@ class MQTTInterface:
         if not self._client:
             return
 
+        # Bind per-message lookups once for the lifetime of the loop
+        match_handlers = self._message_handlers.match
+        log_enabled = self.logger.isEnabledFor
+        log_debug = self.logger.debug
+
         try:
             async for message in self._client.messages:
                 topic = message.topic.value
-                payload = (
-                    message.payload.decode("utf-8")
-                    if isinstance(message.payload, bytes)
-                    else str(message.payload)
-                )
+                # Received payloads are bytes; anything else is stringified
+                try:
+                    payload = message.payload.decode("utf-8")
+                except AttributeError:
+                    payload = str(message.payload)
 
-                self.logger.debug(
-                    "Received message on topic '%s': %s",
-                    topic,
-                    payload,
-                )
+                if log_enabled(logging.DEBUG):
+                    log_debug("Received message on topic '%s': %s", topic, payload)
 
-                # Find and call handler
-                handler = self._message_handlers.get(topic)
-                if handler:
+                # Find and call handlers for all matching subscriptions
+                handlers = match_handlers(topic)
+                for handler in handlers:
                     try:
                         handler(topic, payload)
                     except Exception:
@@ -929,7 +1356,7 @@ class MQTTInterface:
                             "Error in message handler for topic '%s'",
                             topic,
                         )
-                else:
+                if not handlers:
                     self.logger.warning(
                         "No handler registered for topic '%s'",
                         topic,
@@ -949,10 +1376,7 @@ class MQTTInterface:
 
     def _is_connection_error(self, error: Exception) -> bool:
         """Check if error is a connection-related error."""
-        return isinstance(
-            error,
-            (MqttError, OSError, ConnectionError, asyncio.TimeoutError),
-        )
+        return isinstance(error, _CONN_ERR_TYPES)
 
 
 class MQTTPublisher:
@@ -973,6 +1397,36 @@ class MQTTPublisher:
         """
         self.mqtt_interface = mqtt_interface
         self.logger = logging.getLogger("battery_hawk.mqtt.publisher")
+        # Per-device static reading keys, keyed by device_id and tagged with the
+        # (vehicle_id, device_type) they were built for
+        self._reading_template: dict[
+            str,
+            tuple[str | None, str | None, dict[str, Any]],
+        ] = {}
+
+    def _get_reading_template(
+        self,
+        device_id: str,
+        vehicle_id: str | None,
+        device_type: str | None,
+    ) -> dict[str, Any]:
+        """
+        Return the cached static portion of a device reading payload.
+
+        The template is rebuilt only when the device's vehicle association or
+        type changes; callers must copy it before adding per-reading fields.
+        """
+        cached = self._reading_template.get(device_id)
+        if cached is not None and cached[0] == vehicle_id and cached[1] == device_type:
+            return cached[2]
+
+        template: dict[str, Any] = {"device_id": device_id}
+        if vehicle_id:
+            template["vehicle_id"] = vehicle_id
+        if device_type:
+            template["device_type"] = device_type
+        self._reading_template[device_id] = (vehicle_id, device_type, template)
+        return template
 
     async def publish_device_reading(
         self,
@@ -981,6 +1435,7 @@ class MQTTPublisher:
         *,
         vehicle_id: str | None = None,
         device_type: str | None = None,
+        qos: int | None = None,
     ) -> None:
         """
         Publish device reading data.
@@ -990,32 +1445,37 @@ class MQTTPublisher:
             reading: Battery reading data.
             vehicle_id: Optional vehicle ID if device is associated with a vehicle.
             device_type: Optional device type (e.g., "BM2", "BM6").
+            qos: Optional QoS override (defaults to the configured QoS).
 
         Raises:
             MQTTConnectionError: If not connected to broker.
             ValueError: If reading data cannot be serialized.
         """
-        topic = f"device/{device_id}/reading"
-
-        # Build payload with reading data
-        payload = {
-            "device_id": device_id,
-            "timestamp": reading.timestamp or datetime.now(timezone.utc).isoformat(),
-            "voltage": reading.voltage,
-            "current": reading.current,
-            "temperature": reading.temperature,
-            "state_of_charge": reading.state_of_charge,
-        }
+        topic = _device_reading_topic(device_id)
+
+        # Start from the cached static keys and add per-reading fields
+        payload = self._get_reading_template(device_id, vehicle_id, device_type).copy()
+        payload.update(
+            {
+                "timestamp": reading.timestamp or _now_iso(),
+                "voltage": reading.voltage,
+                "current": reading.current,
+                "temperature": reading.temperature,
+                "state_of_charge": reading.state_of_charge,
+            },
+        )
 
         # Add optional fields if available
-        if reading.capacity is not None:
-            payload["capacity"] = reading.capacity
-        if reading.cycles is not None:
-            payload["cycles"] = reading.cycles
-        if vehicle_id:
-            payload["vehicle_id"] = vehicle_id
-        if device_type:
-            payload["device_type"] = device_type
+        payload.update(
+            {
+                key: value
+                for key, value in (
+                    ("capacity", reading.capacity),
+                    ("cycles", reading.cycles),
+                )
+                if value is not None
+            },
+        )
 
         # Include all extra fields (e.g., acceleration) at top-level without overriding existing keys
         if reading.extra:
@@ -1030,14 +1490,14 @@ class MQTTPublisher:
             payload["power"] = reading.voltage * reading.current
 
         try:
-            # Use QoS 1 for readings (important but not critical)
             # No retention for readings (they're time-series data)
-            await self.mqtt_interface.publish(topic, payload, retain=False)
-            self.logger.debug(
-                "Published device reading for %s (vehicle: %s)",
-                device_id,
-                vehicle_id or "none",
-            )
+            await self.mqtt_interface.publish(topic, payload, retain=False, qos=qos)
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    "Published device reading for %s (vehicle: %s)",
+                    device_id,
+                    vehicle_id or "none",
+                )
         except Exception:
             self.logger.exception(
                 "Failed to publish device reading for %s",
@@ -1054,70 +1514,40 @@ class MQTTPublisher:
 
         Returns a tuple of (flat_fields, nested_snapshot).
         """
-        if isinstance(reading, dict):
-            v = reading.get("voltage")
-            c = reading.get("current")
-            t = reading.get("temperature")
-            soc = reading.get("state_of_charge")
-            cap = reading.get("capacity")
-            cyc = reading.get("cycles")
-            r_ts = reading.get("timestamp")
-            extra = reading.get("extra")
-        else:
-            v = reading.voltage
-            c = reading.current
-            t = reading.temperature
-            soc = reading.state_of_charge
-            cap = getattr(reading, "capacity", None)
-            cyc = getattr(reading, "cycles", None)
-            r_ts = getattr(reading, "timestamp", None)
-            extra = getattr(reading, "extra", None)
-
-        flat: dict[str, Any] = {
-            "voltage": v,
-            "current": c,
-            "temperature": t,
-            "state_of_charge": soc,
-        }
-        if cap is not None:
-            flat["capacity"] = cap
-        if cyc is not None:
-            flat["cycles"] = cyc
-        if extra:
-            flat["reading_extra"] = extra
-        if (
-            v is not None
-            and c is not None
-            and isinstance(v, (int, float))
-            and isinstance(c, (int, float))
-        ):
-            flat["power"] = v * c
+        r = _ReadingView.of(reading)
+        v, c, extra = r.voltage, r.current, r.extra
 
         nested: dict[str, Any] = {
             "voltage": v,
             "current": c,
-            "temperature": t,
-            "state_of_charge": soc,
+            "temperature": r.temperature,
+            "state_of_charge": r.state_of_charge,
         }
-        if cap is not None:
-            nested["capacity"] = cap
-        if cyc is not None:
-            nested["cycles"] = cyc
+        nested.update(
+            {
+                key: value
+                for key, value in (
+                    ("capacity", r.capacity),
+                    ("cycles", r.cycles),
+                    ("timestamp", r.timestamp),
+                )
+                if value is not None
+            },
+        )
         if extra:
             nested["extra"] = extra
-        if r_ts is not None:
-            nested["timestamp"] = r_ts
-        if (
-            v is not None
-            and c is not None
-            and isinstance(v, (int, float))
-            and isinstance(c, (int, float))
-        ):
+        if isinstance(v, (int, float)) and isinstance(c, (int, float)):
             nested["power"] = v * c
 
+        # The flattened view is the nested snapshot minus its timestamp, with
+        # extra exposed under a non-conflicting key
+        flat = {k: nested[k] for k in _FLAT_READING_FIELDS if k in nested}
+        if extra:
+            flat["reading_extra"] = extra
+
         return flat, nested
 
-    async def publish_device_status(
+    def device_status_message(
         self,
         device_id: str,
         status: DeviceStatus,
@@ -1125,13 +1555,9 @@ class MQTTPublisher:
         device_type: str | None = None,
         vehicle_id: str | None = None,
         reading: BatteryInfo | dict[str, Any] | None = None,
-    ) -> None:
+    ) -> tuple[str, dict[str, Any], bool]:
         """
-        Publish device status change.
-
-        The retained device status payload also includes the latest known reading
-        values when provided, so that subscribers to the status topic can obtain the
-        most recent battery metrics without separately fetching the readings stream.
+        Build the device status message without publishing it.
 
         Args:
             device_id: Device MAC address or identifier.
@@ -1140,34 +1566,36 @@ class MQTTPublisher:
             vehicle_id: Optional vehicle id if associated.
             reading: Optional latest reading to embed in the status payload.
 
-        Raises:
-            MQTTConnectionError: If not connected to broker.
-            ValueError: If status data cannot be serialized.
+        Returns:
+            ``(topic, payload, retain)`` suitable for ``MQTTInterface.publish_many``.
         """
-        topic = f"device/{device_id}/status"
+        topic = _device_status_topic(device_id)
 
         # Build payload with status data
         payload: dict[str, Any] = {
             "device_id": device_id,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": _now_iso(),
             "connected": status.connected,
         }
 
         # Add optional fields if available
         if status.error_code is not None:
             payload["error_code"] = status.error_code
-        if status.error_message:
-            payload["error_message"] = status.error_message
-        if status.protocol_version:
-            payload["protocol_version"] = status.protocol_version
-        if status.last_command:
-            payload["last_command"] = status.last_command
-        if device_type:
-            payload["device_type"] = device_type
-        if vehicle_id:
-            payload["vehicle_id"] = vehicle_id
-        if status.extra:
-            payload["extra"] = status.extra
+        # The remaining optional fields are only included when non-empty
+        payload.update(
+            {
+                key: value
+                for key, value in (
+                    ("error_message", status.error_message),
+                    ("protocol_version", status.protocol_version),
+                    ("last_command", status.last_command),
+                    ("device_type", device_type),
+                    ("vehicle_id", vehicle_id),
+                    ("extra", status.extra),
+                )
+                if value
+            },
+        )
 
         # If a latest reading is provided, embed key reading values in the status
         if reading is not None:
@@ -1176,15 +1604,53 @@ class MQTTPublisher:
             payload.update(flat)
             payload["latest_reading"] = nested
 
+        # Retain status messages so new subscribers get last known state
+        return topic, payload, True
+
+    async def publish_device_status(
+        self,
+        device_id: str,
+        status: DeviceStatus,
+        *,
+        device_type: str | None = None,
+        vehicle_id: str | None = None,
+        reading: BatteryInfo | dict[str, Any] | None = None,
+    ) -> None:
+        """
+        Publish device status change.
+
+        The retained device status payload also includes the latest known reading
+        values when provided, so that subscribers to the status topic can obtain the
+        most recent battery metrics without separately fetching the readings stream.
+
+        Args:
+            device_id: Device MAC address or identifier.
+            status: Device status information.
+            device_type: Optional device type (e.g., "BM2", "BM6").
+            vehicle_id: Optional vehicle id if associated.
+            reading: Optional latest reading to embed in the status payload.
+
+        Raises:
+            MQTTConnectionError: If not connected to broker.
+            ValueError: If status data cannot be serialized.
+        """
+        topic, payload, retain = self.device_status_message(
+            device_id,
+            status,
+            device_type=device_type,
+            vehicle_id=vehicle_id,
+            reading=reading,
+        )
+
         try:
             # Use QoS 1 for status changes (important)
-            # Retain status messages so new subscribers get last known state
-            await self.mqtt_interface.publish(topic, payload, retain=True)
-            self.logger.debug(
-                "Published device status for %s (connected: %s)",
-                device_id,
-                status.connected,
-            )
+            await self.mqtt_interface.publish(topic, payload, retain=retain)
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    "Published device status for %s (connected: %s)",
+                    device_id,
+                    status.connected,
+                )
         except MQTTConnectionError:
             # Keep original exception type for callers that distinguish connection issues
             self.logger.exception(
@@ -1200,10 +1666,59 @@ class MQTTPublisher:
             )
             raise
 
+    async def publish_batch(
+        self,
+        messages: list[tuple[str, dict[str, Any] | str | bytes, bool]],
+        *,
+        qos: int | None = None,
+    ) -> None:
+        """
+        Publish several prebuilt messages as one concurrent batch.
+
+        Args:
+            messages: ``(topic, payload, retain)`` tuples, e.g. from
+                ``device_status_message`` or ``vehicle_summary_message``.
+            qos: QoS level for the batch (defaults to the configured QoS).
+
+        Raises:
+            MQTTConnectionError: If not connected to broker.
+            ValueError: If a payload cannot be serialized.
+        """
+        if not messages:
+            return
+
+        await self.mqtt_interface.publish_many(messages, qos=qos)
+        self.logger.debug("Published batch of %d messages", len(messages))
+
+    def vehicle_summary_message(
+        self,
+        vehicle_id: str,
+        summary_data: dict[str, Any],
+    ) -> tuple[str, dict[str, Any], bool]:
+        """
+        Build the vehicle summary message without publishing it.
+
+        Args:
+            vehicle_id: Vehicle identifier.
+            summary_data: Aggregated vehicle data.
+
+        Returns:
+            ``(topic, payload, retain)`` suitable for ``MQTTInterface.publish_many``.
+        """
+        payload = {
+            "vehicle_id": vehicle_id,
+            "timestamp": _now_iso(),
+            **summary_data,
+        }
+        # Retain vehicle summaries so new subscribers get last known state
+        return _vehicle_summary_topic(vehicle_id), payload, True
+
     async def publish_vehicle_summary(
         self,
         vehicle_id: str,
         summary_data: dict[str, Any],
+        *,
+        qos: int | None = None,
     ) -> None:
         """
         Publish aggregated vehicle summary data.
@@ -1212,24 +1727,16 @@ class MQTTPublisher:
             vehicle_id: Vehicle identifier.
             summary_data: Aggregated vehicle data including device readings,
                          overall status, and calculated metrics.
+            qos: Optional QoS override (defaults to the configured QoS).
 
         Raises:
             MQTTConnectionError: If not connected to broker.
             ValueError: If summary data cannot be serialized.
         """
-        topic = f"vehicle/{vehicle_id}/summary"
-
-        # Build payload with vehicle summary
-        payload = {
-            "vehicle_id": vehicle_id,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            **summary_data,
-        }
+        topic, payload, retain = self.vehicle_summary_message(vehicle_id, summary_data)
 
         try:
-            # Use QoS 1 for vehicle summaries (important)
-            # Retain vehicle summaries so new subscribers get last known state
-            await self.mqtt_interface.publish(topic, payload, retain=True)
+            await self.mqtt_interface.publish(topic, payload, retain=retain, qos=qos)
             self.logger.debug(
                 "Published vehicle summary for %s",
                 vehicle_id,
@@ -1244,6 +1751,8 @@ class MQTTPublisher:
     async def publish_system_status(
         self,
         status_data: dict[str, Any],
+        *,
+        qos: int | None = None,
     ) -> None:
         """
         Publish system-wide status information.
@@ -1251,6 +1760,7 @@ class MQTTPublisher:
         Args:
             status_data: System status data including core engine status,
                         storage system status, and component status.
+            qos: Optional QoS override (defaults to the configured QoS).
 
         Raises:
             MQTTConnectionError: If not connected to broker.
@@ -1260,13 +1770,13 @@ class MQTTPublisher:
 
         # Build payload with system status
         payload = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": _now_iso(),
             **status_data,
         }
 
         try:
             # Use retain for new subscribers to get last known system status
-            await self.mqtt_interface.publish(topic, payload, retain=True)
+            await self.mqtt_interface.publish(topic, payload, retain=True, qos=qos)
             self.logger.debug("Published system status")
 
         except Exception:
@@ -1285,6 +1795,19 @@ class MQTTEventHandler:
     system events.
     """
 
+    # (event type, handler method name) pairs wired up by register_all_handlers
+    _CORE_EVENT_HANDLERS = (
+        ("device_discovered", "on_device_discovered"),
+        ("vehicle_associated", "on_vehicle_associated"),
+        ("system_shutdown", "on_system_shutdown"),
+    )
+    _STATE_EVENT_HANDLERS = (
+        ("reading", "on_device_reading"),
+        ("status", "on_device_status_change"),
+        ("connection", "on_device_connection_change"),
+        ("vehicle", "on_vehicle_update"),
+    )
+
     def __init__(
         self,
         core_engine: BatteryHawkCore,
@@ -1301,11 +1824,24 @@ class MQTTEventHandler:
         self.mqtt_publisher = mqtt_publisher
         self.logger = logging.getLogger("battery_hawk.mqtt.event_handler")
 
-        # Track registered handlers for cleanup
-        self._registered_handlers: dict[str, Callable] = {}
+        # Track registered handlers for cleanup, keyed by event type
+        self._core_handlers: dict[str, Callable] = {}
+        self._state_handlers: dict[str, Callable] = {}
+
+        # Vehicle summary change detection keeps (device count, connected count)
+        # and a fingerprint per vehicle rather than a copy of each summary. A
+        # summary is only held until its fingerprint is first needed.
+        self._vehicle_summary_counts: dict[str, tuple[int, int]] = {}
+        self._vehicle_summary_sig: dict[str, int] = {}
+        self._vehicle_summary_unhashed: dict[str, dict[str, Any]] = {}
 
-        # Track vehicle summary cache for efficient updates
-        self._vehicle_summary_cache: dict[str, dict[str, Any]] = {}
+        # Strong references to in-flight state handler tasks so they are not
+        # garbage collected before completing; the done callback is bound once
+        self._bg_tasks: set[asyncio.Task] = set()
+        self._bg_done_cb: Callable[[asyncio.Task], None] = self._on_bg_task_done
+
+        # Vehicle summary publishes waiting for their debounce window to close
+        self._pending_summary: dict[str, asyncio.TimerHandle] = {}
 
     def register_all_handlers(self) -> None:
         """Register all event handlers with the core engine."""
@@ -1324,92 +1860,40 @@ class MQTTEventHandler:
         self.logger.info("Unregistering MQTT event handlers")
 
         # Unregister core engine handlers
-        for event_type, handler in self._registered_handlers.items():
-            if event_type.startswith("core_"):
-                actual_event_type = event_type[5:]  # Remove 'core_' prefix
-                self.core_engine.remove_event_handler(actual_event_type, handler)
+        for event_type, handler in self._core_handlers.items():
+            self.core_engine.remove_event_handler(event_type, handler)
 
         # Unregister state manager handlers
-        for event_type, handler in self._registered_handlers.items():
-            if event_type.startswith("state_"):
-                actual_event_type = event_type[6:]  # Remove 'state_' prefix
-                self.core_engine.state_manager.unsubscribe_from_changes(
-                    actual_event_type,
-                    handler,
-                )
+        for event_type, handler in self._state_handlers.items():
+            self.core_engine.state_manager.unsubscribe_from_changes(
+                event_type,
+                handler,
+            )
+
+        self._core_handlers.clear()
+        self._state_handlers.clear()
 
-        self._registered_handlers.clear()
+        for handle in self._pending_summary.values():
+            handle.cancel()
+        self._pending_summary.clear()
         self.logger.info("All MQTT event handlers unregistered")
 
     def _register_core_engine_handlers(self) -> None:
         """Register event handlers with the core engine."""
-        # Device discovered handler
-        device_discovered_handler = self._create_async_handler(
-            self.on_device_discovered,
-        )
-        self.core_engine.add_event_handler(
-            "device_discovered",
-            device_discovered_handler,
-        )
-        self._registered_handlers["core_device_discovered"] = device_discovered_handler
-
-        # Vehicle associated handler
-        vehicle_associated_handler = self._create_async_handler(
-            self.on_vehicle_associated,
-        )
-        self.core_engine.add_event_handler(
-            "vehicle_associated",
-            vehicle_associated_handler,
-        )
-        self._registered_handlers["core_vehicle_associated"] = (
-            vehicle_associated_handler
-        )
-
-        # System shutdown handler
-        system_shutdown_handler = self._create_async_handler(self.on_system_shutdown)
-        self.core_engine.add_event_handler("system_shutdown", system_shutdown_handler)
-        self._registered_handlers["core_system_shutdown"] = system_shutdown_handler
+        # The core engine awaits coroutine handlers itself and logs anything
+        # they raise, so the bound methods are registered as-is
+        for event_type, method_name in self._CORE_EVENT_HANDLERS:
+            handler = getattr(self, method_name)
+            self.core_engine.add_event_handler(event_type, handler)
+            self._core_handlers[event_type] = handler
 
     def _register_state_manager_handlers(self) -> None:
         """Register event handlers with the state manager."""
-        # Device reading handler
-        reading_handler = self._create_state_handler(self.on_device_reading)
-        self.core_engine.state_manager.subscribe_to_changes("reading", reading_handler)
-        self._registered_handlers["state_reading"] = reading_handler
-
-        # Device status handler
-        status_handler = self._create_state_handler(self.on_device_status_change)
-        self.core_engine.state_manager.subscribe_to_changes("status", status_handler)
-        self._registered_handlers["state_status"] = status_handler
-
-        # Connection state handler
-        connection_handler = self._create_state_handler(
-            self.on_device_connection_change,
-        )
-        self.core_engine.state_manager.subscribe_to_changes(
-            "connection",
-            connection_handler,
-        )
-        self._registered_handlers["state_connection"] = connection_handler
-
-        # Vehicle association handler
-        vehicle_handler = self._create_state_handler(self.on_vehicle_update)
-        self.core_engine.state_manager.subscribe_to_changes("vehicle", vehicle_handler)
-        self._registered_handlers["state_vehicle"] = vehicle_handler
-
-    def _create_async_handler(self, handler_method: Callable) -> Callable:
-        """Create an async wrapper for core engine event handlers."""
-
-        async def async_wrapper(event_data: dict[str, Any]) -> None:
-            try:
-                await handler_method(event_data)
-            except Exception:
-                self.logger.exception(
-                    "Error in async event handler %s",
-                    handler_method.__name__,
-                )
-
-        return async_wrapper
+        state_manager = self.core_engine.state_manager
+        for event_type, method_name in self._STATE_EVENT_HANDLERS:
+            handler = self._create_state_handler(getattr(self, method_name))
+            state_manager.subscribe_to_changes(event_type, handler)
+            self._state_handlers[event_type] = handler
 
     def _create_state_handler(self, handler_method: Callable) -> Callable:
         """Create a wrapper for state manager event handlers."""
@@ -1420,12 +1904,20 @@ class MQTTEventHandler:
             old_state: DeviceState | None,
         ) -> None:
             try:
-                # Convert to async task
-                task = asyncio.create_task(
+                # Run the handler eagerly: it proceeds synchronously up to its
+                # first real suspension and only stays tracked if still pending
+                task = asyncio.eager_task_factory(
+                    asyncio.get_running_loop(),
                     handler_method(mac_address, new_state, old_state),
+                    name=handler_method.__name__,
                 )
-                task.add_done_callback(lambda _: None)
-            except Exception:
+                if task.done():
+                    self._on_bg_task_done(task)
+                else:
+                    self._bg_tasks.add(task)
+                    task.add_done_callback(self._bg_done_cb)
+            except RuntimeError:
+                # No running event loop to schedule the handler on
                 self.logger.exception(
                     "Error in state event handler %s",
                     handler_method.__name__,
@@ -1433,6 +1925,24 @@ class MQTTEventHandler:
 
         return state_wrapper
 
+    def _on_bg_task_done(self, task: asyncio.Task) -> None:
+        """
+        Release a finished background task and log anything it raised.
+
+        Nothing awaits these tasks, so without this an unexpected error would
+        only surface as "Task exception was never retrieved" at GC time.
+        """
+        self._bg_tasks.discard(task)
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is not None:
+            self.logger.error(
+                "Error in MQTT background task %s",
+                task.get_name(),
+                exc_info=exc,
+            )
+
     async def on_device_discovered(self, event_data: dict[str, Any]) -> None:
         """
         Handle device discovered events.
@@ -1452,7 +1962,7 @@ class MQTTEventHandler:
                 "device_type": device_type,
                 "name": name,
                 "rssi": rssi,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": _now_iso(),
                 "advertisement_data": event_data.get("advertisement_data", {}),
             }
 
@@ -1470,7 +1980,7 @@ class MQTTEventHandler:
                 device_type,
             )
 
-        except Exception:
+        except _HANDLER_ERRORS:
             self.logger.exception("Failed to handle device discovered event")
 
     async def on_device_reading(
@@ -1500,16 +2010,19 @@ class MQTTEventHandler:
             )
             device_type = new_state.device_type
 
+            publisher = self.mqtt_publisher
+
             # Publish device reading
-            await self.mqtt_publisher.publish_device_reading(
+            await publisher.publish_device_reading(
                 device_id=mac_address,
                 reading=new_state.latest_reading,
                 vehicle_id=vehicle_id,
                 device_type=device_type,
+                qos=TELEMETRY_QOS,
             )
 
             # Also update retained status with the latest reading snapshot
-            await self.mqtt_publisher.publish_device_status(
+            await publisher.publish_device_status(
                 device_id=mac_address,
                 status=new_state.device_status
                 or DeviceStatus(connected=new_state.connected),
@@ -1520,15 +2033,16 @@ class MQTTEventHandler:
 
             # Update vehicle summary if device is associated with a vehicle
             if vehicle_id:
-                await self._update_vehicle_summary(vehicle_id)
+                self._schedule_vehicle_summary(vehicle_id)
 
-            self.logger.debug(
-                "Published device reading for %s (vehicle: %s)",
-                mac_address,
-                vehicle_id or "none",
-            )
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    "Published device reading for %s (vehicle: %s)",
+                    mac_address,
+                    vehicle_id or "none",
+                )
 
-        except Exception:
+        except _HANDLER_ERRORS:
             self.logger.exception("Failed to handle device reading event")
 
     async def on_device_status_change(
@@ -1566,15 +2080,16 @@ class MQTTEventHandler:
 
             # Update vehicle summary if device is associated with a vehicle
             if new_state.vehicle_id:
-                await self._update_vehicle_summary(new_state.vehicle_id)
+                self._schedule_vehicle_summary(new_state.vehicle_id)
 
-            self.logger.debug(
-                "Published device status for %s (connected: %s)",
-                mac_address,
-                new_state.device_status.connected,
-            )
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    "Published device status for %s (connected: %s)",
+                    mac_address,
+                    new_state.device_status.connected,
+                )
 
-        except Exception:
+        except _HANDLER_ERRORS:
             self.logger.exception("Failed to handle device status change event")
 
     async def on_device_connection_change(
@@ -1600,7 +2115,6 @@ class MQTTEventHandler:
                 return
 
             # Create a DeviceStatus object for connection state
-
             connection_status = DeviceStatus(
                 connected=new_state.connected,
                 error_message=new_state.last_connection_error,
@@ -1615,7 +2129,7 @@ class MQTTEventHandler:
 
             # Update vehicle summary if device is associated with a vehicle
             if new_state.vehicle_id:
-                await self._update_vehicle_summary(new_state.vehicle_id)
+                self._schedule_vehicle_summary(new_state.vehicle_id)
 
             self.logger.debug(
                 "Published connection change for %s (connected: %s)",
@@ -1623,7 +2137,7 @@ class MQTTEventHandler:
                 new_state.connected,
             )
 
-        except Exception:
+        except _HANDLER_ERRORS:
             self.logger.exception("Failed to handle device connection change event")
 
     async def on_vehicle_associated(self, event_data: dict[str, Any]) -> None:
@@ -1648,18 +2162,28 @@ class MQTTEventHandler:
                 "vehicle_id": vehicle_id,
                 "device_type": device_type,
                 "new_vehicle": is_new_vehicle,
-                "timestamp": datetime.now(tz=timezone.utc).isoformat(),
+                "timestamp": _now_iso(),
             }
 
-            topic = f"vehicle/{vehicle_id}/device_associated"  # Custom topic for association events
-            await self.mqtt_publisher.mqtt_interface.publish(
-                topic,
-                association_payload,
-                retain=False,
-            )
+            messages: list[tuple[str, dict[str, Any] | str | bytes, bool]] = [
+                (
+                    _vehicle_device_associated_topic(vehicle_id),
+                    association_payload,
+                    False,
+                ),
+            ]
+
+            # Refresh the vehicle summary and send it in the same batch
+            summary_data = self._build_vehicle_summary(vehicle_id)
+            if summary_data is not None:
+                messages.append(
+                    self.mqtt_publisher.vehicle_summary_message(
+                        vehicle_id,
+                        summary_data,
+                    ),
+                )
 
-            # Update vehicle summary
-            await self._update_vehicle_summary(vehicle_id)
+            await self.mqtt_publisher.mqtt_interface.publish_many(messages)
 
             self.logger.debug(
                 "Published vehicle association for device %s to vehicle %s",
@@ -1667,7 +2191,7 @@ class MQTTEventHandler:
                 vehicle_id,
             )
 
-        except Exception:
+        except _HANDLER_ERRORS:
             self.logger.exception("Failed to handle vehicle association event")
 
     async def on_vehicle_update(
@@ -1694,11 +2218,11 @@ class MQTTEventHandler:
 
             # Update summary for old vehicle if it existed
             if old_vehicle:
-                await self._update_vehicle_summary(old_vehicle)
+                self._schedule_vehicle_summary(old_vehicle)
 
             # Update summary for new vehicle if it exists
             if new_vehicle:
-                await self._update_vehicle_summary(new_vehicle)
+                self._schedule_vehicle_summary(new_vehicle)
 
             self.logger.debug(
                 "Handled vehicle update for device %s (old: %s, new: %s)",
@@ -1707,7 +2231,7 @@ class MQTTEventHandler:
                 new_vehicle or "none",
             )
 
-        except Exception:
+        except _HANDLER_ERRORS:
             self.logger.exception("Failed to handle vehicle update event")
 
     async def on_system_shutdown(self, event_data: dict[str, Any]) -> None:
@@ -1718,10 +2242,13 @@ class MQTTEventHandler:
             event_data: Event data for system shutdown.
         """
         try:
+            # Send summaries still waiting on their debounce window first
+            await self.flush_pending_summaries()
+
             # Publish system shutdown notification
             shutdown_payload = {
                 "status": "shutting_down",
-                "timestamp": datetime.now(tz=timezone.utc).isoformat(),
+                "timestamp": _now_iso(),
                 "reason": event_data.get("reason", "normal_shutdown"),
             }
 
@@ -1733,7 +2260,7 @@ class MQTTEventHandler:
 
             self.logger.info("Published system shutdown notification")
 
-        except Exception:
+        except _HANDLER_ERRORS:
             self.logger.exception("Failed to handle system shutdown event")
 
     async def on_system_status_change(self, status_data: dict[str, Any]) -> None:
@@ -1744,64 +2271,83 @@ class MQTTEventHandler:
             status_data: System status data to publish.
         """
         try:
-            await self.mqtt_publisher.publish_system_status(status_data)
+            await self.mqtt_publisher.publish_system_status(
+                status_data,
+                qos=TELEMETRY_QOS,
+            )
 
             self.logger.debug("Published system status update")
 
-        except Exception:
+        except _HANDLER_ERRORS:
             self.logger.exception("Failed to handle system status change")
 
     def _collect_vehicle_device_data(
         self,
         vehicle_id: str,
     ) -> tuple[list[dict[str, Any]], int, float, float]:
-        """Collect device data for a vehicle."""
-        vehicle_devices = []
-        connected_count = 0
-        total_voltage = 0.0
-        total_capacity = 0.0
-        voltage_count = 0
-        capacity_count = 0
-
-        # Get device states for this vehicle
-        all_states = self.core_engine.state_manager.get_all_devices()
-        for state in all_states:
-            if state.vehicle_id == vehicle_id:
-                device_summary = {
-                    "id": state.mac_address,
-                    "device_type": state.device_type,
-                    "connected": state.connected,
-                    "last_reading_time": state.last_reading_time.isoformat()
-                    if state.last_reading_time
-                    else None,
-                }
-
-                # Add reading data if available
-                if state.latest_reading:
-                    device_summary.update(
-                        {
-                            "voltage": state.latest_reading.voltage,
-                            "current": state.latest_reading.current,
-                            "temperature": state.latest_reading.temperature,
-                            "state_of_charge": state.latest_reading.state_of_charge,
-                        },
-                    )
+        """
+        Collect device data for a vehicle.
 
-                    # Accumulate for averages
-                    if state.latest_reading.voltage is not None:
-                        total_voltage += state.latest_reading.voltage
-                        voltage_count += 1
-                    if state.latest_reading.capacity is not None:
-                        total_capacity += state.latest_reading.capacity
-                        capacity_count += 1
+        Numeric readings are gathered into per-field columns during the single
+        pass over device states and aggregated with one ``sum()`` each.
+        """
+        # Only this vehicle's devices are visited, via the state manager's index
+        states = self.core_engine.state_manager.get_devices_by_vehicle(vehicle_id)
+        if not states:
+            return [], 0, 0.0, 0.0
+
+        vehicle_devices: list[dict[str, Any]] = []
+        connected_count = 0
+        voltages: list[float] = []
+        capacities: list[float] = []
+
+        # Bind the per-device appends once, outside the loop
+        add_device = vehicle_devices.append
+        add_voltage = voltages.append
+        add_capacity = capacities.append
+
+        for state in states:
+            connected = state.connected
+            reading_time = state.last_reading_time
+            last_reading_time = reading_time.isoformat() if reading_time else None
+
+            # Each summary is built as a single dict literal, with the reading
+            # fields included up front when a reading is available
+            if reading := state.latest_reading:
+                voltage = reading.voltage
+                capacity = reading.capacity
+                add_device(
+                    {
+                        "id": state.mac_address,
+                        "device_type": state.device_type,
+                        "connected": connected,
+                        "last_reading_time": last_reading_time,
+                        "voltage": voltage,
+                        "current": reading.current,
+                        "temperature": reading.temperature,
+                        "state_of_charge": reading.state_of_charge,
+                    },
+                )
 
-                if state.connected:
-                    connected_count += 1
+                if voltage is not None:
+                    add_voltage(voltage)
+                if capacity is not None:
+                    add_capacity(capacity)
+            else:
+                add_device(
+                    {
+                        "id": state.mac_address,
+                        "device_type": state.device_type,
+                        "connected": connected,
+                        "last_reading_time": last_reading_time,
+                    },
+                )
 
-                vehicle_devices.append(device_summary)
+            if connected:
+                connected_count += 1
 
-        average_voltage = total_voltage / voltage_count if voltage_count > 0 else 0.0
-        return vehicle_devices, connected_count, average_voltage, total_capacity
+        average_voltage = sum(voltages) / len(voltages) if voltages else 0.0
+        return vehicle_devices, connected_count, average_voltage, float(sum(capacities))
 
     def _calculate_vehicle_health(
         self,
@@ -1825,35 +2371,164 @@ class MQTTEventHandler:
 
         return overall_health, health_score
 
-    def _remove_time_fields(self, data: dict[str, Any]) -> dict[str, Any]:
-        """Remove time-based fields that change on every update."""
-        clean_data = data.copy()
-        clean_data.pop("last_updated", None)
-
-        # Also clean device-level time fields
-        if "devices" in clean_data:
-            clean_devices = []
-            for device in clean_data["devices"]:
-                clean_device = device.copy()
-                clean_device.pop("last_reading_time", None)
-                clean_devices.append(clean_device)
-            clean_data["devices"] = clean_devices
+    @staticmethod
+    def _summary_signature(data: dict[str, Any]) -> int:
+        """
+        Fingerprint a vehicle summary, ignoring fields that change on every update.
 
-        return clean_data
+        The summary is hashed as nested tuples of its items, so no intermediate
+        copies of the summary or its device entries are made. Summary values are
+        scalars apart from the device list, so every element is hashable.
+        """
+        return hash(
+            (
+                tuple(
+                    item
+                    for item in data.items()
+                    if item[0] not in _SUMMARY_VOLATILE_FIELDS
+                ),
+                tuple(
+                    tuple(
+                        item
+                        for item in device.items()
+                        if item[0] != "last_reading_time"
+                    )
+                    for device in data.get("devices", ())
+                ),
+            ),
+        )
 
     def _should_update_vehicle_cache(
         self,
         vehicle_id: str,
         summary_data: dict[str, Any],
     ) -> bool:
-        """Check if vehicle summary cache should be updated."""
-        cache_data = self._remove_time_fields(summary_data)
-        cache_key = vehicle_id
-        cached_data = self._remove_time_fields(
-            self._vehicle_summary_cache.get(cache_key, {}),
+        """Check if a vehicle summary changed, recording it for the next check."""
+        counts = (
+            len(summary_data.get("devices", ())),
+            summary_data.get("connected_devices", 0),
         )
+        if self._vehicle_summary_counts.get(vehicle_id) != counts:
+            # Counts differ, so the summary changed; skip hashing and keep the
+            # summary until the next comparison needs its signature
+            self._vehicle_summary_counts[vehicle_id] = counts
+            self._vehicle_summary_sig.pop(vehicle_id, None)
+            self._vehicle_summary_unhashed[vehicle_id] = summary_data
+            return True
 
-        return cache_key not in self._vehicle_summary_cache or cached_data != cache_data
+        cached_signature = self._vehicle_summary_sig.get(vehicle_id)
+        if cached_signature is None:
+            cached_signature = self._summary_signature(
+                self._vehicle_summary_unhashed.pop(vehicle_id),
+            )
+
+        signature = self._summary_signature(summary_data)
+        self._vehicle_summary_sig[vehicle_id] = signature
+        return signature != cached_signature
+
+    def _build_vehicle_summary(self, vehicle_id: str) -> dict[str, Any] | None:
+        """
+        Build a vehicle's summary and record it in the summary cache.
+
+        Args:
+            vehicle_id: Vehicle ID to build the summary for.
+
+        Returns:
+            The summary data, or None if the vehicle is unknown or its summary
+            has not changed since it was last published.
+        """
+        # Get vehicle information
+        vehicle_info = self.core_engine.vehicle_registry.get_vehicle(vehicle_id)
+        if not vehicle_info:
+            self.logger.warning("Vehicle %s not found in registry", vehicle_id)
+            return None
+
+        # Collect device data
+        vehicle_devices, connected_count, average_voltage, total_capacity = (
+            self._collect_vehicle_device_data(vehicle_id)
+        )
+
+        # Calculate health
+        total_devices = len(vehicle_devices)
+        overall_health, health_score = self._calculate_vehicle_health(
+            connected_count,
+            total_devices,
+        )
+
+        # Build vehicle summary
+        summary_data = {
+            "name": vehicle_info.get("name", f"Vehicle_{vehicle_id}"),
+            "total_devices": total_devices,
+            "connected_devices": connected_count,
+            "disconnected_devices": total_devices - connected_count,
+            "average_voltage": round(average_voltage, 2),
+            "total_capacity": round(total_capacity, 2),
+            "overall_health": overall_health,
+            "health_score": round(health_score, 2),
+            "devices": vehicle_devices,
+            "last_updated": _now_iso(),
+        }
+
+        # Check if the summary changed since it was last published
+        if not self._should_update_vehicle_cache(vehicle_id, summary_data):
+            return None
+
+        return summary_data
+
+    def _schedule_vehicle_summary(self, vehicle_id: str) -> None:
+        """
+        Schedule a debounced vehicle summary update.
+
+        The first request for a vehicle arms a timer for SUMMARY_DEBOUNCE_DELAY;
+        further requests before it fires are folded into that update. The timer
+        is not pushed back by later requests, so a steady stream of readings
+        still produces a summary at least once per window.
+
+        Args:
+            vehicle_id: Vehicle ID to update summary for.
+        """
+        if vehicle_id in self._pending_summary:
+            return
+
+        self._pending_summary[vehicle_id] = asyncio.get_running_loop().call_later(
+            SUMMARY_DEBOUNCE_DELAY,
+            self._on_summary_due,
+            vehicle_id,
+        )
+
+    def _on_summary_due(self, vehicle_id: str) -> None:
+        """Start the summary update for a vehicle whose debounce window closed."""
+        self._pending_summary.pop(vehicle_id, None)
+        task = asyncio.create_task(
+            self._update_vehicle_summary(vehicle_id),
+            name=f"vehicle summary {vehicle_id}",
+        )
+        self._bg_tasks.add(task)
+        task.add_done_callback(self._bg_done_cb)
+
+    async def flush_pending_summaries(self) -> None:
+        """Publish all debounced vehicle summaries immediately and concurrently."""
+        pending = list(self._pending_summary)
+        for handle in self._pending_summary.values():
+            handle.cancel()
+        self._pending_summary.clear()
+
+        if not pending:
+            return
+        results = await asyncio.gather(
+            *(self._update_vehicle_summary(vehicle_id) for vehicle_id in pending),
+            return_exceptions=True,
+        )
+        for vehicle_id, result in zip(pending, results, strict=True):
+            if isinstance(result, BaseException) and not isinstance(
+                result,
+                asyncio.CancelledError,
+            ):
+                self.logger.error(
+                    "Error flushing vehicle summary for %s",
+                    vehicle_id,
+                    exc_info=result,
+                )
 
     async def _update_vehicle_summary(self, vehicle_id: str) -> None:
         """
@@ -1862,57 +2537,32 @@ class MQTTEventHandler:
         Args:
             vehicle_id: Vehicle ID to update summary for.
         """
+        # A summary built while disconnected would only be queued behind newer
+        # ones; leave the cache untouched so the next update after reconnecting
+        # publishes the current state
+        if not self.mqtt_publisher.mqtt_interface.connected:
+            return
+
         try:
-            # Get vehicle information
-            vehicle_info = self.core_engine.vehicle_registry.get_vehicle(vehicle_id)
-            if not vehicle_info:
-                self.logger.warning("Vehicle %s not found in registry", vehicle_id)
+            summary_data = self._build_vehicle_summary(vehicle_id)
+            if summary_data is None:
                 return
 
-            # Collect device data
-            vehicle_devices, connected_count, average_voltage, total_capacity = (
-                self._collect_vehicle_device_data(vehicle_id)
+            # Publish vehicle summary
+            await self.mqtt_publisher.publish_vehicle_summary(
+                vehicle_id,
+                summary_data,
+                qos=TELEMETRY_QOS,
             )
 
-            # Calculate health
-            total_devices = len(vehicle_devices)
-            overall_health, health_score = self._calculate_vehicle_health(
-                connected_count,
-                total_devices,
+            self.logger.debug(
+                "Updated vehicle summary for %s (%d devices, %d connected)",
+                vehicle_id,
+                summary_data["total_devices"],
+                summary_data["connected_devices"],
             )
 
-            # Build vehicle summary
-            summary_data = {
-                "name": vehicle_info.get("name", f"Vehicle_{vehicle_id}"),
-                "total_devices": total_devices,
-                "connected_devices": connected_count,
-                "disconnected_devices": total_devices - connected_count,
-                "average_voltage": round(average_voltage, 2),
-                "total_capacity": round(total_capacity, 2),
-                "overall_health": overall_health,
-                "health_score": round(health_score, 2),
-                "devices": vehicle_devices,
-                "last_updated": datetime.now(tz=timezone.utc).isoformat(),
-            }
-
-            # Check if cache should be updated
-            if self._should_update_vehicle_cache(vehicle_id, summary_data):
-                self._vehicle_summary_cache[vehicle_id] = summary_data.copy()
-
-                # Publish vehicle summary
-                await self.mqtt_publisher.publish_vehicle_summary(
-                    vehicle_id,
-                    summary_data,
-                )
-
-                self.logger.debug(
-                    "Updated vehicle summary for %s (%d devices, %d connected)",
-                    vehicle_id,
-                    total_devices,
-                    connected_count,
-                )
-
-        except Exception:
+        except _HANDLER_ERRORS:
             self.logger.exception(
                 "Failed to update vehicle summary for %s",
                 vehicle_id,
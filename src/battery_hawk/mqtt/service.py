@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from typing import TYPE_CHECKING, Any
 
 from battery_hawk_driver.base.protocol import BatteryInfo, DeviceStatus
@@ -19,7 +20,7 @@ if TYPE_CHECKING:
 
     from .topics import MQTTTopics
 
-from .client import MQTTEventHandler, MQTTInterface, MQTTPublisher
+from .client import TELEMETRY_QOS, MQTTEventHandler, MQTTInterface, MQTTPublisher
 
 
 class MQTTService:
@@ -61,15 +62,52 @@ class MQTTService:
 
         # Service state
         self.running = False
-        self.tasks: list[asyncio.Task] = []
+        # Running background tasks; each removes itself when it finishes
+        self.tasks: set[asyncio.Task] = set()
+        # Supervisor task owning the TaskGroup the background tasks run in
+        self._background: asyncio.Task | None = None
+        # Set by stop() to wake background loops out of their interval waits
+        self._stop_event = asyncio.Event()
+        # Event loop time at which the service was started, for uptime reporting
+        self._started_at = 0.0
 
         # Get MQTT configuration
         self._mqtt_config = config_manager.get_config("system").get("mqtt", {})
+        # Settings read by the background loops, resolved once
+        self._enabled = bool(self._mqtt_config.get("enabled", False))
+        self._status_interval = self._mqtt_config.get(
+            "status_interval",
+            300,
+        )  # 5 minutes default
+        # Unchanged periodic status is still republished at least this often
+        self._status_force_interval = self._mqtt_config.get(
+            "status_force_interval",
+            3600,
+        )
+        # Device/task counts of the last periodic status and when it was sent
+        self._last_status_counts: tuple[int, int, int] | None = None
+        self._last_status_publish = float("-inf")
+        # Connection monitor backoff, sharing the client's reconnection settings
+        self._backoff_multiplier = self._mqtt_config.get("backoff_multiplier", 2.0)
+        self._max_monitor_delay = self._mqtt_config.get("max_retry_delay", 300.0)
+        self._jitter_factor = self._mqtt_config.get("jitter_factor", 0.1)
+
+        # Constant part of the initial system status payload
+        self._status_template: dict[str, Any] = {
+            "status": "running",
+            "mqtt_enabled": True,
+            "service_version": "1.0.0",
+            "components": {
+                "mqtt_interface": "active",
+                "mqtt_publisher": "active",
+                "mqtt_event_handler": "active",
+            },
+        }
 
     @property
     def enabled(self) -> bool:
         """Check if MQTT service is enabled."""
-        return self._mqtt_config.get("enabled", False)
+        return self._enabled
 
     @property
     def connected(self) -> bool:
@@ -102,6 +140,11 @@ class MQTTService:
         try:
             self.logger.info("Starting MQTT service")
             self.running = True
+            self._stop_event.clear()
+            self._started_at = asyncio.get_running_loop().time()
+            # The first periodic status after a (re)start is always published
+            self._last_status_counts = None
+            self._last_status_publish = float("-inf")
 
             # Connect to MQTT broker
             await self.mqtt_interface.connect()
@@ -148,16 +191,22 @@ class MQTTService:
 
         self.logger.info("Stopping MQTT service")
         self.running = False
+        self._stop_event.set()
 
         try:
-            # Cancel background tasks
-            for task in self.tasks:
-                if not task.done():
-                    task.cancel()
-
-            # Wait for tasks to complete
-            if self.tasks:
-                await asyncio.gather(*self.tasks, return_exceptions=True)
+            # Cancelling the supervisor cancels and joins every background task;
+            # there is nothing to wait for if it already finished
+            background, self._background = self._background, None
+            if background is not None:
+                if not background.done():
+                    background.cancel()
+                    await asyncio.wait([background])
+                if not background.cancelled() and background.exception() is not None:
+                    self.logger.error(
+                        "MQTT background tasks failed",
+                        exc_info=background.exception(),
+                    )
+            self.tasks.clear()
 
             # Unregister event handlers
             if self.core_engine:
@@ -211,40 +260,41 @@ class MQTTService:
 
     async def _start_background_tasks(self) -> None:
         """Start background tasks for the MQTT service."""
-        # Start periodic status publishing
-        self.tasks.append(asyncio.create_task(self._periodic_status_publisher()))
+        self._background = asyncio.create_task(self._run_background_tasks())
 
-        # Start connection monitoring
-        self.tasks.append(asyncio.create_task(self._connection_monitor()))
+    async def _run_background_tasks(self) -> None:
+        """
+        Run the service's background tasks in a single TaskGroup.
 
-        self.logger.debug("Started MQTT background tasks")
+        Cancelling this task cancels every task in the group and returns once
+        all of them have finished.
+        """
+        async with asyncio.TaskGroup() as tg:
+            for coro in (
+                # Periodic status publishing
+                self._periodic_status_publisher(),
+                # Connection monitoring
+                self._connection_monitor(),
+            ):
+                task = tg.create_task(coro)
+                self.tasks.add(task)
+                task.add_done_callback(self.tasks.discard)
+
+            self.logger.debug("Started MQTT background tasks")
 
     async def _publish_initial_status(self) -> None:
         """Publish initial system status."""
         try:
-            status_data = {
-                "status": "running",
-                "mqtt_enabled": True,
-                "mqtt_connected": self.connected,
-                "service_version": "1.0.0",
-                "components": {
-                    "mqtt_interface": "active",
-                    "mqtt_publisher": "active",
-                    "mqtt_event_handler": "active",
-                },
-            }
+            status_data = {**self._status_template, "mqtt_connected": self.connected}
 
             if self.core_engine:
                 # Add core engine status if available
+                registry = self.core_engine.device_registry
                 status_data.update(
                     {
                         "core_engine": "active",
-                        "total_devices": len(
-                            self.core_engine.device_registry.get_all_devices(),
-                        ),
-                        "configured_devices": len(
-                            self.core_engine.device_registry.get_configured_devices(),
-                        ),
+                        "total_devices": registry.count_all(),
+                        "configured_devices": registry.count_configured(),
                     },
                 )
 
@@ -266,6 +316,7 @@ class MQTTService:
                 return
             # Iterate all devices in the registry
             registry = self.core_engine.device_registry
+            messages = []
             for device in registry.get_all_devices():
                 mac = device.get("mac_address")
                 if not mac:
@@ -291,88 +342,153 @@ class MQTTService:
                         )
                 # Latest reading snapshot (dict or BatteryInfo-like)
                 latest_reading = device.get("latest_reading")
-                await self.mqtt_publisher.publish_device_status(
-                    device_id=mac,
-                    status=status,
-                    device_type=device.get("device_type"),
-                    vehicle_id=device.get("vehicle_id"),
-                    reading=latest_reading,
+                messages.append(
+                    self.mqtt_publisher.device_status_message(
+                        mac,
+                        status,
+                        device_type=device.get("device_type"),
+                        vehicle_id=device.get("vehicle_id"),
+                        reading=latest_reading,
+                    ),
                 )
+
+            # Send the whole snapshot as one batch rather than one round trip
+            # per device
+            await self.mqtt_publisher.publish_batch(messages)
             self.logger.debug(
                 "Published retained status for %d devices",
-                len(registry.get_all_devices()),
+                registry.count_all(),
             )
         except Exception:
             self.logger.exception("Failed to publish all device statuses")
 
     async def _periodic_status_publisher(self) -> None:
         """Periodically publish system status."""
-        status_interval = self._mqtt_config.get(
-            "status_interval",
-            300,
-        )  # 5 minutes default
+        status_interval = self._status_interval
+        loop = asyncio.get_running_loop()
 
         while self.running:
+            if await self._wait_for_stop(status_interval):
+                break
+
             try:
-                await asyncio.sleep(status_interval)
+                # Skip building a snapshot that would only be queued; the next
+                # interval after reconnecting publishes a fresh one
+                if not self.connected:
+                    continue
+
+                now = loop.time()
+                counts = None
+                if self.core_engine:
+                    registry = self.core_engine.device_registry
+                    counts = (
+                        registry.count_all(),
+                        registry.count_configured(),
+                        len(self.core_engine.polling_tasks),
+                    )
 
-                if not self.running:
-                    break
+                # Uptime and MQTT counters move every tick, so only the counts
+                # decide whether there is anything new to report
+                if (
+                    counts == self._last_status_counts
+                    and now - self._last_status_publish < self._status_force_interval
+                ):
+                    self.logger.debug("System status unchanged, skipping publish")
+                    continue
 
                 # Publish periodic status update
                 status_data = {
                     "status": "running",
-                    "uptime": asyncio.get_event_loop().time(),
+                    "uptime": now - self._started_at,
                     "mqtt_connected": self.connected,
                     "mqtt_stats": self.mqtt_interface.stats,
                 }
 
-                if self.core_engine:
+                if counts is not None:
                     # Add core engine metrics
+                    total, configured, polling = counts
                     status_data.update(
                         {
-                            "total_devices": len(
-                                self.core_engine.device_registry.get_all_devices(),
-                            ),
-                            "configured_devices": len(
-                                self.core_engine.device_registry.get_configured_devices(),
-                            ),
-                            "active_polling_tasks": len(self.core_engine.polling_tasks),
+                            "total_devices": total,
+                            "configured_devices": configured,
+                            "active_polling_tasks": polling,
                         },
                     )
 
-                await self.mqtt_publisher.publish_system_status(status_data)
+                await self.mqtt_publisher.publish_system_status(
+                    status_data,
+                    qos=TELEMETRY_QOS,
+                )
+                self._last_status_counts = counts
+                self._last_status_publish = now
                 self.logger.debug("Published periodic system status")
 
-            except asyncio.CancelledError:
-                break
             except Exception:
                 self.logger.exception("Error in periodic status publisher")
                 # Continue running despite errors
 
+    async def _wait_for_stop(self, interval: float) -> bool:
+        """
+        Wait for the service to be stopped, for at most ``interval`` seconds.
+
+        Returns:
+            True if stop() was called, False if the timeout elapsed first.
+        """
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), interval)
+        except TimeoutError:
+            return False
+        return True
+
+    def _monitor_delay(self, check_interval: float, failures: int) -> float:
+        """Calculate the connection monitor's next wait with backoff and jitter."""
+        delay = min(
+            check_interval * (self._backoff_multiplier**failures),
+            max(self._max_monitor_delay, check_interval),
+        )
+
+        # Add jitter so many instances do not retry against the broker in step
+        return delay + delay * self._jitter_factor * (0.5 - time.monotonic() % 1)
+
     async def _connection_monitor(self) -> None:
         """Monitor MQTT connection and handle reconnections."""
-        check_interval = 30  # Check every 30 seconds
+        check_interval = 30.0  # Check every 30 seconds while healthy
+        stable_period = 300.0  # Connected this long before the backoff resets
+        loop = asyncio.get_running_loop()
+        failures = 0
+        connected_since: float | None = None
 
         while self.running:
-            try:
-                await asyncio.sleep(check_interval)
+            if await self._wait_for_stop(
+                self._monitor_delay(check_interval, failures),
+            ):
+                break
 
-                if not self.running:
-                    break
+            try:
+                if self.connected:
+                    now = loop.time()
+                    if connected_since is None:
+                        connected_since = now
+                    elif failures and now - connected_since >= stable_period:
+                        failures = 0
+                    continue
+                connected_since = None
 
                 # Check connection status
-                if not self.connected and self.enabled:
+                if self.enabled:
                     self.logger.warning("MQTT connection lost, attempting reconnection")
                     try:
                         await self.mqtt_interface.connect()
-                        if self.connected:
-                            self.logger.info("MQTT connection restored")
                     except Exception:
                         self.logger.exception("Failed to reconnect to MQTT")
+                    if self.connected:
+                        self.logger.info("MQTT connection restored")
+                        connected_since = loop.time()
+                    else:
+                        # Back off further while the broker stays unreachable
+                        # (bounded so the exponent cannot overflow)
+                        failures = min(failures + 1, 32)
 
-            except asyncio.CancelledError:
-                break
             except Exception:
                 self.logger.exception("Error in connection monitor")
 
@@ -396,9 +512,8 @@ class MQTTService:
 
         try:
             # Convert reading_data to BatteryInfo if needed
-
             if isinstance(reading_data, dict):
-                reading = BatteryInfo(**reading_data)
+                reading = BatteryInfo.from_mapping(reading_data)
             else:
                 reading = reading_data
 
@@ -431,9 +546,8 @@ class MQTTService:
 
         try:
             # Convert status_data to DeviceStatus if needed
-
             if isinstance(status_data, dict):
-                status = DeviceStatus(**status_data)
+                status = DeviceStatus.from_mapping(status_data)
             else:
                 status = status_data
 
@@ -9,10 +9,21 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
-@dataclass
+# Validation patterns, compiled once at import
+_MAC_ADDRESS_RE = re.compile(r"^([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})$")
+# Vehicle IDs should be alphanumeric with underscores/hyphens
+_VEHICLE_ID_RE = re.compile(r"^[a-zA-Z0-9_-]+$")
+
+# (qos, retain) reported for topics without a pattern definition
+_DEFAULT_QOS_RETAIN = (1, False)
+
+
+@dataclass(slots=True)
 class TopicInfo:
     """Information about an MQTT topic."""
 
@@ -35,6 +46,16 @@ class MQTTTopics:
     - battery_hawk/discovery/found          # New device discovered
     """
 
+    __slots__ = (
+        "_id_topic_re",
+        "_plain_topic_re",
+        "_prefix_slash",
+        "_qos_retain",
+        "_subscription_topics",
+        "_topic_patterns",
+        "prefix",
+    )
+
     def __init__(self, prefix: str = "battery_hawk") -> None:
         """
         Initialize topic helper with configurable prefix.
@@ -43,7 +64,31 @@ class MQTTTopics:
             prefix: Topic prefix (default: "battery_hawk")
         """
         self.prefix = prefix
+        self._prefix_slash = f"{prefix}/"
         self._topic_patterns = self._build_topic_patterns()
+        # (qos, retain) per pattern key, resolved in one lookup by parse_topic
+        self._qos_retain = {
+            key: (info.qos, info.retain) for key, info in self._topic_patterns.items()
+        }
+
+        # Structural patterns for parse_topic; any segments after the topic
+        # type are ignored
+        escaped = re.escape(prefix)
+        self._id_topic_re = re.compile(
+            rf"{escaped}/(device|vehicle)/([^/]*)/([^/]*)(?:/|$)",
+        )
+        self._plain_topic_re = re.compile(
+            rf"{escaped}/(system|discovery)/([^/]*)(?:/|$)"
+        )
+
+        # The prefix is fixed, so the subscription set is built once
+        self._subscription_topics = (
+            self.all_device_readings(),
+            self.all_device_status(),
+            self.all_vehicle_summaries(),
+            self.system_status(),
+            self.discovery_found(),
+        )
 
     def _build_topic_patterns(self) -> dict[str, TopicInfo]:
         """Build topic pattern definitions."""
@@ -145,77 +190,39 @@ class MQTTTopics:
         Returns:
             Dictionary with topic information or None if not recognized
         """
-        # Remove prefix if present
-        if topic.startswith(f"{self.prefix}/"):
-            topic_path = topic[len(f"{self.prefix}/") :]
-        else:
-            return None
-
-        # Parse different topic types
-        parts = topic_path.split("/")
-
-        # Constants for topic parsing
-        min_device_parts = 3
-        min_vehicle_parts = 3
-        min_system_parts = 2
-        min_discovery_parts = 2
-
-        if len(parts) >= min_device_parts and parts[0] == "device":
-            mac_address = parts[1]
-            topic_type = parts[2]
-            return {
-                "category": "device",
-                "mac_address": mac_address,
-                "topic_type": topic_type,
-                "full_topic": topic,
-                "qos": self._get_qos_for_topic_type(f"device_{topic_type}"),
-                "retain": self._get_retain_for_topic_type(f"device_{topic_type}"),
-            }
-
-        if len(parts) >= min_vehicle_parts and parts[0] == "vehicle":
-            vehicle_id = parts[1]
-            topic_type = parts[2]
-            return {
-                "category": "vehicle",
-                "vehicle_id": vehicle_id,
-                "topic_type": topic_type,
-                "full_topic": topic,
-                "qos": self._get_qos_for_topic_type(f"vehicle_{topic_type}"),
-                "retain": self._get_retain_for_topic_type(f"vehicle_{topic_type}"),
-            }
-
-        if len(parts) >= min_system_parts and parts[0] == "system":
-            topic_type = parts[1]
+        match = self._id_topic_re.match(topic)
+        if match is not None:
+            category, topic_id, topic_type = match.groups()
+            qos, retain = self._qos_retain.get(
+                f"{category}_{topic_type}",
+                _DEFAULT_QOS_RETAIN,
+            )
             return {
-                "category": "system",
+                "category": category,
+                "mac_address" if category == "device" else "vehicle_id": topic_id,
                 "topic_type": topic_type,
                 "full_topic": topic,
-                "qos": self._get_qos_for_topic_type(f"system_{topic_type}"),
-                "retain": self._get_retain_for_topic_type(f"system_{topic_type}"),
+                "qos": qos,
+                "retain": retain,
             }
 
-        if len(parts) >= min_discovery_parts and parts[0] == "discovery":
-            topic_type = parts[1]
+        match = self._plain_topic_re.match(topic)
+        if match is not None:
+            category, topic_type = match.groups()
+            qos, retain = self._qos_retain.get(
+                f"{category}_{topic_type}",
+                _DEFAULT_QOS_RETAIN,
+            )
             return {
-                "category": "discovery",
+                "category": category,
                 "topic_type": topic_type,
                 "full_topic": topic,
-                "qos": self._get_qos_for_topic_type(f"discovery_{topic_type}"),
-                "retain": self._get_retain_for_topic_type(f"discovery_{topic_type}"),
+                "qos": qos,
+                "retain": retain,
             }
 
         return None
 
-    def _get_qos_for_topic_type(self, topic_type: str) -> int:
-        """Get QoS level for topic type."""
-        topic_info = self._topic_patterns.get(topic_type)
-        return topic_info.qos if topic_info else 1
-
-    def _get_retain_for_topic_type(self, topic_type: str) -> bool:
-        """Get retain flag for topic type."""
-        topic_info = self._topic_patterns.get(topic_type)
-        return topic_info.retain if topic_info else False
-
     def get_topic_info(self, topic_type: str) -> TopicInfo | None:
         """Get topic information for a specific topic type."""
         return self._topic_patterns.get(topic_type)
@@ -226,27 +233,134 @@ class MQTTTopics:
 
     def validate_mac_address(self, mac_address: str) -> bool:
         """Validate MAC address format."""
-        mac_pattern = re.compile(r"^([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})$")
-        return bool(mac_pattern.match(mac_address))
+        return _MAC_ADDRESS_RE.match(mac_address) is not None
 
     def validate_vehicle_id(self, vehicle_id: str) -> bool:
         """Validate vehicle ID format."""
-        # Vehicle IDs should be alphanumeric with underscores/hyphens
-        return bool(re.match(r"^[a-zA-Z0-9_-]+$", vehicle_id))
+        return _VEHICLE_ID_RE.match(vehicle_id) is not None
 
     def is_battery_hawk_topic(self, topic: str) -> bool:
         """Check if topic belongs to Battery Hawk."""
-        return topic.startswith(f"{self.prefix}/")
+        return topic.startswith(self._prefix_slash)
 
     def get_subscription_topics(self) -> list[str]:
         """Get list of topics for subscribing to all Battery Hawk messages."""
-        return [
-            self.all_device_readings(),
-            self.all_device_status(),
-            self.all_vehicle_summaries(),
-            self.system_status(),
-            self.discovery_found(),
-        ]
+        return list(self._subscription_topics)
+
+
+class _TopicNode:
+    """Node in the topic filter trie, one per topic level."""
+
+    __slots__ = ("children", "handler")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TopicNode] = {}
+        self.handler: Callable[[str, str], None] | None = None
+
+
+class TopicMatcher:
+    """
+    Map MQTT topic filters (with ``+``/``#`` wildcards) to message handlers.
+
+    Filters are stored in a trie keyed by topic level, so matching an incoming
+    topic costs one descent per level instead of a scan over every subscription.
+    Each filter holds a single handler; adding the same filter again replaces it.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty matcher."""
+        self._root = _TopicNode()
+        self._filters: dict[str, Callable[[str, str], None]] = {}
+
+    def add(self, topic_filter: str, handler: Callable[[str, str], None]) -> None:
+        """Register a handler for a topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            child = node.children.get(level)
+            if child is None:
+                child = node.children[level] = _TopicNode()
+            node = child
+        node.handler = handler
+        self._filters[topic_filter] = handler
+
+    def remove(self, topic_filter: str) -> Callable[[str, str], None] | None:
+        """Remove a topic filter, returning its handler if it was registered."""
+        handler = self._filters.pop(topic_filter, None)
+        if handler is None:
+            return None
+
+        # Walk down recording the path so empty branches can be pruned
+        path: list[tuple[_TopicNode, str]] = []
+        node = self._root
+        for level in topic_filter.split("/"):
+            path.append((node, level))
+            node = node.children[level]
+        node.handler = None
+        for parent, level in reversed(path):
+            child = parent.children[level]
+            if child.handler is not None or child.children:
+                break
+            del parent.children[level]
+        return handler
+
+    def match(self, topic: str) -> list[Callable[[str, str], None]]:
+        """Return the handlers whose filters match a concrete topic."""
+        levels = topic.split("/")
+        handlers: list[Callable[[str, str], None]] = []
+        # Per the MQTT spec, wildcards at the first level do not match "$" topics
+        self._match(
+            self._root, levels, 0, handlers, wildcards=not topic.startswith("$")
+        )
+
+        # The same handler may be registered under overlapping filters
+        if len(handlers) > 1:
+            handlers = list(dict.fromkeys(handlers))
+        return handlers
+
+    def _match(
+        self,
+        node: _TopicNode,
+        levels: list[str],
+        index: int,
+        handlers: list[Callable[[str, str], None]],
+        *,
+        wildcards: bool = True,
+    ) -> None:
+        children = node.children
+        if wildcards:
+            multi = children.get("#")
+            if multi is not None and multi.handler is not None:
+                handlers.append(multi.handler)
+
+        if index == len(levels):
+            if node.handler is not None:
+                handlers.append(node.handler)
+            return
+
+        child = children.get(levels[index])
+        if child is not None:
+            self._match(child, levels, index + 1, handlers)
+        if wildcards:
+            single = children.get("+")
+            if single is not None:
+                self._match(single, levels, index + 1, handlers)
+
+    def get(self, topic_filter: str) -> Callable[[str, str], None] | None:
+        """Get the handler registered for an exact topic filter."""
+        return self._filters.get(topic_filter)
+
+    def clear(self) -> None:
+        """Remove all topic filters."""
+        self._root = _TopicNode()
+        self._filters.clear()
+
+    def __contains__(self, topic_filter: object) -> bool:
+        """Check whether a topic filter is registered."""
+        return topic_filter in self._filters
+
+    def __len__(self) -> int:
+        """Return the number of registered topic filters."""
+        return len(self._filters)
 
 
 # Default instance with standard prefix
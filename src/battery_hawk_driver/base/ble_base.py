@@ -53,6 +53,9 @@ Best Practices:
 
 from __future__ import annotations
 
+from collections import defaultdict
+from typing import TYPE_CHECKING
+
 from .connection import BLEConnectionPool
 from .discovery import BLEDiscoveryService
 from .protocol import (
@@ -60,9 +63,49 @@ from .protocol import (
     BatteryInfo,
     DeviceStatus,
 )
-from .retry import CircuitBreaker, retry_async
+from .retry import CircuitBreaker, CircuitBreakerOpenError, retry_async
 from .state import ConnectionState, ConnectionStateManager
 
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+
+class DummyDevice(BaseMonitorDevice):
+    """Placeholder protocol used by BLEManager.connect until device types are selected."""
+
+    @property
+    def protocol_version(self) -> str:
+        """Return the protocol version."""
+        return "1.0"
+
+    @property
+    def capabilities(self) -> set[str]:
+        """Return the supported capabilities."""
+        return {"read_data"}
+
+    async def connect(self) -> None:
+        """Connect (no-op; the pool owns the BLE link)."""
+
+    async def disconnect(self) -> None:
+        """Disconnect (no-op; the pool owns the BLE link)."""
+
+    async def read_data(self) -> BatteryInfo:
+        """Return a fixed battery reading."""
+        return BatteryInfo(
+            voltage=12.5,
+            current=1.1,
+            temperature=25.0,
+            state_of_charge=80.0,
+        )
+
+    async def send_command(
+        self,
+        command: str,
+        params: dict | None = None,  # noqa: ARG002
+    ) -> DeviceStatus:
+        """Acknowledge a command with a connected status."""
+        return DeviceStatus(connected=True, last_command=command)
+
 
 class BLEManager:
     """
@@ -84,11 +127,21 @@ class BLEManager:
         self.config = config_manager
         self.discovery = BLEDiscoveryService(config_manager)
         self.pool = BLEConnectionPool(config_manager)
-        self.circuit_breaker = CircuitBreaker()
+        self.pool.device_lookup = self.discovery.get_ble_device
+        # One breaker per device so a single flaky battery cannot block the fleet
+        self._breakers: defaultdict[str, CircuitBreaker] = defaultdict(CircuitBreaker)
         self.device_states: dict[str, ConnectionStateManager] = {}
         self.device_protocols: dict[str, BaseMonitorDevice] = {}
         # Device protocol factory/registry could be injected for extensibility
 
+        # Retry-wrapped operations, built once rather than on every call
+        self._wrapped_connect: dict[str, Callable[[str], Awaitable[object]]] = {}
+        self._wrapped_read: dict[str, Callable[[], Awaitable[BatteryInfo]]] = {}
+        self._wrapped_cmd: dict[
+            str,
+            Callable[[str, dict | None], Awaitable[DeviceStatus]],
+        ] = {}
+
     async def scan_for_devices(self, duration: int = 10) -> dict[str, dict]:
         """
         Scan for BLE devices and return discovered device metadata.
@@ -118,50 +171,30 @@ class BLEManager:
             The default implementation uses a DummyDevice. For real devices, extend this method.
         """
         # Pool manages connection concurrency
-        await retry_async(circuit_breaker=self.circuit_breaker)(self.pool.connect)(
-            device_address,
-        )
+        breaker = self._breakers[device_address]
+        retrying_connect = self._wrapped_connect.get(device_address)
+        if retrying_connect is None:
+            retrying_connect = self._wrapped_connect[device_address] = retry_async(
+                circuit_breaker=breaker,
+            )(self.pool.connect)
+        await retrying_connect(device_address)
         # Create or get protocol instance
-        if device_address not in self.device_protocols:
+        proto = self.device_protocols.get(device_address)
+        if proto is None:
             # For demo, use a dummy protocol; in real code, select based on device type
-            class DummyDevice(BaseMonitorDevice):
-                @property
-                def protocol_version(self) -> str:
-                    return "1.0"
-
-                @property
-                def capabilities(self) -> set[str]:
-                    return {"read_data"}
-
-                async def connect(self) -> None:
-                    pass
-
-                async def disconnect(self) -> None:
-                    pass
-
-                async def read_data(self) -> BatteryInfo:
-                    return BatteryInfo(
-                        voltage=12.5,
-                        current=1.1,
-                        temperature=25.0,
-                        state_of_charge=80.0,
-                    )
-
-                async def send_command(
-                    self,
-                    command: str,
-                    params: dict | None = None,  # noqa: ARG002
-                ) -> DeviceStatus:
-                    return DeviceStatus(connected=True, last_command=command)
-
-            self.device_protocols[device_address] = DummyDevice(device_address)
-        # State manager
-        if device_address not in self.device_states:
-            self.device_states[device_address] = ConnectionStateManager()
-            await self.device_states[device_address].set_state(
-                ConnectionState.CONNECTED,
+            proto = self.device_protocols[device_address] = DummyDevice(device_address)
+        if device_address not in self._wrapped_read:
+            retry = retry_async(circuit_breaker=breaker)
+            self._wrapped_read[device_address] = retry(proto.read_data)
+            self._wrapped_cmd[device_address] = retry(proto.send_command)
+        # State manager; kept across reconnects so the history stays whole
+        state_manager = self.device_states.get(device_address)
+        if state_manager is None:
+            state_manager = self.device_states[device_address] = (
+                ConnectionStateManager()
             )
-        return self.device_protocols[device_address]
+        await state_manager.set_state(ConnectionState.CONNECTED)
+        return proto
 
     async def disconnect(self, device_address: str) -> None:
         """
@@ -171,12 +204,24 @@ class BLEManager:
             device_address: MAC address of the device.
         """
         await self.pool.disconnect(device_address)
-        if device_address in self.device_protocols:
-            await self.device_protocols[device_address].disconnect()
-        if device_address in self.device_states:
-            await self.device_states[device_address].set_state(
-                ConnectionState.DISCONNECTED,
-            )
+        # Drop per-connection objects so they do not pile up for every device
+        # ever seen; connect() builds fresh ones. The state manager stays so
+        # get_device_history() still covers past connections.
+        self._wrapped_read.pop(device_address, None)
+        self._wrapped_cmd.pop(device_address, None)
+        proto = self.device_protocols.pop(device_address, None)
+        if proto is not None:
+            await proto.disconnect()
+        state_manager = self.device_states.get(device_address)
+        if state_manager is not None:
+            await state_manager.set_state(ConnectionState.DISCONNECTED)
+
+    def _check_circuit(self, device_address: str) -> None:
+        """Fail fast, without entering the retry wrapper, while the breaker is open."""
+        breaker = self._breakers.get(device_address)
+        if breaker is not None and breaker.is_open():
+            msg = f"Circuit breaker open for {device_address}"
+            raise CircuitBreakerOpenError(msg)
 
     async def read_data(self, device_address: str) -> BatteryInfo:
         """
@@ -190,11 +235,10 @@ class BLEManager:
 
         Raises:
             BLERetryError: If read fails after retries.
+            CircuitBreakerOpenError: If the circuit breaker is open.
         """
-        proto = self.device_protocols[device_address]
-        return await retry_async(circuit_breaker=self.circuit_breaker)(
-            proto.read_data,
-        )()
+        self._check_circuit(device_address)
+        return await self._wrapped_read[device_address]()
 
     async def send_command(
         self,
@@ -215,11 +259,10 @@ class BLEManager:
 
         Raises:
             BLERetryError: If command fails after retries.
+            CircuitBreakerOpenError: If the circuit breaker is open.
         """
-        proto = self.device_protocols[device_address]
-        return await retry_async(circuit_breaker=self.circuit_breaker)(
-            proto.send_command,
-        )(command, params)
+        self._check_circuit(device_address)
+        return await self._wrapped_cmd[device_address](command, params)
 
     def get_device_state(self, device_address: str) -> ConnectionState:
         """
@@ -231,9 +274,10 @@ class BLEManager:
         Returns:
             ConnectionState enum value (e.g., CONNECTED, DISCONNECTED).
         """
-        if device_address in self.device_states:
-            return self.device_states[device_address].state
-        return ConnectionState.DISCONNECTED
+        state_manager = self.device_states.get(device_address)
+        if state_manager is None:
+            return ConnectionState.DISCONNECTED
+        return state_manager.state
 
     def get_device_history(self, device_address: str, limit: int = 20) -> list:
         """
@@ -246,6 +290,7 @@ class BLEManager:
         Returns:
             List of (state, timestamp) tuples.
         """
-        if device_address in self.device_states:
-            return self.device_states[device_address].get_state_history(limit)
-        return []
+        state_manager = self.device_states.get(device_address)
+        if state_manager is None:
+            return []
+        return state_manager.get_state_history(limit)
@@ -3,9 +3,13 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import heapq
+import itertools
 import logging
 import time
-from typing import TYPE_CHECKING, Any
+from collections import deque
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -22,6 +26,14 @@ except ImportError:
 
 from .state import ConnectionState, ConnectionStateManager
 
+# Default number of connect/disconnect events kept in
+# BLEConnectionPool.connection_history (bluetooth "history_size" setting)
+CONNECTION_HISTORY_SIZE = 256
+# Most recent history events included in get_connection_stats()
+STATS_HISTORY_EVENTS = 20
+# Seconds shutdown() waits for pool tasks to finish before cancelling them
+SHUTDOWN_TIMEOUT = 5.0
+
 # Global semaphore to coordinate BLE scanning operations
 # This prevents multiple scanning operations from running simultaneously
 # which causes "Operation already in progress" errors in BlueZ
@@ -36,6 +48,16 @@ def get_ble_scan_semaphore() -> asyncio.Semaphore:
     return _ble_scan_semaphore
 
 
+class ConnectionEvent(NamedTuple):
+    """Connect/disconnect event recorded in BLEConnectionPool.connection_history."""
+
+    event: str
+    device_address: str
+    timestamp: float
+    success: bool
+    error: str | None = None
+
+
 class BLEConnectionError(Exception):
     """Exception raised when BLE connection operations fail."""
 
@@ -194,26 +216,50 @@ class BLEConnectionPool:
             test_mode: If True, use mock connections instead of real BLE connections.
         """
         self.config = config_manager
-        self.max_connections: int = self.config.get_config("system")["bluetooth"].get(
+        # Fetch the bluetooth section once and read every setting from it
+        bluetooth_config = self.config.get_config("system")["bluetooth"]
+        self.max_connections: int = bluetooth_config.get(
             "max_concurrent_connections",
             3,
         )
+        self.connection_timeout: float = bluetooth_config.get(
+            "connection_timeout",
+            30.0,
+        )  # seconds
         # Optional adapter selection (e.g., 'hci0')
         try:
-            self.adapter: str | None = (
-                self.config.get_config("system").get("bluetooth", {}).get("adapter")
-            )
-        except (AttributeError, TypeError, KeyError):
-            # Be resilient to unexpected config shapes or missing get_config
+            self.adapter: str | None = bluetooth_config.get("adapter")
+        except (AttributeError, TypeError):
+            # Be resilient to unexpected config shapes
             self.adapter = None
         self.active_connections: dict[str, dict] = {}
-        self.connection_queue: asyncio.Queue = asyncio.Queue()
-        self.connection_history: list[dict] = []
+        # Optional address -> Bleak device lookup (e.g. from a discovery scan).
+        # Connecting with a scanned device object skips Bleak's own scan.
+        self.device_lookup: Callable[[str], Any] | None = None
+        # Min-heap of (expires_at, device_address, connected_at_mono) on the
+        # monotonic clock; entries whose connection is gone or was replaced
+        # are skipped when popped
+        self._expiry_heap: list[tuple[float, str, float]] = []
+        # Admission control: one slot per active or in-progress connection.
+        # Waiters are woken in FIFO order as slots are released. Bounded so a
+        # double release raises instead of silently raising the limit.
+        self._slots = asyncio.BoundedSemaphore(self.max_connections)
+        # Addresses waiting for a free slot, oldest first
+        self._waiting: deque[str] = deque()
+        # In-progress connect per address, shared by concurrent callers
+        self._in_flight: dict[str, asyncio.Task] = {}
+        # Bounded so a long-running pool does not accumulate events forever
+        self.connection_history: deque[ConnectionEvent] = deque(
+            maxlen=bluetooth_config.get("history_size", CONNECTION_HISTORY_SIZE),
+        )
         self.logger = logging.getLogger("battery_hawk.ble_connection_pool")
         self._cleanup_task: asyncio.Task | None = None
-        self.connection_timeout: float = 30.0  # seconds
+        # Background reconnects started by the cleanup task
+        self._background_tasks: set[asyncio.Task] = set()
         self._cleanup_interval: float = cleanup_interval
         self._shutdown_event = asyncio.Event()
+        # Wakes the cleanup task early on shutdown or a new earliest expiry
+        self._cleanup_wakeup = asyncio.Event()
         self.test_mode: bool = test_mode
 
         # Connection state management
@@ -229,9 +275,12 @@ class BLEConnectionPool:
 
     def _get_state_manager(self, device_address: str) -> ConnectionStateManager:
         """Get or create a state manager for a device."""
-        if device_address not in self.device_states:
-            self.device_states[device_address] = ConnectionStateManager()
-        return self.device_states[device_address]
+        state_manager = self.device_states.get(device_address)
+        if state_manager is None:
+            state_manager = self.device_states[device_address] = (
+                ConnectionStateManager()
+            )
+        return state_manager
 
     def get_device_state(self, device_address: str) -> ConnectionState:
         """Get the current connection state for a device."""
@@ -250,6 +299,9 @@ class BLEConnectionPool:
     def _start_cleanup_task(self) -> None:
         """Start background task for cleaning up stale connections."""
         if self._cleanup_task is None or self._cleanup_task.done():
+            # Clear a previous shutdown so a restarted task does not exit at once
+            self._shutdown_event.clear()
+            self._cleanup_wakeup.clear()
             self._cleanup_task = asyncio.create_task(self._cleanup_stale_connections())
 
     async def start_cleanup(self) -> None:
@@ -257,38 +309,118 @@ class BLEConnectionPool:
         self._start_cleanup_task()
 
     async def shutdown(self) -> None:
-        """Stop the background cleanup task. Use in tests to avoid pending tasks."""
+        """
+        Stop the cleanup task and any background reconnects.
+
+        Background reconnects are cancelled outright. The cleanup task gets
+        ``SHUTDOWN_TIMEOUT`` seconds to finish its current pass and is then
+        cancelled, so shutdown cannot hang on a stuck disconnect.
+        """
         self._shutdown_event.set()
-        if self._cleanup_task:
-            await self._cleanup_task
+        self._cleanup_wakeup.set()
+        for task in self._background_tasks:
+            task.cancel()
+        tasks = {task for task in self._background_tasks if not task.done()}
+        if self._cleanup_task is not None and not self._cleanup_task.done():
+            tasks.add(self._cleanup_task)
+        if not tasks:
+            return
+        _, pending = await asyncio.wait(tasks, timeout=SHUTDOWN_TIMEOUT)
+        for task in pending:
+            self.logger.warning("Cancelling BLE pool task %s on shutdown", task)
+            task.cancel()
+        if pending:
+            await asyncio.wait(pending)
 
     async def connect(self, device_address: str) -> dict:
-        """Request a connection to a BLE device. Queues if pool is full."""
+        """Request a connection to a BLE device. Waits for a slot if pool is full."""
         # Start cleanup task if not already started
         if self._cleanup_task is None:
             await self.start_cleanup()
+        return await self._join_or_start_connect(device_address)
+
+    async def _join_or_start_connect(self, device_address: str) -> dict:
+        """
+        Return the device's connection, joining or starting its connect task.
 
-        if device_address in self.active_connections:
-            self.logger.info("Already connected to %s", device_address)
-            return self.active_connections[device_address]
+        connect() and reconnect() both go through here, so overlapping calls
+        for one address share a single attempt and a single pool slot.
+        """
+        conn = self.active_connections.get(device_address)
+        if conn is not None:
+            self.logger.debug("Already connected to %s", device_address)
+            return conn
 
         # Check if connection is already in progress
-        if device_address in self._pending_connections:
+        task = self._in_flight.get(device_address)
+        if task is not None and not task.done():
             self.logger.info(
-                "Connection already in progress for %s, queuing",
+                "Connection already in progress for %s, waiting",
                 device_address,
             )
-            future = asyncio.Future()
-            await self.connection_queue.put((device_address, future))
-            return await future
+        else:
+            task = asyncio.create_task(self._admit_connection(device_address))
+            self._in_flight[device_address] = task
+            task.add_done_callback(
+                functools.partial(self._in_flight_done, device_address),
+            )
 
-        if len(self.active_connections) >= self.max_connections:
+        # Shielded so one caller giving up does not abort the attempt for others
+        return await asyncio.shield(task)
+
+    def _in_flight_done(self, device_address: str, task: asyncio.Task) -> None:
+        """Drop a finished connect from the in-flight map."""
+        if self._in_flight.get(device_address) is task:
+            del self._in_flight[device_address]
+        # _create_connection has already logged any failure; mark it retrieved
+        # in case every caller stopped waiting
+        if not task.cancelled():
+            task.exception()
+
+    async def _admit_connection(self, device_address: str) -> dict:
+        """Wait for a free connection slot, then connect while holding it."""
+        queued = self._slots.locked()
+        if queued:
             self.logger.info("Max connections reached, queuing %s", device_address)
-            future = asyncio.Future()
-            await self.connection_queue.put((device_address, future))
-            return await future
+            self._waiting.append(device_address)
+        try:
+            await self._slots.acquire()
+        finally:
+            if queued:
+                self._waiting.remove(device_address)
 
-        return await self._create_connection(device_address)
+        # Another path (e.g. a reconnect) may have connected it meanwhile
+        conn = self.active_connections.get(device_address)
+        if conn is not None:
+            self._slots.release()
+            return conn
+
+        try:
+            return await self._create_connection(device_address)
+        except BaseException:
+            # A connection that made it into active_connections keeps its slot
+            # until disconnect() releases it, even if a later step failed
+            if device_address not in self.active_connections:
+                self._slots.release()
+            raise
+
+    def _new_bleak_client(self, target: Any) -> Any:
+        """Create a BleakClient for an address or scanned device object."""
+        # Pass adapter if configured and supported (Linux/BlueZ)
+        if getattr(self, "adapter", None):
+            try:
+                return BleakClient(
+                    target,
+                    timeout=self.connection_timeout,
+                    adapter=self.adapter,  # type: ignore[call-arg]
+                )
+            except TypeError:
+                # Fallback for Bleak versions/backends without adapter kwarg
+                pass
+        return BleakClient(
+            target,
+            timeout=self.connection_timeout,
+        )
 
     async def _create_connection(self, device_address: str) -> dict:  # noqa: PLR0915
         """Create actual BLE connection using BleakClient."""
@@ -305,6 +437,8 @@ class BLEConnectionPool:
         state_manager = self._get_state_manager(device_address)
         await state_manager.set_state(ConnectionState.CONNECTING)
 
+        # A scanned device object if one is known, otherwise the address
+        target: Any = device_address
         try:
             self.logger.info("Creating BLE connection to %s", device_address)
 
@@ -320,25 +454,9 @@ class BLEConnectionPool:
                         "Bleak library is not available",
                         device_address=device_address,
                     )
-                # Pass adapter if configured and supported (Linux/BlueZ)
-                if getattr(self, "adapter", None):
-                    try:
-                        client = BleakClient(
-                            device_address,
-                            timeout=self.connection_timeout,
-                            adapter=self.adapter,  # type: ignore[call-arg]
-                        )
-                    except TypeError:
-                        # Fallback for Bleak versions/backends without adapter kwarg
-                        client = BleakClient(
-                            device_address,
-                            timeout=self.connection_timeout,
-                        )
-                else:
-                    client = BleakClient(
-                        device_address,
-                        timeout=self.connection_timeout,
-                    )
+                if self.device_lookup is not None:
+                    target = self.device_lookup(device_address) or device_address
+                client = self._new_bleak_client(target)
 
             # Attempt to connect using semaphore to coordinate BLE scanning
             # This prevents "Operation already in progress" errors when multiple
@@ -349,7 +467,20 @@ class BLEConnectionPool:
                     "Acquired BLE scan semaphore for connection to %s",
                     device_address,
                 )
-                await client.connect()
+                try:
+                    await client.connect()
+                except BleakError:
+                    if target is device_address:
+                        raise
+                    # The scanned device object may be stale (e.g. BlueZ has
+                    # since removed it); let Bleak find the device by address
+                    self.logger.warning(
+                        "Connecting to %s via its scanned device failed, "
+                        "retrying by address",
+                        device_address,
+                    )
+                    client = self._new_bleak_client(device_address)
+                    await client.connect()
 
             # Verify connection was successful
             if not client.is_connected:
@@ -362,16 +493,28 @@ class BLEConnectionPool:
             self.logger.info("Successfully connected to BLE device %s", device_address)
 
             # Create connection dictionary with BleakClient instance
+            connected_at = time.time()
+            # Monotonic twin of connected_at for timeout and age arithmetic
+            connected_mono = time.monotonic()
             conn = {
                 "device_address": device_address,
                 "client": client,
-                "connected_at": time.time(),
+                "connected_at": connected_at,
+                "connected_at_mono": connected_mono,
                 "notifications": {},  # Track active notifications
                 "is_connected": True,
             }
 
-            # Store in active connections
+            # Store in active connections and schedule its expiry
             self.active_connections[device_address] = conn
+            expiry = (
+                connected_mono + self.connection_timeout,
+                device_address,
+                connected_mono,
+            )
+            heapq.heappush(self._expiry_heap, expiry)
+            if self._expiry_heap[0] is expiry:
+                self._cleanup_wakeup.set()
 
             # Remove from pending connections
             self._pending_connections.discard(device_address)
@@ -379,14 +522,9 @@ class BLEConnectionPool:
             # Update state to connected
             await state_manager.set_state(ConnectionState.CONNECTED)
 
-            # Add to connection history
+            # Add to connection history, stamped with the same wall-clock time
             self.connection_history.append(
-                {
-                    "event": "connect",
-                    "device_address": device_address,
-                    "timestamp": time.time(),
-                    "success": True,
-                },
+                ConnectionEvent("connect", device_address, connected_at, success=True),
             )
 
         except TimeoutError as e:
@@ -402,13 +540,13 @@ class BLEConnectionPool:
 
             # Add failed connection to history
             self.connection_history.append(
-                {
-                    "event": "connect_failed",
-                    "device_address": device_address,
-                    "timestamp": time.time(),
-                    "error": str(e),
-                    "success": False,
-                },
+                ConnectionEvent(
+                    "connect_failed",
+                    device_address,
+                    time.time(),
+                    success=False,
+                    error=str(e),
+                ),
             )
 
             raise BLEConnectionError(error_msg, device_address=device_address) from e
@@ -426,13 +564,13 @@ class BLEConnectionPool:
 
             # Add failed connection to history
             self.connection_history.append(
-                {
-                    "event": "connect_failed",
-                    "device_address": device_address,
-                    "timestamp": time.time(),
-                    "error": str(e),
-                    "success": False,
-                },
+                ConnectionEvent(
+                    "connect_failed",
+                    device_address,
+                    time.time(),
+                    success=False,
+                    error=str(e),
+                ),
             )
 
             raise BLEConnectionError(error_msg, device_address=device_address) from e
@@ -450,13 +588,13 @@ class BLEConnectionPool:
 
             # Add failed connection to history
             self.connection_history.append(
-                {
-                    "event": "connect_failed",
-                    "device_address": device_address,
-                    "timestamp": time.time(),
-                    "error": str(e),
-                    "success": False,
-                },
+                ConnectionEvent(
+                    "connect_failed",
+                    device_address,
+                    time.time(),
+                    success=False,
+                    error=str(e),
+                ),
             )
 
             raise BLEConnectionError(error_msg, device_address=device_address) from e
@@ -473,14 +611,13 @@ class BLEConnectionPool:
         # This handles cases where connection was interrupted during setup
         self._pending_connections.discard(device_address)
 
-        if device_address not in self.active_connections:
+        conn = self.active_connections.get(device_address)
+        if conn is None:
             self.logger.warning("No active connection found for %s", device_address)
             # Still update state to disconnected
             await state_manager.set_state(ConnectionState.DISCONNECTED)
             return
 
-        conn = self.active_connections[device_address]
-
         try:
             # Stop all active notifications first
             if conn.get("notifications"):
@@ -537,28 +674,15 @@ class BLEConnectionPool:
 
             # Add to connection history
             self.connection_history.append(
-                {
-                    "event": "disconnect",
-                    "device_address": device_address,
-                    "timestamp": time.time(),
-                    "success": True,
-                },
+                ConnectionEvent(
+                    "disconnect", device_address, time.time(), success=True
+                ),
             )
 
             self.logger.info("Cleaned up connection for %s", device_address)
 
-            # Process next in queue if any
-            if not self.connection_queue.empty():
-                future = None
-                try:
-                    queued_address, future = await self.connection_queue.get()
-                    conn = await self._create_connection(queued_address)
-                    if not future.done():
-                        future.set_result(conn)
-                except BLEConnectionError as e:
-                    self.logger.exception("Failed to process queued connection")
-                    if future is not None and not future.done():
-                        future.set_exception(e)
+            # Hand the slot to the longest-waiting connect, if any
+            self._slots.release()
 
     async def reconnect(
         self,
@@ -597,8 +721,8 @@ class BLEConnectionPool:
                     device_address,
                 )
 
-                # Attempt to connect
-                await self._create_connection(device_address)
+                # Share any in-flight connect so the device holds one slot
+                await self._join_or_start_connect(device_address)
 
             except BLEConnectionError as e:  # noqa: PERF203
                 self.logger.warning(
@@ -665,13 +789,12 @@ class BLEConnectionPool:
         if not device_address:
             raise ValueError("Device address cannot be empty")
 
-        if device_address not in self.active_connections:
+        conn = self.active_connections.get(device_address)
+        if conn is None:
             raise BLEConnectionError(
                 f"No active connection for device {device_address}",
                 device_address=device_address,
             )
-
-        conn = self.active_connections[device_address]
         client = conn.get("client")
 
         if not client or not hasattr(client, "is_connected") or not client.is_connected:
@@ -731,13 +854,12 @@ class BLEConnectionPool:
         if callback is None:
             raise ValueError("Callback function cannot be None")
 
-        if device_address not in self.active_connections:
+        conn = self.active_connections.get(device_address)
+        if conn is None:
             raise BLEConnectionError(
                 f"No active connection for device {device_address}",
                 device_address=device_address,
             )
-
-        conn = self.active_connections[device_address]
         client = conn.get("client")
 
         if not client or not hasattr(client, "is_connected") or not client.is_connected:
@@ -784,13 +906,12 @@ class BLEConnectionPool:
             BLEConnectionError: If no active connection exists
             BLEOperationError: If stopping notifications fails
         """
-        if device_address not in self.active_connections:
+        conn = self.active_connections.get(device_address)
+        if conn is None:
             raise BLEConnectionError(
                 f"No active connection for device {device_address}",
                 device_address=device_address,
             )
-
-        conn = self.active_connections[device_address]
         client = conn.get("client")
 
         if not client or not hasattr(client, "is_connected") or not client.is_connected:
@@ -828,20 +949,32 @@ class BLEConnectionPool:
             self.logger.exception(error_msg)
             raise BLEOperationError(error_msg, device_address=device_address) from e
 
+    def _pop_expired_connections(self, now: float) -> list[str]:
+        """Pop heap entries due by monotonic ``now`` that match a live connection."""
+        heap = self._expiry_heap
+        expired = []
+        while heap and heap[0][0] <= now:
+            _, addr, connected_mono = heapq.heappop(heap)
+            conn = self.active_connections.get(addr)
+            if conn is not None and conn["connected_at_mono"] == connected_mono:
+                expired.append(addr)
+        return expired
+
     async def _cleanup_stale_connections(self) -> None:
-        """Periodically clean up connections that have timed out or are no longer connected."""
+        """
+        Clean up connections that have timed out or are no longer connected.
+
+        Timeouts come off the expiry heap, so the task wakes when the next
+        connection is due rather than comparing every connection's age each
+        cycle. Clients that dropped on their own are still checked every
+        ``_cleanup_interval`` seconds.
+        """
         try:
             while not self._shutdown_event.is_set():
-                now = time.time()
-                stale = []
+                stale = self._pop_expired_connections(time.monotonic())
                 reconnect_candidates = []
 
                 for addr, conn in self.active_connections.items():
-                    # Check if connection has timed out
-                    if now - conn["connected_at"] > self.connection_timeout:
-                        stale.append(addr)
-                        continue
-
                     # Check if BLE client is still connected
                     client = conn.get("client")
                     if (
@@ -849,6 +982,8 @@ class BLEConnectionPool:
                         and hasattr(client, "is_connected")
                         and not client.is_connected
                     ):
+                        if addr in stale:
+                            continue
                         self.logger.info(
                             "BLE client for %s is no longer connected",
                             addr,
@@ -867,25 +1002,47 @@ class BLEConnectionPool:
                     ):
                         conn["is_connected"] = client.is_connected
 
-                # Clean up stale connections
-                for addr in stale:
-                    self.logger.info("Cleaning up stale connection %s", addr)
-                    await self.disconnect(addr)
+                # Clean up stale connections concurrently, so a mass timeout
+                # (e.g. an adapter reset) costs the slowest disconnect, not the sum
+                if stale:
+                    self.logger.info(
+                        "Cleaning up stale connections %s",
+                        ", ".join(stale),
+                    )
+                    results = await asyncio.gather(
+                        *(self.disconnect(addr) for addr in stale),
+                        return_exceptions=True,
+                    )
+                    for addr, result in zip(stale, results, strict=True):
+                        if isinstance(result, Exception):
+                            self.logger.error(
+                                "Failed to clean up stale connection %s",
+                                addr,
+                                exc_info=result,
+                            )
 
                 # Attempt reconnection for candidates (but don't block cleanup)
                 for addr in reconnect_candidates:
                     if (
                         addr not in self.active_connections
                     ):  # Only if not already reconnected
-                        # Start reconnection in background
-                        asyncio.create_task(self._background_reconnect(addr))  # noqa: RUF006
-                        # Don't await the task to avoid blocking cleanup
-
-                # Wait for next cleanup cycle or shutdown
+                        # Start reconnection in background; don't await it to
+                        # avoid blocking cleanup
+                        task = asyncio.create_task(self._background_reconnect(addr))
+                        self._background_tasks.add(task)
+                        task.add_done_callback(self._background_tasks.discard)
+
+                # Sleep until the next expiry or liveness check, or until woken
+                self._cleanup_wakeup.clear()
+                wait = self._cleanup_interval
+                if self._expiry_heap:
+                    wait = min(
+                        wait, max(self._expiry_heap[0][0] - time.monotonic(), 0.0)
+                    )
                 try:
                     await asyncio.wait_for(
-                        self._shutdown_event.wait(),
-                        timeout=self._cleanup_interval,
+                        self._cleanup_wakeup.wait(),
+                        timeout=wait,
                     )
                 except TimeoutError:
                     continue
@@ -924,8 +1081,7 @@ class BLEConnectionPool:
 
     def get_queued_device_addresses(self) -> list[str]:
         """Get a list of device addresses currently queued for connection."""
-        # Accessing private _queue is required to peek at asyncio.Queue contents; no public API exists.
-        return [item[0] for item in list(self.connection_queue._queue)]  # type: ignore[attr-defined]  # noqa: SLF001
+        return list(self._waiting)
 
     def get_connection_stats(self) -> dict:
         """
@@ -950,13 +1106,18 @@ class BLEConnectionPool:
             state = state_manager.state
             state_counts[state.name] = state_counts.get(state.name, 0) + 1
 
+        # Most recent events, newest first
+        recent = list(
+            itertools.islice(reversed(self.connection_history), STATS_HISTORY_EVENTS),
+        )
+
         return {
             "active": len(self.active_connections),
             "connected": connected_count,
             "disconnected": disconnected_count,
             "pending": len(self._pending_connections),
-            "queued": self.connection_queue.qsize(),
-            "history": self.connection_history[-20:],  # last 20 events
+            "queued": len(self._waiting),
+            "history": [event._asdict() for event in reversed(recent)],
             "bleak_available": BLEAK_AVAILABLE,
             "state_counts": state_counts,
             "total_devices": len(self.device_states),
@@ -973,10 +1134,9 @@ class BLEConnectionPool:
         Returns:
             True if device is connected, False otherwise
         """
-        if device_address not in self.active_connections:
+        conn = self.active_connections.get(device_address)
+        if conn is None:
             return False
-
-        conn = self.active_connections[device_address]
         client = conn.get("client")
 
         # Check both our tracking and the actual BLE client state
@@ -1012,7 +1172,8 @@ class BLEConnectionPool:
             ],
         }
 
-        if device_address not in self.active_connections:
+        conn = self.active_connections.get(device_address)
+        if conn is None:
             health.update(
                 {
                     "connected": False,
@@ -1020,14 +1181,12 @@ class BLEConnectionPool:
                 },
             )
             return health
-
-        conn = self.active_connections[device_address]
         client = conn.get("client")
 
         health.update(
             {
                 "connected_at": conn.get("connected_at"),
-                "connection_age": time.time() - conn.get("connected_at", 0),
+                "connection_age": time.monotonic() - conn["connected_at_mono"],
                 "active_notifications": len(conn.get("notifications", {})),
                 "notification_characteristics": list(
                     conn.get("notifications", {}).keys(),
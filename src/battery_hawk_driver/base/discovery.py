@@ -6,6 +6,7 @@ import asyncio
 import json
 import logging
 import os
+import time
 from datetime import UTC, datetime
 from typing import Any
 
@@ -32,6 +33,9 @@ except ImportError:
 
 # Constants
 TUPLE_SIZE_DEVICE_AND_ADV = 2
+# Seconds a scanned Bleak device object is offered for connecting. BlueZ drops
+# devices it has not seen for about 30 seconds, after which the object is stale.
+BLE_DEVICE_MAX_AGE = 30.0
 
 
 class BLEDiscoveryService:
@@ -56,6 +60,10 @@ class BLEDiscoveryService:
         # type: ignore[reportAttributeAccessIssue] - config is duck-typed
 
         self.discovered_devices: dict[str, dict[str, Any]] = {}
+        # (Bleak device object, monotonic time seen) from recent scans, in
+        # memory only. Handing a fresh one to BleakClient lets a connect skip
+        # its own discovery scan.
+        self._ble_devices: dict[str, tuple[Any, float]] = {}
         self.logger = logging.getLogger("battery_hawk.ble_discovery")
         self.storage_path = storage_path or os.path.join(
             getattr(config_manager, "config_dir", "."),
@@ -181,6 +189,7 @@ class BLEDiscoveryService:
                     ),
                 }
                 self.discovered_devices[device.address] = device_data  # type: ignore[reportAttributeAccessIssue]
+                self._ble_devices[device.address] = (device, time.monotonic())  # type: ignore[reportAttributeAccessIssue]
                 matched += 1
 
         self.logger.debug("Matched %d potential battery monitor(s)", matched)
@@ -283,6 +292,7 @@ class BLEDiscoveryService:
                         ),
                     }
                     self.discovered_devices[device_address] = device_data
+                    self._ble_devices[device_address] = (device, time.monotonic())
 
             self.logger.debug("Short scan matched %d potential device(s)", matched)
 
@@ -403,6 +413,22 @@ class BLEDiscoveryService:
         """Return metadata for a specific discovered device."""
         return self.discovered_devices.get(mac_address)
 
+    def get_ble_device(self, mac_address: str) -> Any | None:
+        """
+        Return the Bleak device object from a recent scan, if there is one.
+
+        Entries older than BLE_DEVICE_MAX_AGE are dropped and None is returned,
+        so callers fall back to connecting by address.
+        """
+        entry = self._ble_devices.get(mac_address)
+        if entry is None:
+            return None
+        device, seen_at = entry
+        if time.monotonic() - seen_at > BLE_DEVICE_MAX_AGE:
+            del self._ble_devices[mac_address]
+            return None
+        return device
+
     def _save_persistent_devices(self) -> None:
         """Save discovered devices to persistent storage."""
         try:
@@ -43,10 +43,13 @@ from __future__ import annotations
 import abc
 import logging
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from .connection import BLEConnectionPool
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
 
 @dataclass
 class BatteryInfo:
@@ -61,6 +64,28 @@ class BatteryInfo:
     timestamp: float | None = None  # Unix timestamp
     extra: dict[str, Any] | None = None  # Device-specific extra fields
 
+    @classmethod
+    def from_mapping(cls, data: Mapping[str, Any]) -> BatteryInfo:
+        """
+        Build from a mapping of field names, positionally and without ``**``.
+
+        Missing optional fields take their defaults; unknown keys are ignored.
+
+        Raises:
+            KeyError: If a required field is missing.
+        """
+        get = data.get
+        return cls(
+            data["voltage"],
+            data["current"],
+            data["temperature"],
+            data["state_of_charge"],
+            get("capacity"),
+            get("cycles"),
+            get("timestamp"),
+            get("extra"),
+        )
+
 
 @dataclass
 class DeviceStatus:
@@ -73,6 +98,26 @@ class DeviceStatus:
     last_command: str | None = None
     extra: dict[str, Any] | None = None
 
+    @classmethod
+    def from_mapping(cls, data: Mapping[str, Any]) -> DeviceStatus:
+        """
+        Build from a mapping of field names, positionally and without ``**``.
+
+        Missing optional fields take their defaults; unknown keys are ignored.
+
+        Raises:
+            KeyError: If ``connected`` is missing.
+        """
+        get = data.get
+        return cls(
+            data["connected"],
+            get("error_code"),
+            get("error_message"),
+            get("protocol_version"),
+            get("last_command"),
+            get("extra"),
+        )
+
 
 class BaseMonitorDevice(abc.ABC):
     """
@@ -697,6 +697,17 @@ class TestDeviceRegistry:
         assert len(configured_devices) == 1
         assert configured_devices[0]["mac_address"] == "AA:BB:CC:DD:EE:FF"
 
+    def test_device_counts(self, device_registry: DeviceRegistry) -> None:
+        """Test counting all and configured devices."""
+        device_registry.devices = {
+            "AA:BB:CC:DD:EE:FF": {"status": "configured"},
+            "11:22:33:44:55:66": {"status": "discovered"},
+            "22:33:44:55:66:77": {"status": "configured"},
+        }
+
+        assert device_registry.count_all() == 3
+        assert device_registry.count_configured() == 2
+
 
 class TestVehicleRegistry:
     """Test suite for VehicleRegistry."""
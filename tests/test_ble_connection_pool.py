@@ -44,7 +44,7 @@ async def test_connection_queueing() -> None:
     # Second connection should be queued
     fut = asyncio.create_task(pool.connect("AA:BB:CC:DD:EE:02"))
     await asyncio.sleep(0.1)  # Let it queue
-    assert pool.connection_queue.qsize() == 1
+    assert pool.get_queued_device_addresses() == ["AA:BB:CC:DD:EE:02"]
     # Disconnect first, queued should be processed
     await pool.disconnect("AA:BB:CC:DD:EE:01")
     conn2 = await fut
@@ -53,6 +53,26 @@ async def test_connection_queueing() -> None:
     await pool.shutdown()
 
 
+@pytest.mark.asyncio
+async def test_concurrent_connects_respect_max_connections() -> None:
+    """Test simultaneous connects to different devices never exceed the pool size."""
+    pool = BLEConnectionPool(DummyConfig(1), cleanup_interval=0.05, test_mode=True)
+    addresses = ["AA:BB:CC:DD:EE:01", "AA:BB:CC:DD:EE:02", "AA:BB:CC:DD:EE:03"]
+    tasks = [asyncio.create_task(pool.connect(addr)) for addr in addresses]
+    await asyncio.sleep(0.05)
+
+    assert list(pool.get_active_connections()) == addresses[:1]
+    assert pool.get_queued_device_addresses() == addresses[1:]
+
+    # Slots are handed out in arrival order as connections close
+    for addr, task in zip(addresses, tasks, strict=True):
+        conn = await task
+        assert conn["device_address"] == addr
+        assert len(pool.get_active_connections()) == 1
+        await pool.disconnect(addr)
+    await pool.shutdown()
+
+
 @pytest.mark.asyncio
 async def test_stale_connection_cleanup() -> None:
     """Test that stale connections are cleaned up after timeout."""
@@ -66,6 +86,57 @@ async def test_stale_connection_cleanup() -> None:
     await pool.shutdown()
 
 
+@pytest.mark.asyncio
+async def test_stale_connections_cleaned_up_together() -> None:
+    """Test every connection that times out in the same pass is cleaned up."""
+    pool = BLEConnectionPool(DummyConfig(2), cleanup_interval=0.05, test_mode=True)
+    pool.connection_timeout = 0.1
+    await pool.connect("AA:BB:CC:DD:EE:01")
+    await pool.connect("AA:BB:CC:DD:EE:02")
+    await asyncio.sleep(0.25)
+
+    assert pool.get_active_connections() == {}
+    assert pool.get_connection_stats()["state_counts"] == {"DISCONNECTED": 2}
+    await pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_stale_expiry_ignores_replaced_connection() -> None:
+    """Test an expiry scheduled for an earlier connection does not close a newer one."""
+    pool = BLEConnectionPool(DummyConfig(1), cleanup_interval=5.0, test_mode=True)
+    pool.connection_timeout = 0.2
+    await pool.connect("AA:BB:CC:DD:EE:01")
+    await pool.disconnect("AA:BB:CC:DD:EE:01")
+    await asyncio.sleep(0.1)
+    await pool.connect("AA:BB:CC:DD:EE:01")
+
+    # The first connection's expiry passes while the second is still fresh
+    await asyncio.sleep(0.15)
+    assert "AA:BB:CC:DD:EE:01" in pool.get_active_connections()
+
+    # The second connection's own expiry wakes the cleanup task
+    await asyncio.sleep(0.15)
+    assert "AA:BB:CC:DD:EE:01" not in pool.get_active_connections()
+    await pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_wall_clock_jump_does_not_expire_connection(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test connection timeouts follow the monotonic clock, not wall time."""
+    pool = BLEConnectionPool(DummyConfig(1), cleanup_interval=0.05, test_mode=True)
+    pool.connection_timeout = 0.5
+    await pool.connect("AA:BB:CC:DD:EE:01")
+
+    real_time = conn_mod.time.time
+    monkeypatch.setattr(conn_mod.time, "time", lambda: real_time() + 3600)
+    await asyncio.sleep(0.1)
+
+    assert "AA:BB:CC:DD:EE:01" in pool.get_active_connections()
+    await pool.shutdown()
+
+
 @pytest.mark.asyncio
 async def test_double_connect_and_release() -> None:
     """Test connecting to the same device twice and double release edge case."""
@@ -89,7 +160,7 @@ async def test_connection_stats() -> None:
     assert stats["active"] == 1
     assert stats["queued"] == 0
     # Start the second connection (should queue)
-    fut2 = asyncio.create_task(pool.connect("AA:BB:CC:DD:EE:02"))  # noqa: F841, RUF006
+    fut2 = asyncio.create_task(pool.connect("AA:BB:CC:DD:EE:02"))
     # Wait until the queue is populated or timeout
     for _ in range(20):
         queued = pool.get_queued_device_addresses()
@@ -101,6 +172,8 @@ async def test_connection_stats() -> None:
     stats = pool.get_connection_stats()
     assert stats["active"] == 1
     await pool.disconnect("AA:BB:CC:DD:EE:01")
+    # The freed slot goes to the queued connection
+    await fut2
     stats = pool.get_connection_stats()
     assert stats["active"] == 1
     assert pool.get_queued_device_addresses() == []
@@ -111,6 +184,74 @@ async def test_connection_stats() -> None:
     await pool.shutdown()
 
 
+@pytest.mark.asyncio
+async def test_connection_history_is_bounded() -> None:
+    """Test history keeps only recent events and stats report the latest ones."""
+    pool = BLEConnectionPool(DummyConfig(1), cleanup_interval=0.05, test_mode=True)
+    for _ in range(conn_mod.CONNECTION_HISTORY_SIZE):
+        await pool.connect("AA:BB:CC:DD:EE:01")
+        await pool.disconnect("AA:BB:CC:DD:EE:01")
+
+    assert len(pool.connection_history) == conn_mod.CONNECTION_HISTORY_SIZE
+    history = pool.get_connection_stats()["history"]
+    assert len(history) == conn_mod.STATS_HISTORY_EVENTS
+    assert history[-1] == pool.connection_history[-1]._asdict()
+    assert history[-1]["event"] == "disconnect"
+    assert history[-2]["event"] == "connect"
+    await pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_connection_history_size_from_config() -> None:
+    """Test the bluetooth history_size setting caps the connection history."""
+
+    class Cfg:
+        def get_config(self, section: str) -> dict:
+            return {"bluetooth": {"max_concurrent_connections": 1, "history_size": 4}}
+
+    pool = BLEConnectionPool(Cfg(), cleanup_interval=0.05, test_mode=True)
+    for _ in range(5):
+        await pool.connect("AA:BB:CC:DD:EE:01")
+        await pool.disconnect("AA:BB:CC:DD:EE:01")
+    assert len(pool.connection_history) == 4
+    await pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_shutdown_cancels_stuck_cleanup(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test shutdown cancels a cleanup pass stuck past the timeout."""
+    monkeypatch.setattr(conn_mod, "SHUTDOWN_TIMEOUT", 0.05)
+    pool = BLEConnectionPool(DummyConfig(1), cleanup_interval=0.01, test_mode=True)
+    stuck = asyncio.Event()
+
+    async def hanging_disconnect(device_address: str) -> None:
+        stuck.set()
+        await asyncio.Event().wait()
+
+    await pool.connect("AA:BB:CC:DD:EE:01")
+    pool.active_connections["AA:BB:CC:DD:EE:01"]["client"].is_connected = False
+    monkeypatch.setattr(pool, "disconnect", hanging_disconnect)
+    await asyncio.wait_for(stuck.wait(), timeout=1)
+
+    await asyncio.wait_for(pool.shutdown(), timeout=1)
+    assert pool._cleanup_task.done()
+
+
+@pytest.mark.asyncio
+async def test_cleanup_restarts_after_shutdown() -> None:
+    """Test the cleanup task keeps running when restarted after shutdown."""
+    pool = BLEConnectionPool(DummyConfig(1), cleanup_interval=0.01, test_mode=True)
+    await pool.start_cleanup()
+    await pool.shutdown()
+    await pool.start_cleanup()
+    await asyncio.sleep(0.03)
+    assert not pool._cleanup_task.done()
+    await pool.shutdown()
+    assert pool._cleanup_task.done()
+
+
 @pytest.mark.asyncio
 async def test_gatt_operations() -> None:
     """Test GATT characteristic operations."""
@@ -238,3 +379,136 @@ async def test_ble_client_adapter_fallback_on_typeerror(
     assert "adapter" not in created_with
     await pool.disconnect("AA:BB:CC:DD:EE:AF")
     await pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_ble_client_uses_looked_up_device(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Ensure BleakClient gets the scanned device object when one is known."""
+    created_with: list[object] = []
+
+    class DummyClient:
+        def __init__(self, address_or_device: object, *, timeout: float) -> None:
+            created_with.append(address_or_device)
+            self.is_connected = False
+
+        async def connect(self) -> None:
+            self.is_connected = True
+
+        async def disconnect(self) -> None:
+            self.is_connected = False
+
+    monkeypatch.setattr(conn_mod, "BLEAK_AVAILABLE", True)
+    monkeypatch.setattr(conn_mod, "BleakClient", DummyClient)
+
+    scanned = object()
+    known = {"AA:BB:CC:DD:EE:01": scanned}
+    pool = BLEConnectionPool(DummyConfig(2), cleanup_interval=0.05, test_mode=False)
+    pool.device_lookup = known.get
+    await pool.connect("AA:BB:CC:DD:EE:01")
+    await pool.connect("AA:BB:CC:DD:EE:02")
+    # Unknown devices fall back to connecting by address
+    assert created_with == [scanned, "AA:BB:CC:DD:EE:02"]
+    await pool.disconnect("AA:BB:CC:DD:EE:01")
+    await pool.disconnect("AA:BB:CC:DD:EE:02")
+    await pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_reconnect_racing_connect_shares_one_slot(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test an overlapping reconnect and connect create one client and one slot."""
+    created: list[object] = []
+
+    class SlowClient:
+        def __init__(self, address: str, *, timeout: float) -> None:
+            created.append(self)
+            self.is_connected = False
+
+        async def connect(self) -> None:
+            await asyncio.sleep(0.05)
+            self.is_connected = True
+
+        async def disconnect(self) -> None:
+            self.is_connected = False
+
+    monkeypatch.setattr(conn_mod, "BLEAK_AVAILABLE", True)
+    monkeypatch.setattr(conn_mod, "BleakClient", SlowClient)
+
+    pool = BLEConnectionPool(DummyConfig(2), cleanup_interval=0.05, test_mode=False)
+    addr = "AA:BB:CC:DD:EE:01"
+    reconnected, conn = await asyncio.gather(pool.reconnect(addr), pool.connect(addr))
+    assert reconnected is True
+    assert len(created) == 1
+    assert conn["client"] is created[0]
+
+    await pool.disconnect(addr)
+    # Both slots are free again once the single connection is gone
+    for _ in range(2):
+        await asyncio.wait_for(pool._slots.acquire(), timeout=0.1)
+    await pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_stale_looked_up_device_falls_back_to_address(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Ensure a failed connect via a scanned device retries by address."""
+    created_with: list[object] = []
+    stale = object()
+
+    class DummyClient:
+        def __init__(self, address_or_device: object, *, timeout: float) -> None:
+            created_with.append(address_or_device)
+            self.target = address_or_device
+            self.is_connected = False
+
+        async def connect(self) -> None:
+            if self.target is stale:
+                msg = "device object no longer exists"
+                raise conn_mod.BleakError(msg)
+            self.is_connected = True
+
+        async def disconnect(self) -> None:
+            self.is_connected = False
+
+    monkeypatch.setattr(conn_mod, "BLEAK_AVAILABLE", True)
+    monkeypatch.setattr(conn_mod, "BleakClient", DummyClient)
+
+    pool = BLEConnectionPool(DummyConfig(1), cleanup_interval=0.05, test_mode=False)
+    pool.device_lookup = {"AA:BB:CC:DD:EE:01": stale}.get
+    conn = await pool.connect("AA:BB:CC:DD:EE:01")
+    assert created_with == [stale, "AA:BB:CC:DD:EE:01"]
+    assert conn["client"].is_connected
+    await pool.disconnect("AA:BB:CC:DD:EE:01")
+    await pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_failing_state_callback_does_not_leak_a_slot() -> None:
+    """Test a connect that fails after going active releases its slot only once."""
+    pool = BLEConnectionPool(DummyConfig(1), cleanup_interval=0.05, test_mode=True)
+    addr = "AA:BB:CC:DD:EE:01"
+
+    def failing_callback(state: conn_mod.ConnectionState) -> None:
+        msg = "callback failed"
+        raise RuntimeError(msg)
+
+    pool._get_state_manager(addr).on_state(
+        conn_mod.ConnectionState.CONNECTED,
+        failing_callback,
+    )
+    with pytest.raises(conn_mod.BLEConnectionError):
+        await pool.connect(addr)
+    # The connection went active, so it still holds the pool's only slot
+    assert addr in pool.active_connections
+    assert pool._slots.locked()
+
+    await pool.disconnect(addr)
+    assert not pool._slots.locked()
+    # Exactly one slot is free again; a second release would be an over-release
+    with pytest.raises(ValueError, match="released too many times"):
+        pool._slots.release()
+    await pool.shutdown()
@@ -2,6 +2,7 @@
 
 import json
 import os
+import time
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -10,7 +11,10 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from src.battery_hawk_driver.base.discovery import BLEDiscoveryService
+from src.battery_hawk_driver.base.discovery import (
+    BLE_DEVICE_MAX_AGE,
+    BLEDiscoveryService,
+)
 
 
 class DummyConfig:
@@ -59,6 +63,15 @@ async def test_scan_for_devices_and_persistence(temp_storage: str) -> None:
         service = BLEDiscoveryService(DummyConfig(), storage_path=temp_storage)
         devices = await service.scan_for_devices(duration=1)
         assert "AA:BB:CC:DD:EE:FF" in devices
+        assert service.get_ble_device("AA:BB:CC:DD:EE:FF") is fake_device
+        assert service.get_ble_device("AA:BB:CC:DD:EE:00") is None
+
+        # Scanned device objects are only offered while recent
+        service._ble_devices["AA:BB:CC:DD:EE:FF"] = (
+            fake_device,
+            time.monotonic() - BLE_DEVICE_MAX_AGE - 1,
+        )
+        assert service.get_ble_device("AA:BB:CC:DD:EE:FF") is None
 
         # Check that advertisement data was captured
         device_info = devices["AA:BB:CC:DD:EE:FF"]
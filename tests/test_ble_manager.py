@@ -6,6 +6,7 @@ import pytest
 
 from src.battery_hawk_driver.base.ble_base import BLEManager
 from src.battery_hawk_driver.base.protocol import BatteryInfo, DeviceStatus
+from src.battery_hawk_driver.base.retry import CircuitBreakerOpenError
 
 
 class DummyConfig:
@@ -75,3 +76,71 @@ async def test_state_history(monkeypatch: pytest.MonkeyPatch) -> None:
     hist = manager.get_device_history(addr)
     assert hist[-1][0].name == "DISCONNECTED"
     assert any(s[0].name == "CONNECTED" for s in hist)
+
+
+@pytest.mark.asyncio
+async def test_disconnect_releases_protocol(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test disconnect drops the protocol instance but keeps state history."""
+    monkeypatch.setattr(
+        "src.battery_hawk_driver.base.connection.BLEConnectionPool.connect",
+        AsyncMock(return_value=None),
+    )
+    manager = BLEManager(DummyConfig())
+    addr = "AA:BB:CC:DD:EE:01"
+    first = await manager.connect(addr)
+    await manager.disconnect(addr)
+    assert addr not in manager.device_protocols
+
+    # Reconnecting builds a new protocol and marks the device connected again
+    second = await manager.connect(addr)
+    assert second is not first
+    assert manager.get_device_state(addr).name == "CONNECTED"
+    states = [s[0].name for s in manager.get_device_history(addr)]
+    assert states.count("CONNECTED") == 2
+    await manager.disconnect(addr)
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_fails_fast(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test read/command raise immediately while the circuit breaker is open."""
+    monkeypatch.setattr(
+        "src.battery_hawk_driver.base.connection.BLEConnectionPool.connect",
+        AsyncMock(return_value=None),
+    )
+    manager = BLEManager(DummyConfig())
+    addr = "AA:BB:CC:DD:EE:02"
+    await manager.connect(addr)
+    read = manager._wrapped_read[addr] = AsyncMock()
+    breaker = manager._breakers[addr]
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+    with pytest.raises(CircuitBreakerOpenError):
+        await manager.read_data(addr)
+    with pytest.raises(CircuitBreakerOpenError):
+        await manager.send_command(addr, "ping")
+    read.assert_not_called()
+    await manager.disconnect(addr)
+
+
+@pytest.mark.asyncio
+async def test_circuit_breakers_are_per_device(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test an open breaker on one device does not block another device."""
+    monkeypatch.setattr(
+        "src.battery_hawk_driver.base.connection.BLEConnectionPool.connect",
+        AsyncMock(return_value=None),
+    )
+    manager = BLEManager(DummyConfig())
+    bad, good = "AA:BB:CC:DD:EE:03", "AA:BB:CC:DD:EE:04"
+    await manager.connect(bad)
+    await manager.connect(good)
+    breaker = manager._breakers[bad]
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+    with pytest.raises(CircuitBreakerOpenError):
+        await manager.read_data(bad)
+    info = await manager.read_data(good)
+    assert isinstance(info, BatteryInfo)
+    await manager.disconnect(bad)
+    await manager.disconnect(good)
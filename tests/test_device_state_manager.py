@@ -431,6 +431,59 @@ class TestDeviceStateManager:
         vehicle_2_devices = state_manager.get_devices_by_vehicle("vehicle_2")
         assert len(vehicle_2_devices) == 1
 
+    def test_vehicle_index_follows_reassociation(
+        self,
+        state_manager: DeviceStateManager,
+    ) -> None:
+        """Test vehicle lookups track reassociation and unregistration."""
+        asyncio.run(state_manager.register_device("AA:BB:CC:DD:EE:FF", "BM6"))
+        asyncio.run(state_manager.register_device("BB:CC:DD:EE:FF:AA", "BM2"))
+        asyncio.run(
+            state_manager.set_vehicle_association("AA:BB:CC:DD:EE:FF", "vehicle_1"),
+        )
+        asyncio.run(
+            state_manager.set_vehicle_association("BB:CC:DD:EE:FF:AA", "vehicle_1"),
+        )
+
+        # Move one device to another vehicle
+        asyncio.run(
+            state_manager.set_vehicle_association("AA:BB:CC:DD:EE:FF", "vehicle_2"),
+        )
+        assert [
+            s.mac_address for s in state_manager.get_devices_by_vehicle("vehicle_1")
+        ] == [
+            "BB:CC:DD:EE:FF:AA",
+        ]
+        assert [
+            s.mac_address for s in state_manager.get_devices_by_vehicle("vehicle_2")
+        ] == [
+            "AA:BB:CC:DD:EE:FF",
+        ]
+
+        # Clearing the association and unregistering drop the device from lookups
+        asyncio.run(state_manager.set_vehicle_association("AA:BB:CC:DD:EE:FF", None))
+        asyncio.run(state_manager.unregister_device("BB:CC:DD:EE:FF:AA"))
+        assert state_manager.get_devices_by_vehicle("vehicle_1") == []
+        assert state_manager.get_devices_by_vehicle("vehicle_2") == []
+
+    def test_get_devices_by_vehicle_keeps_association_order(
+        self,
+        state_manager: DeviceStateManager,
+    ) -> None:
+        """Test vehicle lookups return devices in a stable, association order."""
+        macs = [f"AA:BB:CC:DD:EE:{i:02X}" for i in range(8)]
+        for mac in macs:
+            asyncio.run(state_manager.register_device(mac, "BM6"))
+            asyncio.run(state_manager.set_vehicle_association(mac, "vehicle_1"))
+
+        # Re-associating with the same vehicle does not move a device
+        asyncio.run(state_manager.set_vehicle_association(macs[0], "vehicle_1"))
+
+        for _ in range(3):
+            assert [
+                s.mac_address for s in state_manager.get_devices_by_vehicle("vehicle_1")
+            ] == macs
+
     def test_get_connected_devices(self, state_manager: DeviceStateManager) -> None:
         """Test getting connected devices."""
         # Register devices
@@ -176,6 +176,18 @@ class TestMQTTInterface:
         topic = mqtt_interface._get_topic("devices/status")
         assert topic == "test_batteryhawk/devices/status"
 
+    def test_client_inflight_window_follows_max_in_flight(
+        self,
+        mock_config_manager: MockConfigManager,
+    ) -> None:
+        """Test the client inflight window is sized from max_in_flight."""
+        mock_config_manager.configs["system"]["mqtt"]["max_in_flight"] = 64
+        interface = MQTTInterface(mock_config_manager)
+
+        client_kwargs = interface._prepare_client_kwargs()
+
+        assert client_kwargs["max_inflight_messages"] == 64
+
     @pytest.mark.asyncio
     async def test_connect_disabled(
         self,
@@ -349,3 +361,116 @@ class TestMQTTInterface:
 
         # Config should be updated
         assert mqtt_interface._mqtt_config["broker"] == "new-broker"
+
+    def test_encode_payload(self) -> None:
+        """Test dict payloads are JSON-encoded and strings UTF-8 encoded."""
+        payload = {"device": "test", 1: "int-key", "value": 1.5}
+
+        encoded = MQTTInterface._encode_payload(payload)
+
+        assert isinstance(encoded, bytes)
+        assert json.loads(encoded) == {"device": "test", "1": "int-key", "value": 1.5}
+        assert MQTTInterface._encode_payload("plain") == b"plain"
+
+    @pytest.mark.asyncio
+    async def test_handle_messages_dispatches_payloads(
+        self,
+        mqtt_interface: MQTTInterface,
+    ) -> None:
+        """Test received messages are decoded and routed to matching handlers."""
+        handler = MagicMock()
+        mqtt_interface._message_handlers.add("test_batteryhawk/devices/+", handler)
+
+        async def messages() -> Any:
+            for payload in (b'{"on": true}', 42):
+                message = MagicMock()
+                message.topic.value = "test_batteryhawk/devices/abc"
+                message.payload = payload
+                yield message
+
+        mqtt_interface._client = MagicMock()
+        mqtt_interface._client.messages = messages()
+
+        await mqtt_interface._handle_messages()
+
+        assert handler.call_args_list == [
+            (("test_batteryhawk/devices/abc", '{"on": true}'),),
+            (("test_batteryhawk/devices/abc", "42"),),
+        ]
+
+    def test_get_topic_cache_follows_prefix_change(
+        self,
+        mqtt_interface: MQTTInterface,
+    ) -> None:
+        """Test cached prefixed topics are rebuilt after a prefix change."""
+        assert mqtt_interface._get_topic("system/status") == (
+            "test_batteryhawk/system/status"
+        )
+
+        new_config = mqtt_interface.config_manager.configs["system"]
+        new_config["mqtt"]["topic_prefix"] = "renamed"
+        mqtt_interface._on_config_change("system", new_config)
+
+        assert mqtt_interface._get_topic("system/status") == "renamed/system/status"
+
+    @pytest.mark.asyncio
+    @patch("battery_hawk.mqtt.client.Client")
+    async def test_publish_qos_override(
+        self,
+        mock_client_class: MagicMock,
+        mqtt_interface: MQTTInterface,
+    ) -> None:
+        """Test a per-message QoS overrides the configured default."""
+        mock_client = AsyncMock()
+        mock_client_class.return_value = mock_client
+        await mqtt_interface.connect()
+
+        await mqtt_interface.publish("devices/reading", {"v": 1}, qos=0)
+
+        assert mock_client.publish.call_args.kwargs["qos"] == 0
+
+    @pytest.mark.asyncio
+    @patch("battery_hawk.mqtt.client.Client")
+    async def test_publish_bytes_sends_payload_as_is(
+        self,
+        mock_client_class: MagicMock,
+        mqtt_interface: MQTTInterface,
+    ) -> None:
+        """Test pre-encoded payloads reach the broker without re-encoding."""
+        mock_client = AsyncMock()
+        mock_client_class.return_value = mock_client
+        await mqtt_interface.connect()
+
+        await mqtt_interface.publish_bytes("system/status", b'{"ok":true}', retain=True)
+
+        args, kwargs = mock_client.publish.call_args
+        assert args[0] == "test_batteryhawk/system/status"
+        assert args[1] == b'{"ok":true}'
+        assert kwargs["retain"] is True
+
+    @pytest.mark.asyncio
+    @patch("battery_hawk.mqtt.client.Client")
+    async def test_identical_retained_payload_not_resent(
+        self,
+        mock_client_class: MagicMock,
+        mqtt_interface: MQTTInterface,
+    ) -> None:
+        """Test an unchanged retained payload is sent once per session."""
+        mock_client = AsyncMock()
+        mock_client_class.return_value = mock_client
+        await mqtt_interface.connect()
+
+        await mqtt_interface.publish("system/status", {"ok": True}, retain=True)
+        await mqtt_interface.publish("system/status", {"ok": True}, retain=True)
+        assert mock_client.publish.call_count == 1
+
+        # Changed payloads and non-retained messages are always sent
+        await mqtt_interface.publish("system/status", {"ok": False}, retain=True)
+        await mqtt_interface.publish("system/status", {"ok": False})
+        assert mock_client.publish.call_count == 3
+
+        # A new session re-sends the retained payload
+        await mqtt_interface.disconnect()
+        await mqtt_interface.connect()
+        await mqtt_interface.publish("system/status", {"ok": False}, retain=True)
+        assert mock_client.publish.call_count == 4
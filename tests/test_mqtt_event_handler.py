@@ -1,13 +1,15 @@
 """Tests for MQTT event handler functionality."""
 
+import asyncio
 from typing import Any
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from battery_hawk.core.engine import BatteryHawkCore
 from battery_hawk.core.state import DeviceState
 from battery_hawk.mqtt import MQTTEventHandler, MQTTInterface, MQTTPublisher
+from battery_hawk.mqtt.client import TELEMETRY_QOS
 from battery_hawk_driver.base.protocol import BatteryInfo, DeviceStatus
 
 
@@ -26,6 +28,7 @@ class TestMQTTEventHandler:
         mock_state_manager.subscribe_to_changes = MagicMock()
         mock_state_manager.unsubscribe_from_changes = MagicMock()
         mock_state_manager.get_all_devices = MagicMock(return_value=[])
+        mock_state_manager.get_devices_by_vehicle = MagicMock(return_value=[])
         mock_engine.state_manager = mock_state_manager
 
         # Mock registries
@@ -46,6 +49,7 @@ class TestMQTTEventHandler:
         """Create a mock MQTT publisher."""
         mock_interface = MagicMock(spec=MQTTInterface)
         mock_interface.publish = AsyncMock()
+        mock_interface.publish_many = AsyncMock()
 
         mock_publisher = MagicMock(spec=MQTTPublisher)
         mock_publisher.mqtt_interface = mock_interface
@@ -74,8 +78,9 @@ class TestMQTTEventHandler:
         """Test event handler initialization."""
         assert event_handler.core_engine is mock_core_engine
         assert event_handler.mqtt_publisher is mock_mqtt_publisher
-        assert event_handler._registered_handlers == {}
-        assert event_handler._vehicle_summary_cache == {}
+        assert event_handler._core_handlers == {}
+        assert event_handler._state_handlers == {}
+        assert event_handler._vehicle_summary_counts == {}
 
     def test_register_all_handlers(
         self,
@@ -89,34 +94,34 @@ class TestMQTTEventHandler:
         assert mock_core_engine.add_event_handler.call_count == 3
         mock_core_engine.add_event_handler.assert_any_call(
             "device_discovered",
-            event_handler._registered_handlers["core_device_discovered"],
+            event_handler._core_handlers["device_discovered"],
         )
         mock_core_engine.add_event_handler.assert_any_call(
             "vehicle_associated",
-            event_handler._registered_handlers["core_vehicle_associated"],
+            event_handler._core_handlers["vehicle_associated"],
         )
         mock_core_engine.add_event_handler.assert_any_call(
             "system_shutdown",
-            event_handler._registered_handlers["core_system_shutdown"],
+            event_handler._core_handlers["system_shutdown"],
         )
 
         # Verify state manager handlers were registered
         assert mock_core_engine.state_manager.subscribe_to_changes.call_count == 4
         mock_core_engine.state_manager.subscribe_to_changes.assert_any_call(
             "reading",
-            event_handler._registered_handlers["state_reading"],
+            event_handler._state_handlers["reading"],
         )
         mock_core_engine.state_manager.subscribe_to_changes.assert_any_call(
             "status",
-            event_handler._registered_handlers["state_status"],
+            event_handler._state_handlers["status"],
         )
         mock_core_engine.state_manager.subscribe_to_changes.assert_any_call(
             "connection",
-            event_handler._registered_handlers["state_connection"],
+            event_handler._state_handlers["connection"],
         )
         mock_core_engine.state_manager.subscribe_to_changes.assert_any_call(
             "vehicle",
-            event_handler._registered_handlers["state_vehicle"],
+            event_handler._state_handlers["vehicle"],
         )
 
     def test_unregister_all_handlers(
@@ -134,7 +139,66 @@ class TestMQTTEventHandler:
         # Verify handlers were unregistered
         assert mock_core_engine.remove_event_handler.call_count == 3
         assert mock_core_engine.state_manager.unsubscribe_from_changes.call_count == 4
-        assert event_handler._registered_handlers == {}
+        assert event_handler._core_handlers == {}
+        assert event_handler._state_handlers == {}
+
+    @pytest.mark.asyncio
+    async def test_state_handler_runs_eagerly_and_tracks_pending(
+        self,
+        event_handler: MQTTEventHandler,
+    ) -> None:
+        """Test state handlers start immediately and stay referenced until done."""
+        release = asyncio.Event()
+        calls: list[str] = []
+
+        async def handler(
+            mac_address: str,
+            new_state: DeviceState | None,
+            old_state: DeviceState | None,
+        ) -> None:
+            calls.append(mac_address)
+            await release.wait()
+
+        wrapper = event_handler._create_state_handler(handler)
+        wrapper("AA:BB:CC:DD:EE:FF", None, None)
+
+        assert calls == ["AA:BB:CC:DD:EE:FF"]
+        assert len(event_handler._bg_tasks) == 1
+
+        release.set()
+        await asyncio.gather(*event_handler._bg_tasks)
+        await asyncio.sleep(0)
+        assert not event_handler._bg_tasks
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("suspend_first", [False, True])
+    async def test_state_handler_errors_are_logged(
+        self,
+        event_handler: MQTTEventHandler,
+        *,
+        suspend_first: bool,
+    ) -> None:
+        """Test failures in state handler tasks are logged, eager or not."""
+
+        async def handler(
+            mac_address: str,
+            new_state: DeviceState | None,
+            old_state: DeviceState | None,
+        ) -> None:
+            if suspend_first:
+                await asyncio.sleep(0)
+            msg = "boom"
+            raise KeyError(msg)
+
+        wrapper = event_handler._create_state_handler(handler)
+        with patch.object(event_handler.logger, "error") as log_error:
+            wrapper("AA:BB:CC:DD:EE:FF", None, None)
+            for _ in range(3):
+                await asyncio.sleep(0)
+
+        log_error.assert_called_once()
+        assert isinstance(log_error.call_args.kwargs["exc_info"], KeyError)
+        assert not event_handler._bg_tasks
 
     @pytest.mark.asyncio
     async def test_on_device_discovered(
@@ -201,6 +265,7 @@ class TestMQTTEventHandler:
             reading=reading,
             vehicle_id="vehicle_123",
             device_type="BM2",
+            qos=TELEMETRY_QOS,
         )
 
     @pytest.mark.asyncio
@@ -279,6 +344,29 @@ class TestMQTTEventHandler:
         assert status_arg.connected is True
         assert device_type_kwarg == "BM2"
 
+    @pytest.mark.asyncio
+    async def test_on_device_connection_change_without_old_state_publishes(
+        self,
+        event_handler: MQTTEventHandler,
+        mock_mqtt_publisher: MQTTPublisher,
+    ) -> None:
+        """Test events without a previous state always publish the status."""
+        # Other paths also write the retained status topic, so a repeat cannot
+        # be assumed to match what the broker currently holds
+        mac_address = "AA:BB:CC:DD:EE:FF"
+        new_state = DeviceState(mac_address, "BM2")
+        new_state.connected = True
+
+        await event_handler.on_device_connection_change(mac_address, new_state, None)
+        await event_handler.on_device_connection_change(mac_address, new_state, None)
+        assert mock_mqtt_publisher.publish_device_status.call_count == 2
+
+        # An unchanged connection flag against the previous state is skipped
+        await event_handler.on_device_connection_change(
+            mac_address, new_state, new_state
+        )
+        assert mock_mqtt_publisher.publish_device_status.call_count == 2
+
     @pytest.mark.asyncio
     async def test_on_vehicle_associated(
         self,
@@ -295,18 +383,23 @@ class TestMQTTEventHandler:
 
         await event_handler.on_vehicle_associated(event_data)
 
-        # Verify association message was published
-        mock_mqtt_publisher.mqtt_interface.publish.assert_called()
-        args, kwargs = mock_mqtt_publisher.mqtt_interface.publish.call_args
-
-        assert args[0] == "vehicle/vehicle_123/device_associated"
-        assert kwargs["retain"] is False
+        # Verify association and summary messages were published as one batch
+        mock_mqtt_publisher.mqtt_interface.publish_many.assert_awaited_once()
+        (messages,) = mock_mqtt_publisher.mqtt_interface.publish_many.call_args.args
+        assert len(messages) == 2
 
-        payload = args[1]
+        topic, payload, retain = messages[0]
+        assert topic == "vehicle/vehicle_123/device_associated"
+        assert retain is False
         assert payload["device_id"] == "AA:BB:CC:DD:EE:FF"
         assert payload["vehicle_id"] == "vehicle_123"
         assert payload["new_vehicle"] is True
 
+        assert messages[1] is mock_mqtt_publisher.vehicle_summary_message.return_value
+        summary_args = mock_mqtt_publisher.vehicle_summary_message.call_args.args
+        assert summary_args[0] == "vehicle_123"
+        assert summary_args[1]["name"] == "Test Vehicle"
+
     @pytest.mark.asyncio
     async def test_on_system_shutdown(
         self,
@@ -329,6 +422,90 @@ class TestMQTTEventHandler:
         assert payload["status"] == "shutting_down"
         assert payload["reason"] == "user_requested"
 
+    @pytest.mark.asyncio
+    async def test_vehicle_summary_debounced_across_burst(
+        self,
+        event_handler: MQTTEventHandler,
+        mock_core_engine: BatteryHawkCore,
+    ) -> None:
+        """Test bursts of readings for one vehicle collapse into one summary update."""
+        new_state = DeviceState("AA:BB:CC:DD:EE:FF", "BM2")
+        new_state.update_reading(
+            BatteryInfo(
+                voltage=12.6, current=1.0, temperature=25.0, state_of_charge=80.0
+            ),
+        )
+        new_state.vehicle_id = "vehicle_123"
+        mock_core_engine.device_registry.get_device.return_value = {
+            "vehicle_id": "vehicle_123",
+        }
+
+        with patch.object(
+            event_handler,
+            "_update_vehicle_summary",
+            new_callable=AsyncMock,
+        ) as update_summary:
+            for _ in range(5):
+                await event_handler.on_device_reading(
+                    new_state.mac_address, new_state, None
+                )
+            update_summary.assert_not_called()
+            assert list(event_handler._pending_summary) == ["vehicle_123"]
+
+            # Fire the debounce timer now rather than waiting for it
+            event_handler._pending_summary["vehicle_123"].cancel()
+            event_handler._on_summary_due("vehicle_123")
+            await asyncio.sleep(0)
+
+            update_summary.assert_awaited_once_with("vehicle_123")
+            assert event_handler._pending_summary == {}
+
+    @pytest.mark.asyncio
+    async def test_on_system_shutdown_flushes_pending_summaries(
+        self,
+        event_handler: MQTTEventHandler,
+    ) -> None:
+        """Test shutdown publishes debounced summaries without waiting for timers."""
+        with patch.object(
+            event_handler,
+            "_update_vehicle_summary",
+            new_callable=AsyncMock,
+        ) as update_summary:
+            event_handler._schedule_vehicle_summary("vehicle_1")
+            event_handler._schedule_vehicle_summary("vehicle_2")
+
+            await event_handler.on_system_shutdown({})
+
+            assert [c.args[0] for c in update_summary.await_args_list] == [
+                "vehicle_1",
+                "vehicle_2",
+            ]
+            assert event_handler._pending_summary == {}
+
+    @pytest.mark.asyncio
+    async def test_flush_pending_summaries_logs_failures(
+        self,
+        event_handler: MQTTEventHandler,
+    ) -> None:
+        """Test a failed summary flush is logged with its vehicle ID."""
+
+        async def update(vehicle_id: str) -> None:
+            if vehicle_id == "vehicle_2":
+                msg = "bad summary"
+                raise KeyError(msg)
+
+        with (
+            patch.object(event_handler, "_update_vehicle_summary", side_effect=update),
+            patch.object(event_handler.logger, "error") as log_error,
+        ):
+            event_handler._schedule_vehicle_summary("vehicle_1")
+            event_handler._schedule_vehicle_summary("vehicle_2")
+            await event_handler.flush_pending_summaries()
+
+        log_error.assert_called_once()
+        assert log_error.call_args.args[1] == "vehicle_2"
+        assert isinstance(log_error.call_args.kwargs["exc_info"], KeyError)
+
     @pytest.mark.asyncio
     async def test_on_system_status_change(
         self,
@@ -344,7 +521,10 @@ class TestMQTTEventHandler:
         await event_handler.on_system_status_change(status_data)
 
         # Verify system status was published
-        mock_mqtt_publisher.publish_system_status.assert_called_once_with(status_data)
+        mock_mqtt_publisher.publish_system_status.assert_called_once_with(
+            status_data,
+            qos=TELEMETRY_QOS,
+        )
 
     @pytest.mark.asyncio
     async def test_update_vehicle_summary(
@@ -375,7 +555,9 @@ class TestMQTTEventHandler:
         )
         device_state.update_reading(reading)
 
-        mock_core_engine.state_manager.get_all_devices.return_value = [device_state]
+        mock_core_engine.state_manager.get_devices_by_vehicle.return_value = [
+            device_state,
+        ]
 
         await event_handler._update_vehicle_summary(vehicle_id)
 
@@ -391,6 +573,22 @@ class TestMQTTEventHandler:
         assert summary_data["average_voltage"] == 12.6
         assert summary_data["overall_health"] == "excellent"
 
+    @pytest.mark.asyncio
+    async def test_update_vehicle_summary_skipped_when_disconnected(
+        self,
+        event_handler: MQTTEventHandler,
+        mock_mqtt_publisher: MQTTPublisher,
+        mock_core_engine: BatteryHawkCore,
+    ) -> None:
+        """Test no summary is built or published while the broker is unreachable."""
+        mock_mqtt_publisher.mqtt_interface.connected = False
+
+        await event_handler._update_vehicle_summary("vehicle_123")
+
+        mock_core_engine.vehicle_registry.get_vehicle.assert_not_called()
+        mock_mqtt_publisher.publish_vehicle_summary.assert_not_called()
+        assert "vehicle_123" not in event_handler._vehicle_summary_counts
+
     @pytest.mark.asyncio
     async def test_vehicle_summary_caching(
         self,
@@ -422,7 +620,9 @@ class TestMQTTEventHandler:
         )
         device_state.update_reading(reading)
 
-        mock_core_engine.state_manager.get_all_devices.return_value = [device_state]
+        mock_core_engine.state_manager.get_devices_by_vehicle.return_value = [
+            device_state,
+        ]
 
         # Call twice with same data
         await event_handler._update_vehicle_summary(vehicle_id)
@@ -430,3 +630,66 @@ class TestMQTTEventHandler:
 
         # Should only publish once due to caching
         assert mock_mqtt_publisher.publish_vehicle_summary.call_count == 1
+
+    def test_summary_signature_ignores_time_fields(self) -> None:
+        """Test summary fingerprints only change with non-time data."""
+        summary = {
+            "name": "Vehicle",
+            "total_devices": 1,
+            "devices": [{"id": "dev1", "voltage": 12.6, "last_reading_time": "t1"}],
+            "last_updated": "t1",
+        }
+        same = {
+            **summary,
+            "devices": [{"id": "dev1", "voltage": 12.6, "last_reading_time": "t2"}],
+            "last_updated": "t2",
+        }
+        changed = {
+            **summary,
+            "devices": [{"id": "dev1", "voltage": 12.5, "last_reading_time": "t1"}],
+        }
+
+        signature = MQTTEventHandler._summary_signature(summary)
+        assert MQTTEventHandler._summary_signature(same) == signature
+        assert MQTTEventHandler._summary_signature(changed) != signature
+
+    def test_should_update_vehicle_cache_skips_hashing_on_count_change(
+        self,
+        event_handler: MQTTEventHandler,
+    ) -> None:
+        """Test a changed device count is detected without fingerprinting."""
+        summary = {
+            "connected_devices": 1,
+            "devices": [{"id": "dev1"}],
+        }
+        new_summary = {
+            "connected_devices": 1,
+            "devices": [{"id": "dev1"}, {"id": "dev2"}],
+        }
+
+        with patch.object(
+            MQTTEventHandler,
+            "_summary_signature",
+            wraps=MQTTEventHandler._summary_signature,
+        ) as signature:
+            assert event_handler._should_update_vehicle_cache("vehicle_123", summary)
+            assert event_handler._should_update_vehicle_cache(
+                "vehicle_123",
+                new_summary,
+            )
+            signature.assert_not_called()
+
+            # Same counts fall through to the fingerprint comparison, hashing
+            # the held summary once and then releasing it
+            assert not event_handler._should_update_vehicle_cache(
+                "vehicle_123",
+                dict(new_summary),
+            )
+            assert signature.call_count == 2
+            assert event_handler._vehicle_summary_unhashed == {}
+
+            assert not event_handler._should_update_vehicle_cache(
+                "vehicle_123",
+                dict(new_summary),
+            )
+            assert signature.call_count == 3
@@ -2,11 +2,12 @@
 
 from datetime import datetime
 from typing import Any
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from battery_hawk.mqtt import MQTTConnectionError, MQTTInterface, MQTTPublisher
+from battery_hawk.mqtt.client import _now_iso
 from battery_hawk_driver.base.protocol import BatteryInfo, DeviceStatus
 
 
@@ -138,6 +139,34 @@ class TestMQTTPublisher:
         assert "capacity" not in payload  # Should not include None values
         assert "cycles" not in payload
 
+    @pytest.mark.asyncio
+    async def test_reading_template_tracks_vehicle_changes(
+        self,
+        publisher: MQTTPublisher,
+        mock_mqtt_interface: MQTTInterface,
+        sample_battery_info: BatteryInfo,
+    ) -> None:
+        """Test cached reading templates are rebuilt and never mutated."""
+        device_id = "AA:BB:CC:DD:EE:FF"
+
+        await publisher.publish_device_reading(
+            device_id,
+            sample_battery_info,
+            vehicle_id="vehicle_1",
+        )
+        await publisher.publish_device_reading(
+            device_id,
+            sample_battery_info,
+            vehicle_id="vehicle_2",
+        )
+        await publisher.publish_device_reading(device_id, sample_battery_info)
+
+        payloads = [c.args[1] for c in mock_mqtt_interface.publish.call_args_list]
+        assert payloads[0]["vehicle_id"] == "vehicle_1"
+        assert payloads[1]["vehicle_id"] == "vehicle_2"
+        assert "vehicle_id" not in payloads[2]
+        assert publisher._reading_template[device_id][2] == {"device_id": device_id}
+
     @pytest.mark.asyncio
     async def test_publish_device_status_connected(
         self,
@@ -228,6 +257,27 @@ class TestMQTTPublisher:
         assert nested["extra"] == sample_battery_info.extra
         assert nested["timestamp"] == sample_battery_info.timestamp
 
+    @pytest.mark.asyncio
+    async def test_publish_device_status_accepts_reading_dict(
+        self,
+        publisher: MQTTPublisher,
+        mock_mqtt_interface: MQTTInterface,
+        sample_device_status: DeviceStatus,
+    ) -> None:
+        """Status payload should accept a partial reading given as a dict."""
+        await publisher.publish_device_status(
+            "AA:BB:CC:DD:EE:FF",
+            sample_device_status,
+            reading={"voltage": 12.0, "current": 2.0, "timestamp": 1.0},
+        )
+
+        payload = mock_mqtt_interface.publish.call_args.args[1]
+        assert payload["power"] == 24.0
+        assert payload["temperature"] is None
+        assert "capacity" not in payload
+        assert "reading_extra" not in payload
+        assert payload["latest_reading"]["timestamp"] == 1.0
+
     @pytest.mark.asyncio
     async def test_publish_device_status_disconnected_with_error(
         self,
@@ -251,6 +301,35 @@ class TestMQTTPublisher:
         assert payload["error_code"] == 1001
         assert payload["error_message"] == "Connection timeout"
 
+    @pytest.mark.asyncio
+    async def test_publish_batch_of_device_statuses(
+        self,
+        publisher: MQTTPublisher,
+        mock_mqtt_interface: MQTTInterface,
+        sample_device_status: DeviceStatus,
+    ) -> None:
+        """Test prebuilt status messages are handed over as a single batch."""
+        mock_mqtt_interface.publish_many = AsyncMock()
+        messages = [
+            publisher.device_status_message(
+                mac, sample_device_status, device_type="BM6"
+            )
+            for mac in ("AA:BB:CC:DD:EE:01", "AA:BB:CC:DD:EE:02")
+        ]
+
+        await publisher.publish_batch(messages)
+
+        mock_mqtt_interface.publish_many.assert_awaited_once_with(messages, qos=None)
+        mock_mqtt_interface.publish.assert_not_called()
+        topic, payload, retain = messages[1]
+        assert topic == "device/AA:BB:CC:DD:EE:02/status"
+        assert payload["device_type"] == "BM6"
+        assert retain is True
+
+        # Nothing is sent for an empty batch
+        await publisher.publish_batch([])
+        mock_mqtt_interface.publish_many.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_publish_vehicle_summary(
         self,
@@ -392,3 +471,11 @@ class TestMQTTPublisher:
         assert isinstance(payload["timestamp"], str)
         # Should be able to parse as datetime
         datetime.fromisoformat(payload["timestamp"].replace("Z", "+00:00"))
+
+    def test_now_iso_is_cached_per_second(self) -> None:
+        """Test the publish timestamp is reused within the same second."""
+        with patch("battery_hawk.mqtt.client.time.time", return_value=1700000000.2):
+            first = _now_iso()
+        with patch("battery_hawk.mqtt.client.time.time", return_value=1700000000.9):
+            assert _now_iso() is first
+        assert first == "2023-11-14T22:13:20+00:00"
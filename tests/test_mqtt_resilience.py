@@ -1,6 +1,7 @@
 """Tests for MQTT resilience and reconnection functionality."""
 
 import asyncio
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -209,6 +210,35 @@ class TestMQTTResilience:
         # Both messages should have been published
         assert mock_client.publish.call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_batch_requeues_failed_messages_in_order(
+        self,
+        mqtt_interface: MQTTInterface,
+    ) -> None:
+        """Test failed messages in a batch are scheduled for retry in order."""
+        msgs = [
+            QueuedMessage(f"test/topic{i}", {"msg": i}, False, 0.0) for i in range(4)
+        ]
+        mqtt_interface._message_queue.extend(msgs)
+
+        async def flaky_publish(topic: str, *_args: Any, **_kwargs: Any) -> None:
+            if topic.endswith(("topic1", "topic3")):
+                raise ConnectionError("Connection lost")
+
+        mqtt_interface._connection_state = ConnectionState.CONNECTED
+        mock_client = MagicMock()
+        mock_client.publish = AsyncMock(side_effect=flaky_publish)
+        mqtt_interface._client = mock_client
+
+        with patch.object(mqtt_interface, "_initiate_reconnection", AsyncMock()):
+            await mqtt_interface._process_message_queue()
+
+        assert not mqtt_interface._message_queue
+        retries = [entry[2] for entry in sorted(mqtt_interface._retry_heap)]
+        assert [m.topic for m in retries] == ["test/topic1", "test/topic3"]
+        assert all(m.retry_count == 1 for m in retries)
+        assert mqtt_interface.stats["messages_published"] == 2
+
     @pytest.mark.asyncio
     async def test_message_retry_logic(self, mqtt_interface: MQTTInterface) -> None:
         """Test message retry logic on connection errors."""
@@ -225,10 +255,149 @@ class TestMQTTResilience:
         # Process queue
         await mqtt_interface._process_message_queue()
 
-        # Message should be requeued with incremented retry count
-        assert len(mqtt_interface._message_queue) == 1
-        requeued_msg = mqtt_interface._message_queue[0]
+        # Message should be scheduled for retry with incremented retry count
+        assert len(mqtt_interface._message_queue) == 0
+        assert len(mqtt_interface._retry_heap) == 1
+        send_at, _, requeued_msg = mqtt_interface._retry_heap[0]
+        assert requeued_msg is msg
         assert requeued_msg.retry_count == 1
+        assert send_at > 0
+        assert mqtt_interface.stats["queue_size"] == 1
+
+    @pytest.mark.asyncio
+    async def test_due_retries_are_published_first(
+        self,
+        mqtt_interface: MQTTInterface,
+    ) -> None:
+        """Test retries whose backoff elapsed go out before newer queued messages."""
+        retry_msg = QueuedMessage("test/retry", {"msg": 0}, False, 0.0, retry_count=1)
+        pending_msg = QueuedMessage("test/later", {"msg": 1}, False, 0.0, retry_count=1)
+        new_msg = QueuedMessage("test/new", {"msg": 2}, False, 0.0)
+        mqtt_interface._retry_heap = [
+            (0.0, 0, retry_msg),
+            (float("inf"), 1, pending_msg),
+        ]
+        mqtt_interface._message_queue.append(new_msg)
+
+        mqtt_interface._connection_state = ConnectionState.CONNECTED
+        mock_client = MagicMock()
+        mock_client.publish = AsyncMock()
+        mqtt_interface._client = mock_client
+
+        await mqtt_interface._process_message_queue()
+
+        published = [call.args[0] for call in mock_client.publish.call_args_list]
+        assert published == ["test_batteryhawk/test/retry", "test_batteryhawk/test/new"]
+        assert mqtt_interface._retry_heap == [(float("inf"), 1, pending_msg)]
+
+    @pytest.mark.asyncio
+    async def test_flush_delay_coalesces_late_burst(
+        self,
+        mqtt_interface: MQTTInterface,
+    ) -> None:
+        """Test messages queued during the flush linger join a follow-up batch."""
+        mqtt_interface._reconnection_config.flush_delay_ms = 10
+        mqtt_interface._message_queue.append(
+            QueuedMessage("test/first", {"msg": 0}, False, 0.0),
+        )
+
+        mqtt_interface._connection_state = ConnectionState.CONNECTED
+        mock_client = MagicMock()
+        mock_client.publish = AsyncMock()
+        mqtt_interface._client = mock_client
+
+        async def late_arrival() -> None:
+            await asyncio.sleep(0)
+            await mqtt_interface._queue_message(
+                QueuedMessage("test/late", {"msg": 1}, False, 0.0),
+            )
+
+        await asyncio.gather(mqtt_interface._process_message_queue(), late_arrival())
+
+        published = [call.args[0] for call in mock_client.publish.call_args_list]
+        assert published == [
+            "test_batteryhawk/test/first",
+            "test_batteryhawk/test/late",
+        ]
+        assert not mqtt_interface._message_queue
+
+    @pytest.mark.asyncio
+    async def test_retry_timer_wakes_message_processor(
+        self,
+        mqtt_interface: MQTTInterface,
+    ) -> None:
+        """Test a due retry is published without waiting for the poll interval."""
+        mqtt_interface._connection_state = ConnectionState.CONNECTED
+        mock_client = MagicMock()
+        mock_client.publish = AsyncMock()
+        mqtt_interface._client = mock_client
+
+        msg = QueuedMessage("test/retry", {"msg": 0}, False, 0.0, retry_count=1)
+        with patch.object(mqtt_interface, "_calculate_retry_delay", return_value=0.01):
+            mqtt_interface._schedule_retry(msg)
+        assert mqtt_interface._retry_timer is not None
+
+        processor = asyncio.create_task(mqtt_interface._message_processor_loop())
+        try:
+            await asyncio.sleep(0.2)
+        finally:
+            processor.cancel()
+            await asyncio.gather(processor, return_exceptions=True)
+
+        mock_client.publish.assert_awaited_once()
+        assert not mqtt_interface._retry_heap
+        assert mqtt_interface._retry_timer is None
+
+    @pytest.mark.asyncio
+    async def test_publish_many_queues_connection_failures(
+        self,
+        mqtt_interface: MQTTInterface,
+    ) -> None:
+        """Test batched publishes send together and queue connection failures."""
+        mqtt_interface._connection_state = ConnectionState.CONNECTED
+        mock_client = MagicMock()
+        mock_client.publish = AsyncMock(side_effect=[None, ConnectionError("lost")])
+        mqtt_interface._client = mock_client
+
+        with patch.object(mqtt_interface, "_initiate_reconnection", new=AsyncMock()):
+            await mqtt_interface.publish_many(
+                [("test/a", {"msg": 0}, False), ("test/b", {"msg": 1}, True)],
+            )
+
+        assert mock_client.publish.await_count == 2
+        assert mqtt_interface.stats["messages_published"] == 1
+        assert [msg.topic for msg in mqtt_interface._message_queue] == ["test/b"]
+        assert mqtt_interface._message_queue[0].retain is True
+
+    @pytest.mark.asyncio
+    async def test_retry_reuses_encoded_payload(
+        self,
+        mqtt_interface: MQTTInterface,
+    ) -> None:
+        """Test payload is serialized once and reused across retries."""
+        msg = QueuedMessage("test/topic", {"msg": 1}, False, 0.0)
+        mqtt_interface._message_queue.append(msg)
+
+        mqtt_interface._connection_state = ConnectionState.CONNECTED
+        mock_client = MagicMock()
+        mock_client.publish = AsyncMock(side_effect=ConnectionError("Connection lost"))
+        mqtt_interface._client = mock_client
+
+        with (
+            patch.object(
+                MQTTInterface,
+                "_encode_payload",
+                wraps=MQTTInterface._encode_payload,
+            ) as mock_encode,
+            patch.object(mqtt_interface, "_calculate_retry_delay", return_value=0.0),
+        ):
+            await mqtt_interface._process_message_queue()
+            mock_client.publish.side_effect = None
+            await mqtt_interface._process_message_queue()
+
+        mock_encode.assert_called_once()
+        assert msg.encoded == b'{"msg": 1}'
+        assert mock_client.publish.call_args[0][1] == msg.encoded
 
     @pytest.mark.asyncio
     async def test_message_retry_limit(self, mqtt_interface: MQTTInterface) -> None:
@@ -320,6 +489,35 @@ class TestMQTTResilience:
         # State should be disconnected
         assert mqtt_interface.connection_state == ConnectionState.DISCONNECTED
 
+    @pytest.mark.asyncio
+    async def test_concurrent_reconnection_single_flight(
+        self,
+        mqtt_interface: MQTTInterface,
+    ) -> None:
+        """Test concurrent reconnection requests start only one reconnect loop."""
+        started = asyncio.Event()
+        release = asyncio.Event()
+        loop_calls = 0
+
+        async def fake_reconnect_loop() -> None:
+            nonlocal loop_calls
+            loop_calls += 1
+            started.set()
+            await release.wait()
+
+        with patch.object(mqtt_interface, "_reconnect_loop", fake_reconnect_loop):
+            await asyncio.gather(
+                *(mqtt_interface._initiate_reconnection() for _ in range(5)),
+            )
+            await started.wait()
+
+            assert loop_calls == 1
+            assert mqtt_interface.stats["total_reconnections"] == 1
+            assert mqtt_interface.connection_state == ConnectionState.RECONNECTING
+
+            release.set()
+            await mqtt_interface._reconnect_task
+
     def test_config_change_detection(self, mqtt_interface: MQTTInterface) -> None:
         """Test configuration change detection logic."""
         # Store original config
@@ -5,6 +5,7 @@ import pytest
 from battery_hawk.mqtt.topics import (
     MQTTTopics,
     TopicInfo,
+    TopicMatcher,
     device_reading_topic,
     device_status_topic,
     discovery_found_topic,
@@ -154,6 +155,26 @@ class TestMQTTTopics:
         # Incomplete topic
         assert topics.parse_topic("battery_hawk/device") is None
 
+    def test_parse_topic_prefix_is_literal(self) -> None:
+        """Test prefixes with regex metacharacters match only literally."""
+        dotted = MQTTTopics(prefix="bh.home")
+
+        parsed = dotted.parse_topic("bh.home/device/AA:BB:CC:DD:EE:FF/reading/raw")
+        assert parsed is not None
+        assert parsed["mac_address"] == "AA:BB:CC:DD:EE:FF"
+        assert parsed["topic_type"] == "reading"
+
+        assert dotted.parse_topic("bhxhome/system/status") is None
+
+    def test_parse_unknown_topic_type_defaults(self, topics: MQTTTopics) -> None:
+        """Test topic types without a pattern get default QoS and retain."""
+        parsed = topics.parse_topic("battery_hawk/device/AA:BB:CC:DD:EE:FF/config")
+
+        assert parsed is not None
+        assert parsed["topic_type"] == "config"
+        assert parsed["qos"] == 1
+        assert parsed["retain"] is False
+
     def test_mac_address_validation(self, topics: MQTTTopics) -> None:
         """Test MAC address validation."""
         # Valid formats
@@ -299,3 +320,69 @@ class TestMQTTTopics:
         )
         assert system_status_topic() == "battery_hawk/system/status"
         assert discovery_found_topic() == "battery_hawk/discovery/found"
+
+
+class TestTopicMatcher:
+    """Test MQTT topic filter matching."""
+
+    def test_exact_match(self) -> None:
+        """Test exact topic filters only match the same topic."""
+        matcher = TopicMatcher()
+        handler = object()
+        matcher.add("hawk/system/status", handler)
+
+        assert matcher.match("hawk/system/status") == [handler]
+        assert matcher.match("hawk/system/other") == []
+        assert "hawk/system/status" in matcher
+
+    def test_single_level_wildcard(self) -> None:
+        """Test '+' matches exactly one topic level."""
+        matcher = TopicMatcher()
+        handler = object()
+        matcher.add("hawk/device/+/reading", handler)
+
+        assert matcher.match("hawk/device/AA:BB/reading") == [handler]
+        assert matcher.match("hawk/device/AA:BB/status") == []
+        assert matcher.match("hawk/device/reading") == []
+
+    def test_multi_level_wildcard(self) -> None:
+        """Test '#' matches the parent level and everything below it."""
+        matcher = TopicMatcher()
+        handler = object()
+        matcher.add("hawk/#", handler)
+
+        assert matcher.match("hawk") == [handler]
+        assert matcher.match("hawk/device/AA:BB/reading") == [handler]
+        assert matcher.match("other/device") == []
+
+    def test_overlapping_filters_deduplicated(self) -> None:
+        """Test a handler registered under overlapping filters is returned once."""
+        matcher = TopicMatcher()
+        shared = object()
+        specific = object()
+        matcher.add("hawk/#", shared)
+        matcher.add("hawk/device/+/status", shared)
+        matcher.add("hawk/device/AA/status", specific)
+
+        assert matcher.match("hawk/device/AA/status") == [shared, specific]
+
+    def test_dollar_topics_skip_leading_wildcards(self) -> None:
+        """Test wildcards at the first level do not match '$' topics."""
+        matcher = TopicMatcher()
+        handler = object()
+        matcher.add("#", handler)
+        matcher.add("+/broker/uptime", handler)
+
+        assert matcher.match("$SYS/broker/uptime") == []
+
+    def test_remove(self) -> None:
+        """Test removing filters prunes them from matching."""
+        matcher = TopicMatcher()
+        handler = object()
+        matcher.add("hawk/device/+/reading", handler)
+
+        assert matcher.remove("hawk/device/+/reading") is handler
+        assert matcher.remove("hawk/device/+/reading") is None
+        assert matcher.match("hawk/device/AA/reading") == []
+        assert len(matcher) == 0
+        assert matcher._root.children == {}
@@ -46,6 +46,24 @@ def test_device_status_fields() -> None:
     assert isinstance(status, DeviceStatus)
 
 
+def test_from_mapping_matches_keyword_construction() -> None:
+    """Test from_mapping builds the same objects as keyword construction."""
+    reading = {
+        "voltage": 12.5,
+        "current": 1.1,
+        "temperature": 25.0,
+        "state_of_charge": 80.0,
+        "cycles": 12,
+    }
+    assert BatteryInfo.from_mapping(reading) == BatteryInfo(**reading)
+
+    status = {"connected": False, "error_code": 3, "last_command": "read"}
+    assert DeviceStatus.from_mapping(status) == DeviceStatus(**status)
+
+    with pytest.raises(KeyError):
+        BatteryInfo.from_mapping({"voltage": 12.5})
+
+
 # Test that BaseMonitorDevice cannot be instantiated directly
 # Use a helper function to avoid Pyright error for direct instantiation
 